@@ -0,0 +1,26 @@
+from pathfinding.grid import Grid, WALL, EMPTY, MAX_COST
+from pathfinding.progress import Progress, SearchCancelled
+from pathfinding.events import EventLog, ExpansionHook
+from pathfinding.profiling import SamplingProfiler, timed
+from pathfinding.search import Heuristic, SearchResult, SearchStats, bfs, bfs_levels, dfs, a_star, ucs
+from pathfinding.iterative import iddfs, ida_star
+from pathfinding.jump_point import JumpTable, jps
+from pathfinding.bidirectional import bidirectional_a_star, bidirectional_bfs
+from pathfinding.distance_cache import DistanceCache, DistanceField
+from pathfinding.flow_field import FlowField
+from pathfinding.history import EditHistory
+from pathfinding.incremental import DStarLite
+from pathfinding.landmarks import Landmarks, alt_star
+from pathfinding.solvers import SOLVERS, solve
+
+
+def __getattr__(name):
+    # batch pulls in multiprocessing and generation needs numpy; only import
+    # them when they are asked for
+    if name in ('batch_solve', 'batch_solve_file'):
+        from pathfinding import batch
+        return getattr(batch, name)
+    if name == 'generate':
+        from pathfinding.generation import generate
+        return generate
+    raise AttributeError(f"module 'pathfinding' has no attribute {name!r}")
@@ -0,0 +1,5 @@
+import sys
+
+from pathfinding.cli import main
+
+sys.exit(main())
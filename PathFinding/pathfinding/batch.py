@@ -0,0 +1,72 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+from pathfinding.grid import Grid
+from pathfinding.maps import open_binary
+from pathfinding.search import SearchResult, SearchStats
+from pathfinding.solvers import solve
+
+# set in every worker by attach_board
+worker_memory = None
+worker_grid = None
+
+
+def attach_board(name, width, height):
+    global worker_memory, worker_grid
+    worker_memory = shared_memory.SharedMemory(name=name)
+    worker_grid = Grid(width, height, worker_memory.buf)
+
+
+def solve_chunk(algorithm, chunk):
+    results = []
+    for number, source, target in chunk:
+        result = solve(worker_grid, algorithm, source, target)
+        results.append((number, result.path, result.stats.opened_nodes))
+    return results
+
+
+def attach_map(path):
+    global worker_grid
+    worker_grid = open_binary(path)[0]
+
+
+def solve_in_workers(initializer, initargs, queries, algorithm, processes, chunk_size, components):
+    pending = []
+    for number, (source, target) in enumerate(queries):
+        if components is not None and not components.connected(source, target):
+            yield number, SearchResult(None, SearchStats(0))
+        else:
+            pending.append((number, source, target))
+    chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+    if not chunks:
+        return
+    with ProcessPoolExecutor(processes or os.cpu_count() or 1, initializer=initializer,
+                             initargs=initargs) as pool:
+        futures = [pool.submit(solve_chunk, algorithm, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            for number, path, opened in future.result():
+                yield number, SearchResult(path, SearchStats(opened))
+
+
+def batch_solve(grid, queries, algorithm='astar', processes=None, chunk_size=64, components=None):
+    # Answers many (source, target) queries on one board. The cells are put
+    # in shared memory once and every worker maps them instead of receiving
+    # a pickled copy. Yields (query number, SearchResult) as chunks finish,
+    # so results arrive out of order. With a ComponentIndex of the board,
+    # pairs in different components are answered at once and never sent.
+    queries = list(queries)
+    memory = shared_memory.SharedMemory(create=True, size=grid.size)
+    try:
+        memory.buf[:grid.size] = grid.cells
+        yield from solve_in_workers(attach_board, (memory.name, grid.width, grid.height),
+                                    queries, algorithm, processes, chunk_size, components)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def batch_solve_file(path, queries, algorithm='astar', processes=None, chunk_size=64, components=None):
+    # Same as batch_solve for a board saved with maps.save_binary: every
+    # worker maps the file itself, so nothing is copied at all.
+    yield from solve_in_workers(attach_map, (path,), list(queries), algorithm, processes, chunk_size, components)
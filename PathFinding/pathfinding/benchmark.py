@@ -0,0 +1,200 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from pathfinding.generation import generate
+from pathfinding.maps import load_map, load_scenarios
+from pathfinding.solvers import solve
+
+ALGORITHMS = ('bfs', 'dfs', 'astar', 'ucs', 'id')
+SIZES = ((30, 20), (100, 100), (300, 300))
+DENSITIES = (0.1, 0.2, 0.3, 0.4, 0.5)
+# iterative deepening re-expands too much for the bigger boards
+MAX_CELLS = {'id': 50 * 50}
+# timing differences below this many seconds are treated as noise
+MIN_TIME_DELTA = 0.001
+
+
+def random_board(width, height, density, seed):
+    # endpoints may be cut off from each other: failed searches are timed too
+    return generate('random', width, height, density, seed, connected=False)
+
+
+def run_case(algorithm, width, height, density, boards, seed, measure_memory=True):
+    seconds = 0.0
+    expansions = 0
+    found = 0
+    frontier_peak = 0
+    memory_peak = 0
+    for number in range(boards):
+        grid, source, target = random_board(width, height, density, seed + number)
+        start = time.perf_counter()
+        result = solve(grid, algorithm, source, target)
+        seconds += time.perf_counter() - start
+        expansions += result.stats.opened_nodes
+        found += result.found
+        frontier_peak = max(frontier_peak, result.stats.frontier_peak)
+        if measure_memory:
+            # a second, untimed run: tracemalloc slows allocation down a lot
+            tracemalloc.start()
+            solve(grid, algorithm, source, target)
+            memory_peak = max(memory_peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+    return {
+        'algorithm': algorithm,
+        'width': width,
+        'height': height,
+        'density': density,
+        'boards': boards,
+        'seed': seed,
+        'found': found,
+        'seconds': seconds,
+        'expansions': expansions,
+        'expansions_per_second': expansions / seconds if seconds else 0.0,
+        'frontier_peak': frontier_peak,
+        'memory_peak': memory_peak,
+    }
+
+
+def run_scenario(algorithm, path, map_dir=None):
+    # every query of a MovingAI .scen file; maps are looked up next to it
+    # unless map_dir is given, and each one is loaded once
+    scenarios = load_scenarios(path)
+    grids = {}
+    seconds = 0.0
+    expansions = 0
+    found = 0
+    frontier_peak = 0
+    for scenario in scenarios:
+        grid = grids.get(scenario.map_name)
+        if grid is None:
+            map_path = os.path.join(map_dir or os.path.dirname(path), os.path.basename(scenario.map_name))
+            grid = grids[scenario.map_name] = load_map(map_path)[0]
+        start = time.perf_counter()
+        result = solve(grid, algorithm, scenario.source, scenario.target)
+        seconds += time.perf_counter() - start
+        expansions += result.stats.opened_nodes
+        found += result.found
+        frontier_peak = max(frontier_peak, result.stats.frontier_peak)
+    return {
+        'algorithm': algorithm,
+        'map': os.path.basename(path),
+        'width': grid.width if scenarios else 0,
+        'height': grid.height if scenarios else 0,
+        'density': None,
+        'boards': len(scenarios),
+        'seed': None,
+        'found': found,
+        'seconds': seconds,
+        'expansions': expansions,
+        'expansions_per_second': expansions / seconds if seconds else 0.0,
+        'frontier_peak': frontier_peak,
+        'memory_peak': 0,
+    }
+
+
+def sweep(algorithms=ALGORITHMS, sizes=SIZES, densities=DENSITIES, boards=5, seed=0,
+          measure_memory=True, log=None):
+    results = []
+    for algorithm in algorithms:
+        for width, height in sizes:
+            if width * height > MAX_CELLS.get(algorithm, width * height):
+                continue
+            for density in densities:
+                case = run_case(algorithm, width, height, density, boards, seed, measure_memory)
+                results.append(case)
+                if log:
+                    log(format_case(case))
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def case_key(case):
+    return (case['algorithm'], case.get('map'), case['width'], case['height'], case['density'],
+            case['boards'], case['seed'])
+
+
+def case_label(case):
+    if case.get('map'):
+        return case['map']
+    return f"d={case['density']:.1f}"
+
+
+def format_case(case):
+    return (f"{case['algorithm']:>6} {case['width']}x{case['height']:<5} {case_label(case)} "
+            f"{case['seconds'] * 1000:9.2f} ms {case['expansions_per_second']:12.0f} exp/s "
+            f"frontier {case['frontier_peak']:7d} memory {case['memory_peak'] / 1024:9.1f} KiB")
+
+
+def compare(current, baseline, threshold=0.25):
+    # Seeds are fixed, so a change in expansions means the search itself
+    # behaves differently; time is flagged only past the relative threshold.
+    regressions = []
+    old_cases = {case_key(case): case for case in baseline['results']}
+    for case in current['results']:
+        old = old_cases.get(case_key(case))
+        if old is None:
+            continue
+        name = f"{case['algorithm']} {case['width']}x{case['height']} {case_label(case)}"
+        if case['expansions'] != old['expansions']:
+            regressions.append(f"{name}: expansions {old['expansions']} -> {case['expansions']}")
+        if (case['seconds'] > old['seconds'] * (1 + threshold)
+                and case['seconds'] - old['seconds'] > MIN_TIME_DELTA):
+            regressions.append(f"{name}: time {old['seconds'] * 1000:.2f} ms -> {case['seconds'] * 1000:.2f} ms")
+    return regressions
+
+
+def parse_size(text):
+    width, height = text.lower().split('x')
+    return int(width), int(height)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless search benchmark sweep")
+    parser.add_argument('--algorithms', nargs='+', default=list(ALGORITHMS))
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=list(SIZES), help="e.g. 30x20 100x100")
+    parser.add_argument('--densities', nargs='+', type=float, default=list(DENSITIES))
+    parser.add_argument('--boards', type=int, default=5, help="seeded boards per case")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--compare', help="baseline JSON to check for regressions")
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed relative slowdown")
+    parser.add_argument('--scenarios', nargs='+', help="MovingAI .scen files to run instead of random boards")
+    parser.add_argument('--map-dir', help="where the scenarios' .map files are (default: next to them)")
+    args = parser.parse_args(argv)
+
+    if args.scenarios:
+        results = []
+        for algorithm in args.algorithms:
+            for path in args.scenarios:
+                results.append(run_scenario(algorithm, path, args.map_dir))
+                print(format_case(results[-1]))
+        report = {'python': platform.python_version(), 'platform': platform.platform(), 'results': results}
+    else:
+        report = sweep(args.algorithms, args.sizes, args.densities, args.boards, args.seed,
+                       not args.no_memory, log=print)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(report, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print("no regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from math import inf
+from time import perf_counter_ns
+
+from pathfinding.events import ENQUEUE, EXPAND, PATH, event_log
+from pathfinding.progress import PROGRESS_INTERVAL
+from pathfinding.search import Heuristic, SearchResult, SearchStats, heuristic_function, parent_array
+
+FORWARD = 1
+BACKWARD = 2
+
+
+def splice_path(grid, forward_parent, backward_parent, source, target, meet):
+    # source ... meet from the forward tree, then meet ... target from the
+    # backward tree, whose parents point toward the target
+    path = [meet]
+    index = meet
+    while index != source:
+        index = forward_parent[index]
+        path.append(index)
+    path.reverse()
+    index = meet
+    while index != target:
+        index = backward_parent[index]
+        path.append(index)
+    return [grid.position(index) for index in path]
+
+
+def make_result(grid, forward_parent, backward_parent, source, target, meet, opened, events, frontier_peak,
+                pushes, stale_pops=0):
+    start = perf_counter_ns()
+    path = None
+    if meet >= 0:
+        path = splice_path(grid, forward_parent, backward_parent, source, target, meet)
+        if events is not None:
+            events.extend(PATH, [grid.index(i, j) for i, j in path])
+    stats = SearchStats(opened, frontier_peak=frontier_peak, pushes=pushes, stale_pops=stale_pops)
+    stats.phases['reconstruct'] = perf_counter_ns() - start
+    return SearchResult(path, stats, events)
+
+
+def bidirectional_bfs(grid, source, target, trace=False, progress=None):
+    # Grows whichever frontier is smaller by one whole level. A level that
+    # touches the other side is finished before stopping, and the shortest
+    # meeting found in it is kept, so the path is a shortest one.
+    cells = grid.cells
+    offsets = grid.offsets
+    source = grid.index(*source)
+    target = grid.index(*target)
+    side = bytearray(grid.size)
+    distance = array('i', [0]) * grid.size
+    parents = {FORWARD: parent_array(grid.size), BACKWARD: parent_array(grid.size)}
+    frontiers = {FORWARD: deque((source,)), BACKWARD: deque((target,))}
+    events = event_log(grid, trace)
+    opened = 0
+    side[source] = FORWARD
+    side[target] = BACKWARD
+    meet = source if source == target else -1
+    best = inf
+    peak = 2
+    while meet < 0 and frontiers[FORWARD] and frontiers[BACKWARD]:
+        current = FORWARD if len(frontiers[FORWARD]) <= len(frontiers[BACKWARD]) else BACKWARD
+        other = BACKWARD if current == FORWARD else FORWARD
+        parent = parents[current]
+        frontier = frontiers[current]
+        next_frontier = deque()
+        for index in frontier:
+            opened += 1
+            if trace:
+                events.add(EXPAND, index)
+            if progress is not None and not opened % PROGRESS_INTERVAL:
+                progress(opened, len(frontier) + len(next_frontier))
+            for offset in offsets:
+                neighbor = index + offset
+                if not cells[neighbor]:
+                    continue
+                if side[neighbor] == other:
+                    length = distance[index] + 1 + distance[neighbor]
+                    if length < best:
+                        best = length
+                        meet = neighbor
+                        parent_on_meet = index
+                elif not side[neighbor]:
+                    side[neighbor] = current
+                    distance[neighbor] = distance[index] + 1
+                    parent[neighbor] = index
+                    next_frontier.append(neighbor)
+                    if trace:
+                        events.add(ENQUEUE, neighbor)
+        frontiers[current] = next_frontier
+        peak = max(peak, len(frontiers[FORWARD]) + len(frontiers[BACKWARD]))
+    if meet >= 0 and source != target:
+        # meet belongs to the other tree; hang it off this side's parent too
+        parents[current][meet] = parent_on_meet
+    pushes = opened + len(frontiers[FORWARD]) + len(frontiers[BACKWARD])
+    return make_result(grid, parents[FORWARD], parents[BACKWARD], source, target, meet, opened, events, peak,
+                       pushes)
+
+
+def bidirectional_a_star(grid, source, target, trace=False, heuristic=Heuristic.Manhattan, progress=None):
+    # Two A* searches, forward toward the target and backward toward the
+    # source, each step advancing the side with the smaller open list. mu is
+    # the best connected path seen so far. Since every unexplored path must
+    # pass through both open lists, the search stops once mu is no larger
+    # than the smallest f on either side. Stepping onto a cell costs its byte,
+    # as in ucs: the forward side pays for the cell it enters, the backward
+    # side for the cell it leaves, so g forward plus g backward at the meeting
+    # cell is the cost of the whole path.
+    cells = grid.cells
+    offsets = grid.offsets
+    source = grid.index(*source)
+    target = grid.index(*target)
+    h = {FORWARD: heuristic_function(grid, target, heuristic),
+         BACKWARD: heuristic_function(grid, source, heuristic)}
+    g_score = {FORWARD: array('d', [inf]) * grid.size, BACKWARD: array('d', [inf]) * grid.size}
+    closed = {FORWARD: bytearray(grid.size), BACKWARD: bytearray(grid.size)}
+    parents = {FORWARD: parent_array(grid.size), BACKWARD: parent_array(grid.size)}
+    heaps = {FORWARD: [(h[FORWARD](source), 0, source)], BACKWARD: [(h[BACKWARD](target), 0, target)]}
+    g_score[FORWARD][source] = 0
+    g_score[BACKWARD][target] = 0
+    events = event_log(grid, trace)
+    opened = 0
+    mu = 0 if source == target else inf
+    meet = source if source == target else -1
+    peak = 2
+    stale = 0
+    while heaps[FORWARD] and heaps[BACKWARD]:
+        for current in (FORWARD, BACKWARD):
+            heap = heaps[current]
+            while heap and closed[current][heap[0][2]]:
+                heappop(heap)
+                stale += 1
+        if not heaps[FORWARD] or not heaps[BACKWARD]:
+            break
+        if mu <= max(heaps[FORWARD][0][0], heaps[BACKWARD][0][0]):
+            break
+        current = FORWARD if len(heaps[FORWARD]) <= len(heaps[BACKWARD]) else BACKWARD
+        other = BACKWARD if current == FORWARD else FORWARD
+        heap = heaps[current]
+        own_g = g_score[current]
+        other_g = g_score[other]
+        parent = parents[current]
+        f, g, index = heappop(heap)
+        closed[current][index] = 1
+        opened += 1
+        if trace:
+            events.add(EXPAND, index)
+        if progress is not None and not opened % PROGRESS_INTERVAL:
+            progress(opened, len(heaps[FORWARD]) + len(heaps[BACKWARD]))
+        g = -g
+        for offset in offsets:
+            neighbor = index + offset
+            if not cells[neighbor]:
+                continue
+            new_g = g + (cells[neighbor] if current == FORWARD else cells[index])
+            if new_g < own_g[neighbor]:
+                own_g[neighbor] = new_g
+                parent[neighbor] = index
+                heappush(heap, (new_g + h[current](neighbor), -new_g, neighbor))
+                if trace:
+                    events.add(ENQUEUE, neighbor)
+                length = new_g + other_g[neighbor]
+                if length < mu:
+                    mu = length
+                    meet = neighbor
+        peak = max(peak, len(heaps[FORWARD]) + len(heaps[BACKWARD]))
+    pushes = opened + stale + len(heaps[FORWARD]) + len(heaps[BACKWARD])
+    return make_result(grid, parents[FORWARD], parents[BACKWARD], source, target, meet, opened, events, peak,
+                       pushes, stale)
@@ -0,0 +1,118 @@
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+GRID_LINE_COLOR = '#d9d9d9'
+# below these cell sizes (in pixels) grid lines and labels are not drawn
+MIN_LINE_CELL = 6
+MIN_LABEL_CELL = 14
+
+
+class BoardView(QtWidgets.QWidget):
+    # The whole board as one 8-bit indexed QImage, one pixel per cell, scaled
+    # onto the widget in paintEvent. set_cell only repaints that cell's
+    # rectangle; Qt merges the pending rectangles into a single paint.
+    cell_pressed = QtCore.pyqtSignal(int, int)
+    stroke_finished = QtCore.pyqtSignal()
+
+    def __init__(self, width, height, palette, parent=None):
+        super(BoardView, self).__init__(parent)
+        self.board_width = width
+        self.board_height = height
+        self.image = QtGui.QImage(height, width, QtGui.QImage.Format_Indexed8)
+        self.image.setColorTable([QtGui.QColor(color).rgb() for color in palette])
+        self.image.fill(0)
+        self.labels = {}
+        self.last_pressed = None
+        self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+
+    def cell_size(self):
+        return self.width() / self.board_height, self.height() / self.board_width
+
+    def cell_rect(self, i, j):
+        cell_width, cell_height = self.cell_size()
+        return QtCore.QRectF(j * cell_width, i * cell_height, cell_width, cell_height).toAlignedRect()
+
+    def set_cell(self, i, j, code):
+        self.image.setPixel(j, i, code)
+        self.update(self.cell_rect(i, j))
+
+    def cell(self, i, j):
+        return self.image.pixelIndex(j, i)
+
+    def set_label(self, i, j, text):
+        if text:
+            self.labels[(i, j)] = text
+        else:
+            self.labels.pop((i, j), None)
+        self.update(self.cell_rect(i, j))
+
+    def clear_labels(self):
+        for i, j in self.labels:
+            self.update(self.cell_rect(i, j))
+        self.labels = {}
+
+    def load(self, rows):
+        # rows: one sequence of color codes per board row
+        bits = self.image.bits()
+        bits.setsize(self.image.byteCount())
+        buffer = memoryview(bits)
+        line = self.image.bytesPerLine()
+        for i, row in enumerate(rows):
+            buffer[i * line:i * line + self.board_height] = bytes(row)
+        self.update()
+
+    def visible_cells(self, rect):
+        cell_width, cell_height = self.cell_size()
+        first_j = max(int(rect.left() / cell_width), 0)
+        first_i = max(int(rect.top() / cell_height), 0)
+        last_j = min(int(rect.right() / cell_width), self.board_height - 1)
+        last_i = min(int(rect.bottom() / cell_height), self.board_width - 1)
+        return first_i, first_j, last_i, last_j
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        cell_width, cell_height = self.cell_size()
+        first_i, first_j, last_i, last_j = self.visible_cells(event.rect())
+        rows, columns = last_i - first_i + 1, last_j - first_j + 1
+        target = QtCore.QRectF(first_j * cell_width, first_i * cell_height,
+                               columns * cell_width, rows * cell_height)
+        painter.drawImage(target, self.image, QtCore.QRectF(first_j, first_i, columns, rows))
+        if min(cell_width, cell_height) >= MIN_LINE_CELL:
+            painter.setPen(QtGui.QColor(GRID_LINE_COLOR))
+            for j in range(first_j, last_j + 2):
+                x = round(j * cell_width)
+                painter.drawLine(x, round(target.top()), x, round(target.bottom()))
+            for i in range(first_i, last_i + 2):
+                y = round(i * cell_height)
+                painter.drawLine(round(target.left()), y, round(target.right()), y)
+        if self.labels and min(cell_width, cell_height) >= MIN_LABEL_CELL:
+            painter.setPen(QtCore.Qt.white)
+            for (i, j), text in self.labels.items():
+                if first_i <= i <= last_i and first_j <= j <= last_j:
+                    painter.drawText(self.cell_rect(i, j), QtCore.Qt.AlignCenter, text)
+        painter.end()
+
+    def position_at(self, point):
+        cell_width, cell_height = self.cell_size()
+        i, j = int(point.y() / cell_height), int(point.x() / cell_width)
+        if 0 <= i < self.board_width and 0 <= j < self.board_height:
+            return i, j
+        return None
+
+    def mousePressEvent(self, event):
+        if event.button() == QtCore.Qt.LeftButton:
+            self.last_pressed = self.position_at(event.pos())
+            if self.last_pressed is not None:
+                self.cell_pressed.emit(*self.last_pressed)
+
+    def mouseMoveEvent(self, event):
+        # dragging paints every cell the pointer crosses
+        if event.buttons() & QtCore.Qt.LeftButton:
+            position = self.position_at(event.pos())
+            if position is not None and position != self.last_pressed:
+                self.last_pressed = position
+                self.cell_pressed.emit(*position)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == QtCore.Qt.LeftButton:
+            self.stroke_finished.emit()
+        self.last_pressed = None
@@ -0,0 +1,297 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# Nothing here imports Qt; the gui command loads it only when it runs.
+
+
+def parse_position(text):
+    i, j = text.split(',')
+    return int(i), int(j)
+
+
+def is_free(grid, i, j):
+    return 0 <= i < grid.width and 0 <= j < grid.height and grid.cells[grid.index(i, j)] != 0
+
+
+def solve_command(args):
+    from pathfinding.maps import format_text, load_map
+    from pathfinding.profiling import SamplingProfiler
+    from pathfinding.solvers import solve
+
+    grid, source, target = load_map(args.map)
+    source = args.source or source
+    target = args.target or target
+    if source is None or target is None:
+        print("source and target must be marked in the map or given with --source/--target", file=sys.stderr)
+        return 2
+    for role, (i, j) in (('source', source), ('target', target)):
+        if not is_free(grid, i, j):
+            print(f"{role} {i},{j} is a wall or outside the board", file=sys.stderr)
+            return 2
+    options = {}
+    if args.algo == 'alt':
+        options['landmarks'] = map_landmarks(args.map, grid)
+    profiler = SamplingProfiler() if args.profile else None
+    if profiler is not None:
+        profiler.start()
+    start = time.perf_counter()
+    try:
+        result = solve(grid, args.algo, source, target, **options)
+    except ValueError as error:
+        # e.g. jps on a board with terrain
+        if profiler is not None:
+            profiler.stop()
+        print(error, file=sys.stderr)
+        return 2
+    seconds = time.perf_counter() - start
+    if profiler is not None:
+        profiler.stop()
+    stats = result.stats
+    if args.json:
+        report = {
+            'algorithm': args.algo,
+            'source': source,
+            'target': target,
+            'found': result.found,
+            'path': result.path,
+            'opened_nodes': stats.opened_nodes,
+            'seconds': seconds,
+            'stats': stats.as_dict(),
+        }
+        if profiler is not None:
+            report['profile'] = profiler.report()
+        print(json.dumps(report))
+    else:
+        length = stats.path_length if result.found else None
+        phases = ', '.join(f"{name} {ns / 1e6:.2f} ms" for name, ns in stats.phases.items())
+        print(f"{args.algo}: path length {length}, opened nodes {stats.opened_nodes}, "
+              f"pushes {stats.pushes}, stale pops {stats.stale_pops}, frontier peak {stats.frontier_peak}, "
+              f"time {seconds * 1000:.2f} ms ({phases})")
+        if profiler is not None:
+            print(profiler.format_report())
+        if args.show:
+            print(format_text(grid, source, target, result.path or ()), end='')
+    return 0 if result.found else 1
+
+
+def map_landmarks(map_path, grid):
+    # landmark tables live next to the map and are rebuilt when the map changed
+    from pathfinding.landmarks import LANDMARK_EXTENSION, Landmarks
+
+    path = map_path + LANDMARK_EXTENSION
+    try:
+        return Landmarks.load(path, grid)
+    except (OSError, ValueError):
+        landmarks = Landmarks(grid)
+    try:
+        landmarks.save(path)
+    except OSError as error:
+        # e.g. a read-only map directory; the tables are just not kept
+        print(f"warning: landmark tables not saved: {error}", file=sys.stderr)
+    return landmarks
+
+
+def flow_command(args):
+    from pathfinding.flow_field import FlowField
+    from pathfinding.maps import load_map
+
+    grid, source, target = load_map(args.map)
+    goals = args.goal or ([target] if target is not None else [])
+    agents = args.agent or ([source] if source is not None else [])
+    if not goals or not agents:
+        print("goals and agents must be marked in the map or given with --goal/--agent", file=sys.stderr)
+        return 2
+    for role, positions in (('goal', goals), ('agent', agents)):
+        for i, j in positions:
+            if not is_free(grid, i, j):
+                print(f"{role} {i},{j} is a wall or outside the board", file=sys.stderr)
+                return 2
+    start = time.perf_counter()
+    field = FlowField(grid, goals)
+    paths = field.paths(agents)
+    seconds = time.perf_counter() - start
+    routes = [{'agent': agent, 'goal': field.nearest_goal(agent), 'distance': field.distance(agent),
+               'next_step': field.next_step(agent), 'path': path}
+              for agent, path in zip(agents, paths)]
+    if args.json:
+        print(json.dumps({'goals': goals, 'routes': routes, 'seconds': seconds,
+                          'stats': field.stats.as_dict()}))
+    else:
+        for route in routes:
+            steps = len(route['path']) - 1 if route['path'] is not None else None
+            print(f"{route['agent']} -> {route['goal']}: cost {route['distance']}, steps {steps}, "
+                  f"next {route['next_step']}")
+        print(f"{len(agents)} agents, {len(goals)} goals, opened nodes {field.stats.opened_nodes}, "
+              f"time {seconds * 1000:.2f} ms")
+    return 0 if all(path is not None for path in paths) else 1
+
+
+def generate_command(args):
+    from pathfinding.generation import generate
+    from pathfinding.maps import format_text, save_text
+
+    grid, source, target = generate(args.kind, args.width, args.height, args.density, args.seed,
+                                    not args.any_endpoints)
+    if args.output:
+        save_text(args.output, grid, source, target)
+    else:
+        print(format_text(grid, source, target), end='')
+    return 0
+
+
+def convert_command(args):
+    from pathfinding.maps import load_map, save_map
+
+    grid, source, target = load_map(args.input)
+    save_map(args.output, grid, source, target)
+    return 0
+
+
+def board_argument(text):
+    # name=path, or just path named after the file
+    name, _, path = text.rpartition('=')
+    if not name:
+        name = os.path.splitext(os.path.basename(path))[0]
+    return name, path
+
+
+def serve_command(args):
+    from pathfinding.server import serve
+
+    serve(args.address, dict(args.board), args.workers, args.batch_size, args.batch_window / 1000)
+    return 0
+
+
+def query_command(args):
+    import asyncio
+    from pathfinding.client import PathClient
+
+    async def query():
+        client = await PathClient.connect(args.address)
+        try:
+            return await client.query(args.board, args.source, args.target, args.algo)
+        finally:
+            await client.close()
+
+    try:
+        response = asyncio.run(query())
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 2
+    print(json.dumps(response))
+    return 0 if response['found'] else 1
+
+
+def loadtest_command(args):
+    import asyncio
+    from pathfinding.client import load_test
+
+    try:
+        report = asyncio.run(load_test(args.address, args.board, args.requests, args.concurrency, args.algo,
+                                       args.connections, args.seed))
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps(report))
+    else:
+        latency = report['latency_ms']
+        print(f"{report['requests']} {report['algorithm']} queries, concurrency {report['concurrency']}: "
+              f"{report['throughput']:.0f}/s, p50 {latency['p50']:.2f} ms, p99 {latency['p99']:.2f} ms, "
+              f"max {latency['max']:.2f} ms, mean queue depth {report['mean_queue_depth']:.1f}, "
+              f"mean batch {report['mean_batch']:.1f}")
+    return 0
+
+
+def gui_command(args):
+    from pathfinding.gui import run
+    return run([sys.argv[0]], args.height, args.width)
+
+
+def main(argv=None):
+    from pathfinding.protocol import BATCH_SIZE, DEFAULT_ADDRESS
+    from pathfinding.solvers import SOLVERS
+
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ['benchmark']:
+        # the sweep has its own options; hand them over untouched
+        from pathfinding import benchmark
+        return benchmark.main(argv[1:])
+
+    parser = argparse.ArgumentParser(prog='python -m pathfinding')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    solve_parser = commands.add_parser('solve', help="find a path on a text map")
+    solve_parser.add_argument('--map', required=True, help="text map, MovingAI .map or binary .pfg board")
+    solve_parser.add_argument('--algo', default='astar', choices=sorted(SOLVERS))
+    solve_parser.add_argument('--source', type=parse_position, help="i,j; overrides S in the map")
+    solve_parser.add_argument('--target', type=parse_position, help="i,j; overrides G in the map")
+    solve_parser.add_argument('--show', action='store_true', help="print the map with the path")
+    solve_parser.add_argument('--json', action='store_true')
+    solve_parser.add_argument('--profile', action='store_true', help="sample the search and list the busiest functions")
+    solve_parser.set_defaults(handler=solve_command)
+
+    flow_parser = commands.add_parser('flow', help="route many agents to their nearest goals with one search")
+    flow_parser.add_argument('--map', required=True, help="text map, MovingAI .map or binary .pfg board")
+    flow_parser.add_argument('--goal', type=parse_position, action='append', help="i,j; repeatable, defaults to G")
+    flow_parser.add_argument('--agent', type=parse_position, action='append', help="i,j; repeatable, defaults to S")
+    flow_parser.add_argument('--json', action='store_true')
+    flow_parser.set_defaults(handler=flow_command)
+
+    commands.add_parser('benchmark', help="run the benchmark sweep (see benchmark --help)")
+
+    generate_parser = commands.add_parser('generate', help="write a seeded random board or maze as a text map")
+    generate_parser.add_argument('--kind', default='random', choices=('random', 'backtracker', 'prim', 'kruskal'))
+    generate_parser.add_argument('--width', type=int, default=20, help="board rows")
+    generate_parser.add_argument('--height', type=int, default=30, help="board columns")
+    generate_parser.add_argument('--density', type=float, default=0.3, help="wall density for random boards")
+    generate_parser.add_argument('--seed', type=int)
+    generate_parser.add_argument('--any-endpoints', action='store_true',
+                                 help="do not require a path between S and G")
+    generate_parser.add_argument('--output', help="map file to write; prints the map if omitted")
+    generate_parser.set_defaults(handler=generate_command)
+
+    convert_parser = commands.add_parser('convert', help="convert a board between text, .map and .pfg")
+    convert_parser.add_argument('input')
+    convert_parser.add_argument('output')
+    convert_parser.set_defaults(handler=convert_command)
+
+    serve_parser = commands.add_parser('serve', help="answer path queries for other processes (JSON lines)")
+    serve_parser.add_argument('--board', type=board_argument, action='append', required=True,
+                              help="[name=]map file to load; repeatable")
+    serve_parser.add_argument('--address', default=DEFAULT_ADDRESS, help="HOST:PORT or unix:PATH")
+    serve_parser.add_argument('--workers', type=int, help="search processes, one per CPU by default")
+    serve_parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    serve_parser.add_argument('--batch-window', type=float, default=0.0,
+                              help="milliseconds to wait for more queries before sending a batch")
+    serve_parser.set_defaults(handler=serve_command)
+
+    query_parser = commands.add_parser('query', help="ask a running server for one path")
+    query_parser.add_argument('--address', default=DEFAULT_ADDRESS, help="HOST:PORT or unix:PATH")
+    query_parser.add_argument('--board', required=True)
+    query_parser.add_argument('--source', type=parse_position, required=True, help="i,j")
+    query_parser.add_argument('--target', type=parse_position, required=True, help="i,j")
+    query_parser.add_argument('--algo', default='astar', choices=sorted(SOLVERS))
+    query_parser.set_defaults(handler=query_command)
+
+    loadtest_parser = commands.add_parser('loadtest', help="measure a running server's latency under load")
+    loadtest_parser.add_argument('--address', default=DEFAULT_ADDRESS, help="HOST:PORT or unix:PATH")
+    loadtest_parser.add_argument('--board', required=True)
+    loadtest_parser.add_argument('--requests', type=int, default=1000)
+    loadtest_parser.add_argument('--concurrency', type=int, default=16, help="queries in flight at once")
+    loadtest_parser.add_argument('--connections', type=int, default=1)
+    loadtest_parser.add_argument('--algo', default='astar', choices=sorted(SOLVERS))
+    loadtest_parser.add_argument('--seed', type=int, default=0)
+    loadtest_parser.add_argument('--json', action='store_true')
+    loadtest_parser.set_defaults(handler=loadtest_command)
+
+    gui_parser = commands.add_parser('gui', help="open the board window")
+    gui_parser.add_argument('--width', type=int, default=20, help="board rows")
+    gui_parser.add_argument('--height', type=int, default=30, help="board columns")
+    gui_parser.set_defaults(handler=gui_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,120 @@
+import asyncio
+import itertools
+import json
+import time
+
+from pathfinding.protocol import MAX_PAIRS, parse_address, percentile
+
+
+class PathClient:
+    # One connection to a PathServer. Requests are pipelined: each gets an
+    # id, a single reader task hands every answer to the request with that
+    # id, so any number of coroutines can share the connection.
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.ids = itertools.count()
+        self.waiting = {}
+        self.receiver = asyncio.create_task(self.receive())
+
+    @classmethod
+    async def connect(cls, address):
+        kind, where = parse_address(address)
+        if kind == 'unix':
+            reader, writer = await asyncio.open_unix_connection(where)
+        else:
+            reader, writer = await asyncio.open_connection(kind, where)
+        return cls(reader, writer)
+
+    async def receive(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self.waiting.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self.waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("the server closed the connection"))
+            self.waiting = {}
+
+    async def request(self, request):
+        number = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[number] = future
+        self.writer.write(json.dumps(dict(request, id=number)).encode() + b'\n')
+        await self.writer.drain()
+        response = await future
+        if 'error' in response:
+            raise ValueError(response['error'])
+        return response
+
+    async def query(self, board, source, target, algorithm='astar'):
+        return await self.request({'board': board, 'algorithm': algorithm,
+                                   'source': list(source), 'target': list(target)})
+
+    async def stats(self):
+        return await self.request({'op': 'stats'})
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.receiver.cancel()
+
+
+async def load_test(address, board, requests=1000, concurrency=16, algorithm='astar', connections=1, seed=0):
+    # concurrency coroutines spread over connections connections send the
+    # queries back to back; latency is measured here, from send to answer.
+    # More requests than MAX_PAIRS reuse the pairs in turn.
+    for name, value in (('requests', requests), ('concurrency', concurrency), ('connections', connections)):
+        if value < 1:
+            raise ValueError(f"{name} must be at least 1")
+    clients = [await PathClient.connect(address) for _ in range(connections)]
+    try:
+        count = min(requests, MAX_PAIRS)
+        pairs = (await clients[0].request({'op': 'pairs', 'board': board, 'count': count, 'seed': seed}))['pairs']
+        if not pairs:
+            raise ValueError(f"{board} has no connected pairs")
+        queue = asyncio.Queue()
+        for number in range(requests):
+            queue.put_nowait(pairs[number % len(pairs)])
+        latencies = []
+        depths = []
+        batches = []
+
+        async def user(client):
+            while not queue.empty():
+                source, target = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.query(board, source, target, algorithm)
+                latencies.append(time.perf_counter() - start)
+                depths.append(response['queue_depth'])
+                batches.append(response['batch'])
+
+        start = time.perf_counter()
+        await asyncio.gather(*(user(clients[number % connections]) for number in range(concurrency)))
+        seconds = time.perf_counter() - start
+        server = await clients[0].stats()
+    finally:
+        for client in clients:
+            await client.close()
+    latencies.sort()
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'algorithm': algorithm,
+        'seconds': seconds,
+        'throughput': requests / seconds if seconds else 0.0,
+        'latency_ms': {
+            'p50': percentile(latencies, 0.5) * 1000,
+            'p99': percentile(latencies, 0.99) * 1000,
+            'max': latencies[-1] * 1000,
+        },
+        'mean_queue_depth': sum(depths) / len(depths),
+        'mean_batch': sum(batches) / len(batches),
+        'server': server,
+    }
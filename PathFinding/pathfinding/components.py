@@ -0,0 +1,136 @@
+from array import array
+from collections import deque
+
+
+class ComponentIndex:
+    # Connected component of every free cell, so connected(source, target)
+    # is two lookups. Cells carry a label and labels are merged in a
+    # union-find, which makes knocking a wall down O(1). Putting a wall up
+    # may split a component: floods start from every free neighbor and take
+    # turns one cell at a time, so the pieces that get cut off are found
+    # after visiting about as many cells as they hold, and only they get a
+    # new label. Like DStarLite, the index owns grid and edits it in place.
+    def __init__(self, grid):
+        self.grid = grid
+        self.labels = array('i', [-1]) * grid.size
+        self.parent = []
+        self.count = 0
+        self.build()
+
+    def new_label(self):
+        self.parent.append(len(self.parent))
+        self.count += 1
+        return len(self.parent) - 1
+
+    def find(self, label):
+        parent = self.parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def build(self):
+        cells = self.grid.cells
+        offsets = self.grid.offsets
+        labels = self.labels
+        for start in range(self.grid.size):
+            if not cells[start] or labels[start] >= 0:
+                continue
+            label = self.new_label()
+            labels[start] = label
+            queue = deque((start,))
+            while queue:
+                index = queue.popleft()
+                for offset in offsets:
+                    neighbor = index + offset
+                    if cells[neighbor] and labels[neighbor] < 0:
+                        labels[neighbor] = label
+                        queue.append(neighbor)
+
+    def component(self, position):
+        label = self.labels[self.grid.index(*position)]
+        return self.find(label) if label >= 0 else -1
+
+    def connected(self, source, target):
+        source = self.component(source)
+        return source >= 0 and source == self.component(target)
+
+    def apply_changes(self, changes):
+        # changes: iterable of ((i, j), cell value); border cells are ignored
+        grid = self.grid
+        for (i, j), value in changes:
+            if grid.is_border(i, j):
+                continue
+            index = grid.index(i, j)
+            was_free = grid.cells[index] != 0
+            grid.cells[index] = value
+            if was_free and not value:
+                self.remove_cell(index)
+            elif value and not was_free:
+                self.add_cell(index)
+
+    def add_cell(self, index):
+        cells = self.grid.cells
+        labels = self.labels
+        roots = {self.find(labels[index + offset]) for offset in self.grid.offsets if cells[index + offset]}
+        if not roots:
+            labels[index] = self.new_label()
+            return
+        label = roots.pop()
+        labels[index] = label
+        for root in roots:
+            self.parent[root] = label
+            self.count -= 1
+
+    def remove_cell(self, index):
+        cells = self.grid.cells
+        labels = self.labels
+        labels[index] = -1
+        starts = [index + offset for offset in self.grid.offsets if cells[index + offset]]
+        if not starts:
+            self.count -= 1
+            return
+        # flood k owns the cells it reached; floods that touch join a group
+        owner = {start: flood for flood, start in enumerate(starts)}
+        group = list(range(len(starts)))
+        frontiers = [deque((start,)) for start in starts]
+        reached = [[start] for start in starts]
+        unresolved = set(range(len(starts)))
+
+        def root(flood):
+            while group[flood] != flood:
+                flood = group[flood]
+            return flood
+
+        while len({root(flood) for flood in unresolved}) > 1:
+            for flood in list(unresolved):
+                frontier = frontiers[flood]
+                if not frontier:
+                    continue
+                current = frontier.popleft()
+                for offset in self.grid.offsets:
+                    neighbor = current + offset
+                    if not cells[neighbor]:
+                        continue
+                    other = owner.get(neighbor)
+                    if other is None:
+                        owner[neighbor] = flood
+                        frontier.append(neighbor)
+                        reached[flood].append(neighbor)
+                    elif root(other) != root(flood):
+                        group[root(other)] = root(flood)
+            # a group whose floods all ran dry is cut off from the rest
+            groups = {}
+            for flood in unresolved:
+                groups.setdefault(root(flood), []).append(flood)
+            if len(groups) < 2:
+                break
+            for floods in groups.values():
+                if not any(frontiers[flood] for flood in floods):
+                    label = self.new_label()
+                    for flood in floods:
+                        for cell in reached[flood]:
+                            labels[cell] = label
+                    unresolved.difference_update(floods)
+                    break
+
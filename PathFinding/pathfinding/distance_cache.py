@@ -0,0 +1,119 @@
+from array import array
+from collections import OrderedDict
+from time import perf_counter_ns
+
+from pathfinding.progress import PROGRESS_INTERVAL
+from pathfinding.search import BucketQueue, SearchResult, SearchStats
+
+
+class DistanceField:
+    # Cost-to-go from every cell to one target, built once with a reverse
+    # Dial search: stepping onto a cell costs its byte, as in search.ucs.
+    # -1 marks cells that cannot reach the target.
+    def __init__(self, grid, target, progress=None):
+        self.grid = grid
+        self.target = grid.index(*target)
+        typecode = 'i' if grid.max_cost() * grid.size < 2 ** 31 else 'q'
+        self.distances = array(typecode, [-1]) * grid.size
+        self.opened_nodes = 0
+        self.pushes = 0
+        self.stale_pops = 0
+        self.build(progress)
+
+    def build(self, progress=None):
+        cells = self.grid.cells
+        offsets = self.grid.offsets
+        distances = self.distances
+        closed = bytearray(self.grid.size)
+        queue = BucketQueue(self.grid.max_cost())
+        distances[self.target] = 0
+        queue.push(0, self.target)
+        while queue:
+            distance, index = queue.pop()
+            if closed[index]:
+                self.stale_pops += 1
+                continue
+            closed[index] = 1
+            self.opened_nodes += 1
+            if progress is not None and not self.opened_nodes % PROGRESS_INTERVAL:
+                progress(self.opened_nodes, len(queue))
+            new_distance = distance + cells[index]
+            for offset in offsets:
+                neighbor = index + offset
+                if cells[neighbor] and not closed[neighbor]:
+                    old_distance = distances[neighbor]
+                    if old_distance < 0 or new_distance < old_distance:
+                        distances[neighbor] = new_distance
+                        queue.push(new_distance, neighbor)
+        self.pushes = self.opened_nodes + self.stale_pops
+
+    def distance(self, source):
+        distance = self.distances[self.grid.index(*source)]
+        return distance if distance >= 0 else None
+
+    def path_from(self, source):
+        # walk downhill: each step goes to a neighbor whose distance plus its
+        # own step cost accounts for the current distance
+        cells = self.grid.cells
+        offsets = self.grid.offsets
+        distances = self.distances
+        index = self.grid.index(*source)
+        if distances[index] < 0:
+            return None
+        path = [index]
+        while index != self.target:
+            for offset in offsets:
+                neighbor = index + offset
+                if cells[neighbor] and 0 <= distances[neighbor] == distances[index] - cells[neighbor]:
+                    index = neighbor
+                    break
+            path.append(index)
+        return [self.grid.position(index) for index in path]
+
+
+class DistanceCache:
+    # LRU of distance fields keyed by board content and target, so a moving
+    # source or a repeated run on the same board is answered by path_from
+    # without searching. Editing the board changes its fingerprint, so stale
+    # fields are never hit; clear() frees them early.
+    def __init__(self, capacity=16):
+        self.capacity = capacity
+        self.fields = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.fields)
+
+    def field(self, grid, target, fingerprint=None, progress=None):
+        # hashing the board is O(size); callers that look up often pass the
+        # fingerprint they keep and drop it when they edit the board
+        if fingerprint is None:
+            fingerprint = grid.fingerprint()
+        key = (fingerprint, grid.index(*target))
+        field = self.fields.get(key)
+        if field is not None:
+            self.hits += 1
+            self.fields.move_to_end(key)
+            return field
+        self.misses += 1
+        field = DistanceField(grid, target, progress)
+        self.fields[key] = field
+        if len(self.fields) > self.capacity:
+            self.fields.popitem(last=False)
+        return field
+
+    def search(self, grid, source, target, fingerprint=None, progress=None):
+        # a cached field costs nothing but the walk down it
+        misses = self.misses
+        field = self.field(grid, target, fingerprint, progress)
+        stats = SearchStats()
+        if self.misses != misses:
+            stats = SearchStats(field.opened_nodes, pushes=field.pushes, stale_pops=field.stale_pops)
+        start = perf_counter_ns()
+        path = field.path_from(source)
+        stats.phases['reconstruct'] = perf_counter_ns() - start
+        return SearchResult(path, stats)
+
+    def clear(self):
+        self.fields.clear()
@@ -0,0 +1,85 @@
+from array import array
+
+EXPAND = 0
+ENQUEUE = 1
+PATH = 2
+
+
+class EventLog:
+    # Compact record of what a search did, in order: one kind byte and one
+    # cell index per event. Iterating yields (kind, i, j), so the GUI can
+    # replay it at any speed or jump to any point after the search is done.
+    def __init__(self, stride):
+        self.stride = stride
+        self.kinds = bytearray()
+        self.cells = array('i')
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __bool__(self):
+        # engines test trace for truth; an empty log still records
+        return True
+
+    def clear(self):
+        del self.kinds[:]
+        del self.cells[:]
+
+    def add(self, kind, index):
+        self.kinds.append(kind)
+        self.cells.append(index)
+
+    def extend(self, kind, indices):
+        self.cells.extend(indices)
+        self.kinds.extend(bytes((kind,)) * (len(self.cells) - len(self.kinds)))
+
+    def event(self, number):
+        i, j = divmod(self.cells[number], self.stride)
+        return self.kinds[number], i, j
+
+    def __iter__(self):
+        stride = self.stride
+        for kind, index in zip(self.kinds, self.cells):
+            i, j = divmod(index, stride)
+            yield kind, i, j
+
+    def positions(self, kind):
+        stride = self.stride
+        return [divmod(index, stride) for event_kind, index in zip(self.kinds, self.cells) if event_kind == kind]
+
+    @classmethod
+    def for_path(cls, grid, path):
+        events = cls(grid.stride)
+        if path:
+            events.extend(PATH, [grid.index(i, j) for i, j in path])
+        return events
+
+
+class ExpansionHook(EventLog):
+    # Pass as trace= to any engine to have callback(i, j) called for every
+    # cell as it is opened, while the search is still running. The events
+    # are recorded as well, so the result can be replayed like any trace.
+    def __init__(self, callback, stride=0):
+        super(ExpansionHook, self).__init__(stride)
+        self.callback = callback
+
+    def add(self, kind, index):
+        EventLog.add(self, kind, index)
+        if kind == EXPAND:
+            self.callback(*divmod(index, self.stride))
+
+    def extend(self, kind, indices):
+        indices = list(indices)
+        EventLog.extend(self, kind, indices)
+        if kind == EXPAND:
+            for index in indices:
+                self.callback(*divmod(index, self.stride))
+
+
+def event_log(grid, trace):
+    # the engines' trace argument: False, True for a fresh log, or a log
+    # (such as an ExpansionHook) to record into
+    if isinstance(trace, EventLog):
+        trace.stride = grid.stride
+        return trace
+    return EventLog(grid.stride) if trace else None
@@ -0,0 +1,152 @@
+from array import array
+from collections import deque
+from time import perf_counter_ns
+
+from pathfinding.progress import PROGRESS_INTERVAL
+from pathfinding.search import BucketQueue, SearchStats
+
+
+class FlowField:
+    # One reverse Dial search seeded with every goal at once labels each cell
+    # with its nearest goal, the cost to get there (stepping onto a cell
+    # costs its byte, as in search.ucs) and the neighbor to step to next. Any
+    # number of agents then read their next step in O(1) and their path in
+    # O(path length), so N agents cost one search instead of N. -1 marks
+    # cells that cannot reach any goal.
+    def __init__(self, grid, goals, progress=None):
+        self.grid = grid
+        self.goals = [grid.index(*goal) for goal in goals]
+        if not self.goals:
+            raise ValueError("a flow field needs at least one goal")
+        for goal, index in zip(goals, self.goals):
+            if not grid.cells[index]:
+                raise ValueError(f"goal {tuple(goal)} is a wall")
+        typecode = 'i' if grid.max_cost() * grid.size < 2 ** 31 else 'q'
+        self.distances = array(typecode, [-1]) * grid.size
+        self.nearest = array('i', [-1]) * grid.size
+        self.toward = array('i', [-1]) * grid.size
+        self.stats = SearchStats()
+        start = perf_counter_ns()
+        if grid.max_cost() == 1:
+            self.build_uniform(progress)
+        else:
+            self.build(progress)
+        self.stats.phases['search'] = perf_counter_ns() - start
+
+    def build(self, progress=None):
+        cells = self.grid.cells
+        offsets = self.grid.offsets
+        distances = self.distances
+        nearest = self.nearest
+        toward = self.toward
+        closed = bytearray(self.grid.size)
+        queue = BucketQueue(self.grid.max_cost())
+        for number, goal in enumerate(self.goals):
+            if distances[goal] < 0:
+                distances[goal] = 0
+                nearest[goal] = number
+                toward[goal] = goal
+                queue.push(0, goal)
+        stats = self.stats
+        pushes = len(queue)
+        opened = stale = peak = 0
+        while queue:
+            if len(queue) > peak:
+                peak = len(queue)
+            distance, index = queue.pop()
+            if closed[index]:
+                stale += 1
+                continue
+            closed[index] = 1
+            opened += 1
+            if progress is not None and not opened % PROGRESS_INTERVAL:
+                progress(opened, len(queue))
+            new_distance = distance + cells[index]
+            label = nearest[index]
+            for offset in offsets:
+                neighbor = index + offset
+                if cells[neighbor] and not closed[neighbor]:
+                    old_distance = distances[neighbor]
+                    if old_distance < 0 or new_distance < old_distance:
+                        distances[neighbor] = new_distance
+                        nearest[neighbor] = label
+                        toward[neighbor] = index
+                        queue.push(new_distance, neighbor)
+                        pushes += 1
+        stats.opened_nodes = opened
+        stats.pushes = pushes
+        stats.stale_pops = stale
+        stats.frontier_peak = peak
+
+    def build_uniform(self, progress=None):
+        # every step costs 1: a multi-source BFS gives the same field without
+        # the bucket queue, and nothing is pushed twice
+        cells = self.grid.cells
+        offsets = self.grid.offsets
+        distances = self.distances
+        nearest = self.nearest
+        toward = self.toward
+        queue = deque()
+        for number, goal in enumerate(self.goals):
+            if distances[goal] < 0:
+                distances[goal] = 0
+                nearest[goal] = number
+                toward[goal] = goal
+                queue.append(goal)
+        opened = peak = 0
+        while queue:
+            if len(queue) > peak:
+                peak = len(queue)
+            index = queue.popleft()
+            opened += 1
+            if progress is not None and not opened % PROGRESS_INTERVAL:
+                progress(opened, len(queue))
+            new_distance = distances[index] + 1
+            label = nearest[index]
+            for offset in offsets:
+                neighbor = index + offset
+                if cells[neighbor] and distances[neighbor] < 0:
+                    distances[neighbor] = new_distance
+                    nearest[neighbor] = label
+                    toward[neighbor] = index
+                    queue.append(neighbor)
+        self.stats.opened_nodes = opened
+        self.stats.pushes = opened
+        self.stats.frontier_peak = peak
+
+    def distance(self, position):
+        distance = self.distances[self.grid.index(*position)]
+        return distance if distance >= 0 else None
+
+    def nearest_goal(self, position):
+        number = self.nearest[self.grid.index(*position)]
+        return self.grid.position(self.goals[number]) if number >= 0 else None
+
+    def next_step(self, position):
+        # the cell to move to; a goal stays where it is
+        index = self.toward[self.grid.index(*position)]
+        return self.grid.position(index) if index >= 0 else None
+
+    def path_from(self, position):
+        toward = self.toward
+        index = self.grid.index(*position)
+        if toward[index] < 0:
+            return None
+        path = [index]
+        while toward[index] != index:
+            index = toward[index]
+            path.append(index)
+        return [self.grid.position(index) for index in path]
+
+    def next_steps(self, agents):
+        # batch next_step: one lookup per agent
+        grid = self.grid
+        toward = self.toward
+        steps = []
+        for agent in agents:
+            index = toward[grid.index(*agent)]
+            steps.append(grid.position(index) if index >= 0 else None)
+        return steps
+
+    def paths(self, agents):
+        return [self.path_from(agent) for agent in agents]
@@ -0,0 +1,212 @@
+from itertools import permutations
+
+import numpy as np
+
+from pathfinding.grid import Grid, WALL, EMPTY
+
+# Boards are built from one numpy Generator, so the same seed always gives
+# the same board and endpoints. Mazes put their cells on odd (i, j) and the
+# walls between them on the cells in between; with an even width or height
+# the last row or column just stays wall.
+
+# direction orders for the backtracker, picked per cell by one random byte
+ORDERS = list(permutations(range(4)))
+
+
+def board_array(grid):
+    # writable (width, height) view of grid.cells
+    return np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.width, grid.height)
+
+
+def random_obstacles(width, height, density, seed=None):
+    rng = np.random.default_rng(seed)
+    grid = Grid(width, height)
+    board = board_array(grid)
+    walls = rng.random((width - 2, height - 2)) < density
+    board[1:-1, 1:-1][walls] = WALL
+    return grid
+
+
+def maze_frame(width, height):
+    if width < 3 or height < 3:
+        raise ValueError("a maze needs at least a 3x3 board")
+    grid = Grid(width, height)
+    board = board_array(grid)
+    board[1:-1, 1:-1] = WALL
+    stride = grid.stride
+    # two cells apart in each direction, and the wall cell halfway there
+    steps = (-2 * stride, 2, 2 * stride, -2)
+    halves = (-stride, 1, stride, -1)
+    # 1 on every maze cell not carved yet. The padding past the end keeps
+    # index + steps[d] in range; negative indices wrap into it as well.
+    unvisited = bytearray(grid.size + 2 * stride)
+    unvisited_board = np.frombuffer(unvisited, dtype=np.uint8)[:grid.size].reshape(width, height)
+    unvisited_board[1:width - 1:2, 1:height - 1:2] = 1
+    return grid, steps, halves, unvisited
+
+
+def random_maze_cell(grid, rng):
+    i = 2 * int(rng.integers((grid.width - 1) // 2)) + 1
+    j = 2 * int(rng.integers((grid.height - 1) // 2)) + 1
+    return grid.index(i, j)
+
+
+def recursive_backtracker(width, height, seed=None):
+    # Iterative depth-first carving. Each cell tries its four directions in
+    # an order drawn up front, and tried[] remembers how far it got, so the
+    # stack only holds cell indices.
+    rng = np.random.default_rng(seed)
+    grid, steps, halves, unvisited = maze_frame(width, height)
+    cells = grid.cells
+    orders = rng.integers(0, len(ORDERS), size=grid.size, dtype=np.uint8).tobytes()
+    tried = bytearray(grid.size)
+    start = random_maze_cell(grid, rng)
+    unvisited[start] = 0
+    cells[start] = EMPTY
+    stack = [start]
+    while stack:
+        index = stack[-1]
+        attempt = tried[index]
+        if attempt == 4:
+            stack.pop()
+            continue
+        tried[index] = attempt + 1
+        direction = ORDERS[orders[index]][attempt]
+        neighbor = index + steps[direction]
+        if unvisited[neighbor]:
+            unvisited[neighbor] = 0
+            cells[index + halves[direction]] = EMPTY
+            cells[neighbor] = EMPTY
+            stack.append(neighbor)
+    return grid
+
+
+def prim(width, height, seed=None):
+    # Randomized Prim: grow one tree by taking a random edge out of it.
+    # Edges are cell * 4 + direction; a picked edge is swapped to the end of
+    # the list and popped, so removal is O(1).
+    rng = np.random.default_rng(seed)
+    grid, steps, halves, unvisited = maze_frame(width, height)
+    cells = grid.cells
+    maze_cells = ((width - 1) // 2) * ((height - 1) // 2)
+    draws = iter(rng.random(4 * maze_cells).tolist())
+    start = random_maze_cell(grid, rng)
+    unvisited[start] = 0
+    cells[start] = EMPTY
+    edges = [start * 4 + direction for direction in range(4) if unvisited[start + steps[direction]]]
+    while edges:
+        position = int(next(draws) * len(edges))
+        edges[position], edges[-1] = edges[-1], edges[position]
+        index, direction = divmod(edges.pop(), 4)
+        neighbor = index + steps[direction]
+        if not unvisited[neighbor]:
+            continue
+        unvisited[neighbor] = 0
+        cells[index + halves[direction]] = EMPTY
+        cells[neighbor] = EMPTY
+        for direction in range(4):
+            if unvisited[neighbor + steps[direction]]:
+                edges.append(neighbor * 4 + direction)
+    return grid
+
+
+def kruskal(width, height, seed=None):
+    # Randomized Kruskal: walk every wall between two maze cells in random
+    # order and knock it down when the cells are still in different sets of
+    # a union-find (path halving). The edge lists are built with numpy.
+    rng = np.random.default_rng(seed)
+    grid = maze_frame(width, height)[0]
+    rows, columns = (width - 1) // 2, (height - 1) // 2
+    stride = grid.stride
+    number = np.arange(rows * columns).reshape(rows, columns)
+    position = (2 * np.arange(rows)[:, None] + 1) * stride + 2 * np.arange(columns) + 1
+    first = np.concatenate((number[:, :-1].ravel(), number[:-1, :].ravel()))
+    second = np.concatenate((number[:, 1:].ravel(), number[1:, :].ravel()))
+    walls = np.concatenate((position[:, :-1].ravel() + 1, position[:-1, :].ravel() + stride))
+    order = rng.permutation(first.size)
+    parent = list(range(rows * columns))
+    carved = []
+    for a, b, wall in zip(first[order].tolist(), second[order].tolist(), walls[order].tolist()):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a != b:
+            parent[a] = b
+            carved.append(wall)
+    cells = np.frombuffer(grid.cells, dtype=np.uint8)
+    cells[position.ravel()] = EMPTY
+    cells[np.array(carved, dtype=np.int64)] = EMPTY
+    return grid
+
+
+GENERATORS = {
+    'random': random_obstacles,
+    'backtracker': recursive_backtracker,
+    'prim': prim,
+    'kruskal': kruskal,
+}
+
+# every maze cell is connected to every other one
+PERFECT_MAZES = ('backtracker', 'prim', 'kruskal')
+
+
+def reachable(grid, source):
+    # Boolean mask of the cells connected to source. Each horizontal run of
+    # free cells is one node (the wall ring ends every run), runs that touch
+    # vertically are joined in a union-find, and every round hooks all edges
+    # at once and then flattens the trees. Rounds grow with how tangled the
+    # board is, not with its diameter, so mazes cost no more than open boards.
+    free = np.frombuffer(grid.cells, dtype=np.uint8) != 0
+    stride = grid.stride
+    starts = free.copy()
+    starts[1:] &= ~free[:-1]
+    run = np.cumsum(starts, dtype=np.int32) - 1
+    below = np.flatnonzero(free[:-stride] & free[stride:])
+    a, b = run[below], run[below + stride]
+    keep = a != b
+    a, b = a[keep], b[keep]
+    parent = np.arange(int(run[-1]) + 1, dtype=np.int32)
+    while a.size:
+        roots_a, roots_b = parent[a], parent[b]
+        apart = roots_a != roots_b
+        a, b, roots_a, roots_b = a[apart], b[apart], roots_a[apart], roots_b[apart]
+        # any smaller root will do; pointing down keeps the trees acyclic
+        parent[np.maximum(roots_a, roots_b)] = np.minimum(roots_a, roots_b)
+        while True:
+            up = parent[parent]
+            if np.array_equal(up, parent):
+                break
+            parent = up
+    return free & (parent[run] == parent[run[source]])
+
+
+def place_endpoints(grid, seed=None, connected=True, attempts=16):
+    # Two distinct free cells. With connected=True the target is drawn from
+    # the source's component; a source with no free neighbors is redrawn.
+    rng = np.random.default_rng(seed)
+    free = np.flatnonzero(np.frombuffer(grid.cells, dtype=np.uint8))
+    if free.size < 2:
+        raise ValueError("the board needs at least two free cells")
+    for _ in range(attempts):
+        source = int(free[rng.integers(free.size)])
+        candidates = np.flatnonzero(reachable(grid, source)) if connected else free
+        candidates = candidates[candidates != source]
+        if candidates.size:
+            target = int(candidates[rng.integers(candidates.size)])
+            return grid.position(source), grid.position(target)
+    raise ValueError(f"no connected source and target found in {attempts} attempts")
+
+
+def generate(kind, width, height, density=0.3, seed=None, connected=True):
+    if kind not in GENERATORS:
+        raise ValueError(f"unknown board kind {kind!r}, expected one of {', '.join(GENERATORS)}")
+    rng = np.random.default_rng(seed)
+    if kind == 'random':
+        grid = random_obstacles(width, height, density, rng)
+    else:
+        grid = GENERATORS[kind](width, height, rng)
+    source, target = place_endpoints(grid, rng, connected and kind not in PERFECT_MAZES)
+    return grid, source, target
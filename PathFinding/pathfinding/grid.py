@@ -0,0 +1,58 @@
+import hashlib
+
+WALL = 0
+EMPTY = 1
+MAX_COST = 255
+
+
+class Grid:
+    # Flat row-major board: cell (i, j) lives at i * stride + j. The outer
+    # ring is always wall, the same as MainWindow.is_wall_btn, so neighbor
+    # offsets never need a bounds check. A cell byte is the cost of stepping
+    # onto it (EMPTY for plain floor, up to MAX_COST for rough terrain) and
+    # WALL means blocked.
+    def __init__(self, width, height, cells=None):
+        self.width = width
+        self.height = height
+        self.stride = height
+        self.size = width * height
+        if cells is None:
+            cells = bytearray(self.size)
+            for i in range(1, width - 1):
+                start = i * height
+                cells[start + 1:start + height - 1] = bytes((EMPTY,)) * (height - 2)
+        self.cells = cells
+        self.offsets = (-height, 1, height, -1)
+
+    def diagonal_moves(self):
+        # (offset, vertical side, horizontal side); a diagonal step is only
+        # allowed when both sides are free, so paths never cut wall corners
+        up, right, down, left = self.offsets
+        return ((up + right, up, right), (down + right, down, right),
+                (down + left, down, left), (up + left, up, left))
+
+    def index(self, i, j):
+        return i * self.stride + j
+
+    def position(self, index):
+        return divmod(index, self.stride)
+
+    def is_border(self, i, j):
+        return i == 0 or j == 0 or i == self.width - 1 or j == self.height - 1
+
+    def is_wall(self, i, j):
+        return self.cells[i * self.stride + j] == WALL
+
+    def set_cell(self, i, j, value):
+        if not self.is_border(i, j):
+            self.cells[i * self.stride + j] = value
+
+    def max_cost(self):
+        return max(self.cells)
+
+    def fingerprint(self):
+        digest = hashlib.blake2b(self.cells, digest_size=16).hexdigest()
+        return f"{self.width}x{self.height}-{digest}"
+
+    def copy(self):
+        return Grid(self.width, self.height, bytearray(self.cells))
@@ -0,0 +1,916 @@
+import enum
+import json
+import sys
+
+from PyQt5 import QtWidgets, QtCore, QtGui
+
+from pathfinding import bidirectional, iterative, jump_point, search
+from pathfinding.animation import AnimationPlayer
+from pathfinding.board_view import BoardView
+from pathfinding.components import ComponentIndex
+from pathfinding.distance_cache import DistanceCache
+from pathfinding.events import ENQUEUE, EXPAND, PATH, EventLog
+from pathfinding.hierarchical import HierarchicalMap
+from pathfinding.history import EditHistory
+from pathfinding.incremental import DStarLite
+from pathfinding.landmarks import Landmarks
+from pathfinding.profiling import SamplingProfiler, timed
+from pathfinding.worker import SearchWorker
+from pathfinding.grid import Grid, WALL, EMPTY
+
+
+class DialogMode(enum.Enum):
+    WinGame = 1
+    FailedPathFinding = 2
+    InformingUser = 3
+
+
+class Mode(enum.Enum):
+    Computer = 1
+    User = 2
+
+
+class MoveMode(enum.Enum):
+    Animate = 1
+    InAnimate = 2
+
+class CreateBoard(enum.Enum):
+    handy = 1
+    auto = 2
+
+
+class FindPathAlgorithm(enum.Enum):
+    BFS = 1
+    DFS = 2
+    A_Star = 3
+    UCS = 4
+    Iterative_Deepening = 5
+    JPS = 6
+    Bidirectional_BFS = 7
+    Bidirectional_A_Star = 8
+    Distance_Field = 9
+    D_Star_Lite = 10
+    HPA_Star = 11
+    ALT = 12
+
+
+class Colors(enum.Enum):
+    Black = '#171717'
+    White = '#FFFFFF'
+    Red = '#DC143C'
+    Green = '#00A572'
+    Cyan = "#ccd9ff"
+    Purple = "#ac00e6"
+    Sand = "#e6c88c"
+    Water = "#4da6ff"
+    Frontier = "#e6ecff"
+
+
+COLOR_CODES = {color: code for code, color in enumerate(Colors)}
+
+
+TERRAIN_COSTS = {
+    Colors.Sand: 3,
+    Colors.Water: 7,
+}
+
+
+class MainWindow(QtWidgets.QMainWindow):
+    def __init__(self, height=30, width=20):
+        super(MainWindow, self).__init__()
+        self.board_height = height
+        self.board_width = width
+        self.grid_board_colors = [[None for _ in range(height)]for _ in range(width)]
+        self.pen_color = Colors.Black
+        self.setFixedWidth(min(width*50, 1600))
+        self.setFixedHeight(min(height*25, 1000))
+        self.create_board_mode = CreateBoard.handy
+        self.algorithm = FindPathAlgorithm.BFS
+        self.mode = Mode.Computer
+        self.green_btn_position = None
+        self.red_btn_position = None
+        # the cell the player stands on in User mode and its color before the
+        # player stepped onto it, given back when the player moves on
+        self.under_player = (None, Colors.White)
+        self.find_dst = False
+        self.enemies_density = 0.1
+        self.pattern = 'random'
+        self.duration = 3
+        self.move_mode = MoveMode.Animate
+        self.jump_table = None
+        self.distance_cache = DistanceCache()
+        # fingerprint of the board as it is now, hashed on the first distance
+        # field run after an edit instead of on every lookup
+        self.board_fingerprint = None
+        self.planner = None
+        self.changed_cells = set()
+        self.components = None
+        self.hierarchy = None
+        self.landmarks = None
+        # board edits as undoable diffs, and the color the last run shows on
+        # each cell it touched; grid_board_colors keeps the board underneath
+        self.history = EditHistory()
+        self.overlay = {}
+        self.worker = None
+        # stats of the last finished run, kept for export
+        self.last_run = None
+        self.player = AnimationPlayer(self)
+        self.player.applied.connect(self.apply_event)
+        self.player.rewound.connect(self.clear_overlay)
+        self.player.finished.connect(self.animation_finished)
+        self.divide_screen()
+        self.create_board()
+        self.create_bottom_panel()
+        self.view()
+        self.message_box = QtWidgets.QMessageBox()
+        self.message_box.setStandardButtons(QtWidgets.QMessageBox.Ok)
+        self.opened_nodes = 0
+        self.counter = 0
+        QtWidgets.QShortcut(QtGui.QKeySequence.Undo, self, self.undo)
+        QtWidgets.QShortcut(QtGui.QKeySequence.Redo, self, self.redo)
+
+    def view(self):
+        widget = QtWidgets.QWidget()
+        widget.setLayout(self.main_vertical_layout)
+        self.setCentralWidget(widget)
+        self.setLayout(self.main_vertical_layout)
+        self.show()
+
+    def divide_screen(self):
+        self.main_vertical_layout = QtWidgets.QVBoxLayout()
+        self.main_vertical_layout.setSpacing(0)
+
+        self.board_vertical_layout = QtWidgets.QVBoxLayout()
+        self.board_vertical_layout.setSpacing(1)
+        self.main_vertical_layout.addLayout(self.board_vertical_layout)
+
+        self.panel_grid_layout = QtWidgets.QGridLayout()
+        self.main_vertical_layout.addLayout(self.panel_grid_layout)
+
+    def create_board(self):
+        self.board_view = BoardView(self.board_width, self.board_height, [color.value for color in Colors])
+        self.board_view.cell_pressed.connect(self.board_pressed)
+        # one press-drag-release is one undo step
+        self.board_view.stroke_finished.connect(self.history.end)
+        self.board_vertical_layout.addWidget(self.board_view)
+        self.load_grid(Grid(self.board_width, self.board_height))
+
+    def board_pressed(self, i, j):
+        if not self.is_wall_btn(i, j):
+            self.grid_cells_pressed(i, j)
+
+    def create_bottom_panel(self):
+        self.board_options_grid_layout = QtWidgets.QGridLayout()
+        self.panel_grid_layout.addLayout(self.board_options_grid_layout, 0, 0)
+        self.create_board_panel()
+
+        self.modes_grid_layout = QtWidgets.QGridLayout()
+        self.panel_grid_layout.addLayout(self.modes_grid_layout, 0, 1)
+        self.create_modes_panel()
+
+        self.animation_panel_horizontal_layout = QtWidgets.QHBoxLayout()
+        self.panel_grid_layout.addLayout(self.animation_panel_horizontal_layout, 1, 0)
+        self.animation_panel()
+
+        self.run_panel_vertical_layout = QtWidgets.QVBoxLayout()
+        self.panel_grid_layout.addLayout(self.run_panel_vertical_layout, 1, 1)
+        self.run_panel()
+
+    def run_panel(self):
+        self.run_information = QtWidgets.QHBoxLayout()
+
+        self.open_nodes_title_lbl = QtWidgets.QLabel("open nodes:")
+        self.run_information.addWidget(self.open_nodes_title_lbl)
+
+        self.open_nodes_lbl = QtWidgets.QLabel("0")
+        self.run_information.addWidget(self.open_nodes_lbl)
+
+        self.run_time_title_lbl = QtWidgets.QLabel("time:")
+        self.run_information.addWidget(self.run_time_title_lbl)
+
+        self.run_time_lbl = QtWidgets.QLabel("0")
+        self.run_information.addWidget(self.run_time_lbl)
+
+        self.frontier_title_lbl = QtWidgets.QLabel("frontier:")
+        self.run_information.addWidget(self.frontier_title_lbl)
+
+        self.frontier_lbl = QtWidgets.QLabel("0")
+        self.run_information.addWidget(self.frontier_lbl)
+
+        self.run_panel_vertical_layout.addLayout(self.run_information)
+
+        self.run_counters = QtWidgets.QHBoxLayout()
+
+        self.pushes_title_lbl = QtWidgets.QLabel("pushes:")
+        self.run_counters.addWidget(self.pushes_title_lbl)
+
+        self.pushes_lbl = QtWidgets.QLabel("0")
+        self.run_counters.addWidget(self.pushes_lbl)
+
+        self.stale_pops_title_lbl = QtWidgets.QLabel("stale pops:")
+        self.run_counters.addWidget(self.stale_pops_title_lbl)
+
+        self.stale_pops_lbl = QtWidgets.QLabel("0")
+        self.run_counters.addWidget(self.stale_pops_lbl)
+
+        self.path_length_title_lbl = QtWidgets.QLabel("path length:")
+        self.run_counters.addWidget(self.path_length_title_lbl)
+
+        self.path_length_lbl = QtWidgets.QLabel("0")
+        self.run_counters.addWidget(self.path_length_lbl)
+
+        self.run_panel_vertical_layout.addLayout(self.run_counters)
+
+        self.phases_lbl = QtWidgets.QLabel("")
+        self.run_panel_vertical_layout.addWidget(self.phases_lbl)
+
+        self.run_tools = QtWidgets.QHBoxLayout()
+
+        self.profile_check_box = QtWidgets.QCheckBox("profile")
+        self.run_tools.addWidget(self.profile_check_box)
+
+        self.export_stats_btn = QtWidgets.QPushButton("export stats")
+        self.export_stats_btn.pressed.connect(self.export_stats)
+        self.export_stats_btn.setEnabled(False)
+        self.run_tools.addWidget(self.export_stats_btn)
+
+        self.run_panel_vertical_layout.addLayout(self.run_tools)
+
+        self.events_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
+        self.events_slider.setRange(0, 0)
+        self.events_slider.sliderMoved.connect(self.player.seek)
+        self.player.moved.connect(self.events_slider.setValue)
+        self.run_panel_vertical_layout.addWidget(self.events_slider)
+
+        self.run_algorithm_btn = QtWidgets.QPushButton("run")
+        self.run_algorithm_btn.pressed.connect(self.run_algorithm)
+        self.run_panel_vertical_layout.addWidget(self.run_algorithm_btn)
+
+        self.cancel_btn = QtWidgets.QPushButton("cancel")
+        self.cancel_btn.pressed.connect(self.cancel_run)
+        self.cancel_btn.setEnabled(False)
+        self.run_panel_vertical_layout.addWidget(self.cancel_btn)
+
+
+    def create_board_panel(self):
+        self.handy_pattern_btn = QtWidgets.QPushButton("Handy pattern")
+        self.handy_pattern_btn.pressed.connect(self.change_mode_to_handy)
+        self.board_options_grid_layout.addWidget(self.handy_pattern_btn, 0, 0)
+
+        self.auto_generate_pattern_btn = QtWidgets.QPushButton("Generate random pattern")
+        self.auto_generate_pattern_btn.pressed.connect(self.change_mode_to_auto_generate)
+        self.board_options_grid_layout.addWidget(self.auto_generate_pattern_btn, 0, 1)
+
+        self.clear_grid_btn = QtWidgets.QPushButton("Clear grid")
+        self.clear_grid_btn.pressed.connect(self.clear_board)
+        self.board_options_grid_layout.addWidget(self.clear_grid_btn, 1, 0)
+
+        self.clear_search_btn = QtWidgets.QPushButton("Clear search")
+        self.clear_search_btn.pressed.connect(self.clear_overlay)
+        self.board_options_grid_layout.addWidget(self.clear_search_btn, 1, 1)
+
+        self.undo_btn = QtWidgets.QPushButton("Undo")
+        self.undo_btn.pressed.connect(self.undo)
+        self.board_options_grid_layout.addWidget(self.undo_btn, 2, 0)
+
+        self.redo_btn = QtWidgets.QPushButton("Redo")
+        self.redo_btn.pressed.connect(self.redo)
+        self.board_options_grid_layout.addWidget(self.redo_btn, 2, 1)
+
+    def animation_panel(self):
+        self.animate_or_inanimate_lbl = QtWidgets.QLabel("animation: ")
+        self.animation_panel_horizontal_layout.addWidget(self.animate_or_inanimate_lbl)
+        self.animate_or_inanimate_lbl.setFixedHeight(30)
+        self.animate_or_inanimate_lbl.setFixedWidth(65)
+
+        self.animate_or_inanimate_move_combo_box = QtWidgets.QComboBox()
+        modes = ['animate', 'inanimate']
+        self.animate_or_inanimate_move_combo_box.addItems(modes)
+        self.animate_or_inanimate_move_combo_box.currentIndexChanged.connect(self.change_move_mode)
+        self.animation_panel_horizontal_layout.addWidget(self.animate_or_inanimate_move_combo_box)
+
+
+        self.duration_lbl = QtWidgets.QLabel("duration: ")
+        self.duration_lbl.setAlignment(QtCore.Qt.AlignCenter)
+        self.duration_lbl.setFixedHeight(30)
+        self.duration_lbl.setFixedWidth(65)
+        self.animation_panel_horizontal_layout.addWidget(self.duration_lbl)
+
+        self.duration_combo_box = QtWidgets.QComboBox()
+        durations = ['1 ms', '5 ms', '8 ms', '10 ms', '30 ms', '50 ms', '70 ms', '100 ms', '200 ms', '300 ms', '500 ms', '1000 ms']
+        self.duration_combo_box.addItems(durations)
+        self.duration_combo_box.currentIndexChanged.connect(self.change_duration)
+        self.animation_panel_horizontal_layout.addWidget(self.duration_combo_box)
+
+    def create_modes_panel(self):
+
+        self.solver_lbl = QtWidgets.QLabel("solver: ")
+        self.modes_grid_layout.addWidget(self.solver_lbl, 0, 0)
+        self.solver_lbl.setFixedHeight(30)
+        self.solver_lbl.setFixedWidth(50)
+        self.solver_lbl.setAlignment(QtCore.Qt.AlignCenter)
+
+        self.solver_combo_box = QtWidgets.QComboBox()
+        modes = ['Computer', 'User']
+        self.solver_combo_box.addItems(modes)
+        self.solver_combo_box.currentIndexChanged.connect(self.change_main_mode)
+        self.modes_grid_layout.addWidget(self.solver_combo_box, 0, 1)
+
+        self.algorithm_lbl = QtWidgets.QLabel("algorithm: ")
+        self.modes_grid_layout.addWidget(self.algorithm_lbl, 0, 2)
+        self.algorithm_lbl.setFixedHeight(30)
+        self.algorithm_lbl.setFixedWidth(70)
+        self.algorithm_lbl.setAlignment(QtCore.Qt.AlignCenter)
+
+        self.algorithms_combo_box = QtWidgets.QComboBox()
+        algorithms = ['BFS', 'DFS', 'A*', 'UCS', 'ID', 'JPS', 'Bi-BFS', 'Bi-A*', 'Field', 'D* Lite', 'HPA*', 'ALT']
+        self.algorithms_combo_box.addItems(algorithms)
+        self.algorithms_combo_box.currentIndexChanged.connect(self.change_algorithm)
+        self.modes_grid_layout.addWidget(self.algorithms_combo_box, 0, 3)
+
+
+        self.density_lbl = QtWidgets.QLabel("density: ")
+        self.modes_grid_layout.addWidget(self.density_lbl, 1, 0)
+        self.density_lbl.setFixedHeight(30)
+        self.density_lbl.setFixedWidth(60)
+        self.density_lbl.setAlignment(QtCore.Qt.AlignCenter)
+
+        self.enemies_density_combo_box = QtWidgets.QComboBox()
+        densities = ['0.1', '0.2', '0.3', '0.4', '0.5']
+        self.enemies_density_combo_box.addItems(densities)
+        self.enemies_density_combo_box.currentIndexChanged.connect(self.change_density)
+        self.modes_grid_layout.addWidget(self.enemies_density_combo_box, 1, 1)
+
+
+        self.color_lbl = QtWidgets.QLabel("color: ")
+        self.modes_grid_layout.addWidget(self.color_lbl, 1, 2)
+        self.color_lbl.setFixedHeight(30)
+        self.color_lbl.setFixedWidth(60)
+        self.color_lbl.setAlignment(QtCore.Qt.AlignCenter)
+
+        self.colors_combo_box = QtWidgets.QComboBox()
+        colors = ['Black', 'White', 'Red', 'Green', 'Sand', 'Water']
+        self.colors_combo_box.addItems(colors)
+        self.colors_combo_box.currentIndexChanged.connect(self.change_colors_combo_box)
+        self.modes_grid_layout.addWidget(self.colors_combo_box, 1, 3)
+
+
+        self.pattern_lbl = QtWidgets.QLabel("pattern: ")
+        self.modes_grid_layout.addWidget(self.pattern_lbl, 2, 0)
+        self.pattern_lbl.setFixedHeight(30)
+        self.pattern_lbl.setFixedWidth(60)
+        self.pattern_lbl.setAlignment(QtCore.Qt.AlignCenter)
+
+        self.pattern_combo_box = QtWidgets.QComboBox()
+        patterns = ['random', 'backtracker', 'prim', 'kruskal']
+        self.pattern_combo_box.addItems(patterns)
+        self.pattern_combo_box.currentIndexChanged.connect(self.change_pattern)
+        self.modes_grid_layout.addWidget(self.pattern_combo_box, 2, 1)
+
+        self.seed_lbl = QtWidgets.QLabel("seed: ")
+        self.modes_grid_layout.addWidget(self.seed_lbl, 2, 2)
+        self.seed_lbl.setFixedHeight(30)
+        self.seed_lbl.setFixedWidth(60)
+        self.seed_lbl.setAlignment(QtCore.Qt.AlignCenter)
+
+        # each generated board moves the seed on by one; set it back to get
+        # the same board again
+        self.seed_spin_box = QtWidgets.QSpinBox()
+        self.seed_spin_box.setRange(0, 2 ** 31 - 1)
+        self.modes_grid_layout.addWidget(self.seed_spin_box, 2, 3)
+
+    def change_duration(self):
+        duration = self.duration_combo_box.currentText()
+        duration = int(duration.split()[0])
+        self.duration = duration
+
+
+    def change_move_mode(self):
+        mode = self.animate_or_inanimate_move_combo_box.currentText()
+        if mode == 'animate':
+            self.move_mode = MoveMode.Animate
+        if mode == 'inanimate':
+            self.move_mode = MoveMode.InAnimate
+
+
+    def change_pattern(self):
+        self.pattern = self.pattern_combo_box.currentText()
+
+    def change_density(self):
+        density = self.enemies_density_combo_box.currentText()
+        self.enemies_density = float(density)
+
+    def change_main_mode(self):
+        mode = self.solver_combo_box.currentText()
+        if mode == 'Computer':
+            self.mode = Mode.Computer
+            self.clear_search_btn.setEnabled(True)
+            self.algorithms_combo_box.setEnabled(True)
+            self.run_algorithm_btn.setEnabled(True)
+
+        elif mode == 'User':
+            self.mode = Mode.User
+            # moves in the game are not edits; the steps before them no
+            # longer match the board
+            self.history.clear()
+            self.clear_search_btn.setEnabled(False)
+            self.algorithms_combo_box.setEnabled(False)
+            self.run_algorithm_btn.setEnabled(False)
+
+    def is_white(self, i, j):
+        return (not self.is_wall_btn(i, j)) and self.grid_board_colors[i][j] != Colors.Black
+
+    def show_message_box(self, message, type):
+        if type == DialogMode.FailedPathFinding:
+            self.message_box.setIcon(QtWidgets.QMessageBox.Warning)
+        else:
+            self.message_box.setIcon(QtWidgets.QMessageBox.Information)
+        self.message_box.setText(message)
+        self.message_box.show()
+
+    def move_green_btn(self, i, j):
+        x, y = self.green_btn_position
+        if (i, j) == self.red_btn_position:
+            self.show_message_box("You win game", DialogMode.WinGame)
+            self.random_fill_board()
+            return
+        position, color = self.under_player
+        if position != (x, y):
+            # the start was placed by hand, which already painted over its cell
+            color = Colors.White
+        self.under_player = (i, j), self.grid_board_colors[i][j]
+        edits = [((x, y), Colors.Green), ((i, j), self.grid_board_colors[i][j])]
+        self.change_btn_color(x, y, color)
+        self.change_btn_color(i, j, Colors.Green)
+        self.green_btn_position = (i, j)
+        # moves are not undoable, but the planner, caches and indexes still
+        # have to follow the cells they change
+        self.board_changed(edits)
+
+    def move_up(self):
+        i, j = self.green_btn_position
+        if self.is_white(i-1, j):
+            self.move_green_btn(i-1, j)
+
+    def move_down(self):
+        i, j = self.green_btn_position
+        if self.is_white(i+1, j):
+            self.move_green_btn(i+1, j)
+
+    def move_right(self):
+        i, j = self.green_btn_position
+        if self.is_white(i, j+1):
+            self.move_green_btn(i, j+1)
+
+    def move_left(self):
+        i, j = self.green_btn_position
+        if self.is_white(i, j-1):
+            self.move_green_btn(i, j-1)
+
+    def keyPressEvent(self, event):
+        if self.mode == Mode.User:
+            key = event.key()
+            if key == QtCore.Qt.Key.Key_W:
+                self.move_up()
+            if key == QtCore.Qt.Key.Key_S:
+                self.move_down()
+            if key == QtCore.Qt.Key.Key_D:
+                self.move_right()
+            if key == QtCore.Qt.Key.Key_A:
+                self.move_left()
+        # else:
+
+
+    def change_algorithm(self):
+        algo = self.algorithms_combo_box.currentText()
+        if algo == 'BFS':
+            self.algorithm = FindPathAlgorithm.BFS
+        if algo == 'DFS':
+            self.algorithm = FindPathAlgorithm.DFS
+        if algo == 'A*':
+            self.algorithm = FindPathAlgorithm.A_Star
+        if algo == 'UCS':
+            self.algorithm = FindPathAlgorithm.UCS
+        if algo == 'ID':
+            self.algorithm = FindPathAlgorithm.Iterative_Deepening
+        if algo == 'JPS':
+            self.algorithm = FindPathAlgorithm.JPS
+        if algo == 'Bi-BFS':
+            self.algorithm = FindPathAlgorithm.Bidirectional_BFS
+        if algo == 'Bi-A*':
+            self.algorithm = FindPathAlgorithm.Bidirectional_A_Star
+        if algo == 'Field':
+            self.algorithm = FindPathAlgorithm.Distance_Field
+        if algo == 'D* Lite':
+            self.algorithm = FindPathAlgorithm.D_Star_Lite
+        if algo == 'HPA*':
+            self.algorithm = FindPathAlgorithm.HPA_Star
+        if algo == 'ALT':
+            self.algorithm = FindPathAlgorithm.ALT
+
+    def board_grid(self):
+        grid = Grid(self.board_width, self.board_height)
+        for i in range(1, self.board_width - 1):
+            for j in range(1, self.board_height - 1):
+                color = self.grid_board_colors[i][j]
+                if color == Colors.Black:
+                    grid.set_cell(i, j, WALL)
+                elif color in TERRAIN_COSTS:
+                    grid.set_cell(i, j, TERRAIN_COSTS[color])
+        return grid
+
+    def apply_event(self, kind, i, j):
+        if (i, j) == self.green_btn_position or (i, j) == self.red_btn_position:
+            return
+        if kind == EXPAND:
+            self.show_overlay(i, j, Colors.Cyan)
+        elif kind == ENQUEUE:
+            if self.overlay.get((i, j)) != Colors.Cyan:
+                self.show_overlay(i, j, Colors.Frontier)
+        elif kind == PATH:
+            self.show_overlay(i, j, Colors.Purple)
+            self.add_number_to_btn(i, j)
+
+    def show_overlay(self, i, j, color):
+        self.overlay[(i, j)] = color
+        self.board_view.set_cell(i, j, COLOR_CODES[color])
+
+    def play_result(self, grid, result):
+        events = result.events
+        if events is None:
+            events = EventLog.for_path(grid, result.path)
+        self.player.load(events)
+        self.events_slider.setRange(0, len(events))
+        if self.move_mode == MoveMode.Animate:
+            self.change_objects_status_to(False)
+            self.player.play(self.duration)
+        else:
+            self.player.seek(len(events))
+            self.show_phases()
+            self.change_objects_status_to(True)
+
+    def animation_finished(self):
+        if self.last_run is not None:
+            self.show_phases()
+        self.change_objects_status_to(True)
+
+    def increase_path_counter(self):
+        self.counter += 1
+
+    def add_number_to_btn(self, i, j):
+        self.increase_path_counter()
+        self.board_view.set_label(i, j, str(self.counter))
+
+    def emptying_variables(self):
+        self.find_dst = False
+        self.counter = 0
+        self.opened_nodes = 0
+
+    def no_select_src_or_dst(self):
+        if self.green_btn_position is None:
+            self.show_message_box("source is not selected", DialogMode.InformingUser)
+            return True
+        elif self.red_btn_position is None:
+            self.show_message_box("destination is not selected", DialogMode.InformingUser)
+            return True
+        return False
+
+    def change_objects_status_to(self, to):
+        self.run_algorithm_btn.setEnabled(to)
+        self.cancel_btn.setEnabled(not to)
+        self.clear_search_btn.setEnabled(to)
+        self.undo_btn.setEnabled(to)
+        self.redo_btn.setEnabled(to)
+        self.clear_grid_btn.setEnabled(to)
+        self.colors_combo_box.setEnabled(to)
+        self.solver_combo_box.setEnabled(to)
+        self.algorithms_combo_box.setEnabled(to)
+        self.enemies_density_combo_box.setEnabled(to)
+        self.pattern_combo_box.setEnabled(to)
+        self.seed_spin_box.setEnabled(to)
+        self.handy_pattern_btn.setEnabled(to)
+        self.auto_generate_pattern_btn.setEnabled(to)
+        self.duration_combo_box.setEnabled(to)
+        self.animate_or_inanimate_move_combo_box.setEnabled(to)
+        self.board_view.setEnabled(to)
+
+    def run_algorithm(self):
+        self.emptying_variables()
+        self.clear_overlay()
+        if self.no_select_src_or_dst():
+            return
+        grid = self.board_grid()
+        src, dst = self.green_btn_position, self.red_btn_position
+        # built once per board, then kept up to date by grid_cells_pressed
+        if self.components is None:
+            self.components = ComponentIndex(grid.copy())
+        if not self.components.connected(src, dst):
+            self.path_not_found()
+            return
+        self.change_objects_status_to(False)
+        algorithm = self.algorithm
+        profiler = SamplingProfiler() if self.profile_check_box.isChecked() else None
+        self.worker = SearchWorker(lambda progress: timed(self.search_board, grid, src, dst, algorithm, progress),
+                                   self, profiler)
+        self.worker.progressed.connect(self.search_progressed)
+        # the run is reported with the settings it started with
+        self.worker.done.connect(lambda result, seconds: self.search_done(grid, algorithm, src, dst, result, seconds))
+        self.worker.cancelled.connect(self.search_cancelled)
+        self.worker.failed.connect(self.search_failed)
+        self.worker.start()
+
+    def search_board(self, grid, src, dst, algorithm, progress):
+        # runs on the worker thread; the board is disabled until it finishes
+        if algorithm == FindPathAlgorithm.BFS:
+            return search.bfs(grid, src, dst, trace=True, progress=progress)
+        elif algorithm == FindPathAlgorithm.DFS:
+            return search.dfs(grid, src, dst, trace=True, progress=progress)
+        elif algorithm == FindPathAlgorithm.A_Star:
+            return search.a_star(grid, src, dst, trace=True, progress=progress)
+        elif algorithm == FindPathAlgorithm.UCS:
+            return search.ucs(grid, src, dst, trace=True, progress=progress)
+        elif algorithm == FindPathAlgorithm.Iterative_Deepening:
+            return iterative.iddfs(grid, src, dst, trace=True, progress=progress)
+        elif algorithm == FindPathAlgorithm.JPS:
+            if self.jump_table is None:
+                self.jump_table = jump_point.JumpTable(grid)
+            return jump_point.jps(grid, src, dst, trace=True, table=self.jump_table, progress=progress)
+        elif algorithm == FindPathAlgorithm.Bidirectional_BFS:
+            return bidirectional.bidirectional_bfs(grid, src, dst, trace=True, progress=progress)
+        elif algorithm == FindPathAlgorithm.Bidirectional_A_Star:
+            return bidirectional.bidirectional_a_star(grid, src, dst, trace=True, progress=progress)
+        elif algorithm == FindPathAlgorithm.Distance_Field:
+            if self.board_fingerprint is None:
+                self.board_fingerprint = grid.fingerprint()
+            return self.distance_cache.search(grid, src, dst, self.board_fingerprint, progress)
+        elif algorithm == FindPathAlgorithm.D_Star_Lite:
+            return self.replan(grid, src, dst, progress)
+        elif algorithm == FindPathAlgorithm.HPA_Star:
+            # built once per board, then kept up to date by grid_cells_pressed
+            if self.hierarchy is None:
+                self.hierarchy = HierarchicalMap(grid.copy())
+            return self.hierarchy.search(src, dst, trace=True, progress=progress)
+        elif algorithm == FindPathAlgorithm.ALT:
+            # built once per board, then kept up to date by board_changed
+            if self.landmarks is None:
+                self.landmarks = Landmarks(grid.copy(), progress=progress)
+            return search.a_star(grid, src, dst, trace=True, heuristic=self.landmarks, progress=progress)
+
+    def search_progressed(self, opened, frontier):
+        self.open_nodes_lbl.setText(str(opened))
+        self.frontier_lbl.setText(str(frontier))
+
+    def search_done(self, grid, algorithm, src, dst, result, seconds):
+        stats = result.stats
+        self.opened_nodes = stats.opened_nodes
+        self.run_time_lbl.setText(str(seconds))
+        self.open_nodes_lbl.setText(str(self.opened_nodes))
+        self.frontier_lbl.setText(str(stats.frontier_peak))
+        self.pushes_lbl.setText(str(stats.pushes))
+        self.stale_pops_lbl.setText(str(stats.stale_pops))
+        self.path_length_lbl.setText(str(stats.path_length))
+        profiler = self.worker.profiler
+        self.last_run = {
+            'algorithm': algorithm.name,
+            'board': [self.board_width, self.board_height],
+            'source': src,
+            'target': dst,
+            'found': result.found,
+            'seconds': seconds,
+            'stats': stats,
+            'profile': profiler.report() if profiler is not None else None,
+        }
+        self.export_stats_btn.setEnabled(True)
+        self.play_result(grid, result)
+        if not result.found:
+            self.show_message_box("destination can not be reached from source", DialogMode.FailedPathFinding)
+        elif profiler is not None:
+            self.show_message_box(profiler.format_report(), DialogMode.InformingUser)
+
+    def show_phases(self):
+        # render is only known once the result is on the board
+        stats = self.last_run['stats']
+        stats.phases['render'] = self.player.render_ns
+        self.phases_lbl.setText(' / '.join(f"{name} {ns / 1e6:.2f} ms" for name, ns in stats.phases.items()))
+
+    def export_stats(self):
+        if self.last_run is None:
+            return
+        path = QtWidgets.QFileDialog.getSaveFileName(self, "Export run stats", "run.json", "JSON (*.json)")[0]
+        if path:
+            self.save_run(path)
+
+    def save_run(self, path):
+        run = dict(self.last_run, stats=self.last_run['stats'].as_dict())
+        with open(path, 'w') as file:
+            json.dump(run, file, indent=2)
+
+    def path_not_found(self):
+        self.run_time_lbl.setText("0")
+        self.open_nodes_lbl.setText("0")
+        self.frontier_lbl.setText("0")
+        self.pushes_lbl.setText("0")
+        self.stale_pops_lbl.setText("0")
+        self.path_length_lbl.setText("0")
+        self.phases_lbl.setText("")
+        self.player.load(None)
+        self.events_slider.setRange(0, 0)
+        self.show_message_box("destination can not be reached from source", DialogMode.FailedPathFinding)
+
+    def search_cancelled(self):
+        self.run_time_lbl.setText("cancelled")
+        self.change_objects_status_to(True)
+
+    def search_failed(self, message):
+        self.show_message_box(message, DialogMode.InformingUser)
+        self.change_objects_status_to(True)
+
+    def cancel_run(self):
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+        else:
+            self.player.stop()
+
+    def closeEvent(self, event):
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait()
+        super(MainWindow, self).closeEvent(event)
+
+    def replan(self, grid, src, dst, progress=None):
+        # a cancelled plan leaves the planner consistent; the next run resumes it
+        if self.planner is None or self.planner.target != grid.index(*dst):
+            self.planner = DStarLite(grid, src, dst)
+            self.changed_cells = set()
+            return self.planner.plan(progress)
+        changes = [((i, j), grid.cells[grid.index(i, j)]) for i, j in self.changed_cells]
+        self.changed_cells = set()
+        return self.planner.apply_changes(changes, src, progress)
+
+    def load_grid(self, grid):
+        # inverse of board_grid: one color per cell byte, translated to
+        # palette codes a row at a time
+        shades = [Colors.White] * 256
+        shades[WALL] = Colors.Black
+        for color, cost in TERRAIN_COSTS.items():
+            shades[cost] = color
+        codes = bytes(COLOR_CODES[color] for color in shades)
+        rows = []
+        for i in range(self.board_width):
+            row = grid.cells[i * grid.stride:(i + 1) * grid.stride]
+            self.grid_board_colors[i] = [shades[cell] for cell in row]
+            rows.append(row.translate(codes))
+        self.board_view.load(rows)
+        self.overlay = {}
+        self.board_fingerprint = None
+
+    def clear_board(self):
+        self.load_grid(Grid(self.board_width, self.board_height))
+        self.board_view.clear_labels()
+        self.green_btn_position = None
+        self.red_btn_position = None
+        self.jump_table = None
+        self.distance_cache.clear()
+        self.planner = None
+        self.components = None
+        self.hierarchy = None
+        self.landmarks = None
+        self.history.clear()
+        self.player.load(None)
+        self.events_slider.setRange(0, 0)
+
+    def clear_overlay(self):
+        # only the cells the last run colored are visited, not the board, and
+        # each gets its own board color back
+        for i, j in self.overlay:
+            self.board_view.set_cell(i, j, COLOR_CODES[self.grid_board_colors[i][j]])
+        self.overlay = {}
+        self.board_view.clear_labels()
+        self.counter = 0
+
+    def undo(self):
+        # the board is disabled while a search runs or plays back
+        if self.board_view.isEnabled():
+            self.restore_cells(self.history.undo())
+
+    def redo(self):
+        if self.board_view.isEnabled():
+            self.restore_cells(self.history.redo())
+
+    def restore_cells(self, changes):
+        # changes: [(index, color code)] from the history; endpoints follow
+        # the green and red cells they bring back or paint over
+        colors = list(Colors)
+        edits = []
+        for index, code in changes:
+            i, j = divmod(index, self.board_height)
+            color = colors[code]
+            edits.append(((i, j), self.grid_board_colors[i][j]))
+            self.change_btn_color(i, j, color)
+            if color == Colors.Green:
+                self.green_btn_position = (i, j)
+            elif (i, j) == self.green_btn_position:
+                self.green_btn_position = None
+            if color == Colors.Red:
+                self.red_btn_position = (i, j)
+            elif (i, j) == self.red_btn_position:
+                self.red_btn_position = None
+        self.board_changed(edits)
+
+    def random_fill_board(self):
+        # generation needs numpy; nothing else in the window does
+        try:
+            from pathfinding.generation import generate
+        except ImportError:
+            self.show_message_box("generating a board needs numpy", DialogMode.InformingUser)
+            return
+        self.clear_board()
+        seed = self.seed_spin_box.value()
+        grid, source, target = generate(self.pattern, self.board_width, self.board_height,
+                                        self.enemies_density, seed)
+        self.seed_spin_box.setValue(seed + 1)
+        self.load_grid(grid)
+        self.green_btn_position = source
+        self.red_btn_position = target
+        self.change_btn_color(*source, Colors.Green)
+        self.change_btn_color(*target, Colors.Red)
+
+    def change_mode_to_auto_generate(self):
+        self.create_board_mode = CreateBoard.auto
+        self.random_fill_board()
+
+    def change_mode_to_handy(self):
+        self.create_board_mode = CreateBoard.handy
+
+    def change_colors_combo_box(self):
+        color = self.colors_combo_box.currentText()
+        self.pen_color = Colors[color]
+
+    def is_wall_btn(self, i, j):
+        return i == 0 or j == 0 or i == self.board_width - 1 or j == self.board_height - 1
+
+    def change_btn_color(self, i, j, color):
+        # a board edit shows through any search color on the cell
+        self.overlay.pop((i, j), None)
+        self.grid_board_colors[i][j] = color
+        self.board_view.set_cell(i, j, COLOR_CODES[color])
+
+    def paint_cell(self, i, j, color):
+        # an edit that goes into the open undo step
+        old = self.grid_board_colors[i][j]
+        self.history.record(i * self.board_height + j, COLOR_CODES[old], COLOR_CODES[color])
+        self.change_btn_color(i, j, color)
+        return (i, j), old
+
+    def board_changed(self, edits):
+        # edits: [((i, j), color before)]; keeps the search indexes in step
+        # with the board
+        changes = []
+        self.board_fingerprint = None
+        for (i, j), old in edits:
+            color = self.grid_board_colors[i][j]
+            if old == Colors.Black or color == Colors.Black:
+                self.jump_table = None
+                self.distance_cache.clear()
+            self.changed_cells.add((i, j))
+            changes.append(((i, j), WALL if color == Colors.Black else TERRAIN_COSTS.get(color, EMPTY)))
+        if self.components is not None:
+            self.components.apply_changes(changes)
+        if self.hierarchy is not None:
+            self.hierarchy.apply_changes(changes)
+        if self.landmarks is not None:
+            self.landmarks.apply_changes(changes)
+
+    def grid_cells_pressed(self, i, j):
+        if self.create_board_mode == CreateBoard.handy:
+            edits = []
+            if self.pen_color == Colors.Green:
+                if self.grid_board_colors[i][j] == Colors.Red:
+                    self.red_btn_position = None
+                if self.green_btn_position is not None:
+                    x, y = self.green_btn_position
+                    if self.grid_board_colors[x][y] == Colors.Green:
+                        edits.append(self.paint_cell(x, y, Colors.White))
+                self.green_btn_position = (i, j)
+
+            elif self.pen_color == Colors.Red:
+                if self.grid_board_colors[i][j] == Colors.Green:
+                    self.green_btn_position = None
+                if self.red_btn_position is not None:
+                    x, y = self.red_btn_position
+                    if self.grid_board_colors[x][y] == Colors.Red:
+                        edits.append(self.paint_cell(x, y, Colors.White))
+                self.red_btn_position = (i, j)
+            elif (i, j) == self.green_btn_position:
+                self.green_btn_position = None
+            elif (i, j) == self.red_btn_position:
+                self.red_btn_position = None
+            edits.append(self.paint_cell(i, j, self.pen_color))
+            self.board_changed(edits)
+        # if
+
+
+def run(argv=None, height=30, width=20):
+    app = QtWidgets.QApplication(sys.argv if argv is None else argv)
+    window = MainWindow(height, width)
+    return app.exec_()
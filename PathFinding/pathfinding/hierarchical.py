@@ -0,0 +1,339 @@
+from collections import deque
+from heapq import heappop, heappush
+from math import inf
+from time import perf_counter_ns
+
+from pathfinding.events import EXPAND, PATH, event_log
+from pathfinding.progress import PROGRESS_INTERVAL
+from pathfinding.search import SearchResult, SearchStats
+
+CLUSTER_SIZE = 32
+# a free stretch of border longer than this gets a transition at each end
+# instead of one in the middle
+LONG_RUN = 6
+
+
+class Cluster:
+    # One cluster copied out of the board with a ring of wall around it, so
+    # searches inside it need no bounds checks. Searches take and return
+    # local indices; local() and world() convert to and from the board.
+    def __init__(self, grid, top, bottom, left, right, transitions):
+        self.top = top
+        self.left = left
+        self.grid_stride = grid.stride
+        self.stride = right - left + 2
+        self.cells = bytearray((bottom - top + 2) * self.stride)
+        for i in range(top, bottom):
+            start = i * grid.stride + left
+            local = self.local(start)
+            self.cells[local:local + right - left] = grid.cells[start:start + right - left]
+        self.uniform = max(self.cells) <= 1
+        self.offsets = (-self.stride, 1, self.stride, -1)
+        self.transitions = transitions
+        # transition -> [(other transition, cost)], including crossings
+        self.edges = {}
+        # (transition, transition) -> board cells after the first up to the second
+        self.legs = {}
+
+    def local(self, index):
+        i, j = divmod(index, self.grid_stride)
+        return (i - self.top + 1) * self.stride + j - self.left + 1
+
+    def world(self, local):
+        i, j = divmod(local, self.stride)
+        return (i + self.top - 1) * self.grid_stride + j + self.left - 1
+
+    def search(self, start, target=-1, reverse=False):
+        # (distance, parent, expanded) from start, or with reverse to start,
+        # as lists over local indices; a cluster of plain floor is a BFS
+        cells = self.cells
+        offsets = self.offsets
+        distance = [inf] * len(cells)
+        parent = [-1] * len(cells)
+        distance[start] = 0
+        expanded = 0
+        if self.uniform:
+            queue = deque((start,))
+            while queue:
+                index = queue.popleft()
+                expanded += 1
+                if index == target:
+                    break
+                for offset in offsets:
+                    neighbor = index + offset
+                    if cells[neighbor] and distance[neighbor] == inf:
+                        distance[neighbor] = distance[index] + 1
+                        parent[neighbor] = index
+                        queue.append(neighbor)
+            return distance, parent, expanded
+        heap = [(0, start)]
+        while heap:
+            d, index = heappop(heap)
+            if d > distance[index]:
+                continue
+            expanded += 1
+            if index == target:
+                break
+            for offset in offsets:
+                neighbor = index + offset
+                if not cells[neighbor]:
+                    continue
+                new_d = d + (cells[index] if reverse else cells[neighbor])
+                if new_d < distance[neighbor]:
+                    distance[neighbor] = new_d
+                    parent[neighbor] = index
+                    heappush(heap, (new_d, neighbor))
+        return distance, parent, expanded
+
+
+class HierarchicalMap:
+    # HPA* (Botea, Mueller & Schaeffer). The board is cut into square
+    # clusters; every free stretch along the border of two clusters gets one
+    # or two transitions, a pair of facing cells. A query searches the graph
+    # of transition cells and then fills in each hop with a search bounded
+    # to one cluster, so paths are close to, but not always, the shortest.
+    # Stepping onto a cell costs its byte, as in search.ucs.
+    #
+    # Borders are scanned up front, which is cheap. The distances between
+    # the transitions of a cluster are only worked out when a query first
+    # reaches them and are cached after that, like the hops' cell paths.
+    # apply_changes rescans the borders of the edited clusters and drops
+    # only their caches, plus those of neighbors whose side of a border
+    # changed. Like DStarLite, the map owns grid and edits it in place.
+    def __init__(self, grid, cluster_size=CLUSTER_SIZE):
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.rows = -(-(grid.width - 2) // cluster_size)
+        self.columns = -(-(grid.height - 2) // cluster_size)
+        # border key -> [(cell in the first cluster, facing cell in the second)]
+        self.borders = {}
+        # transition cell -> cells facing it across a border
+        self.crossings = {}
+        # (ci, cj) -> Cluster, built on first use
+        self.clusters = {}
+        self.opened = 0
+        for ci in range(self.rows):
+            for cj in range(self.columns):
+                if cj + 1 < self.columns:
+                    self.scan_border(('v', ci, cj))
+                if ci + 1 < self.rows:
+                    self.scan_border(('h', ci, cj))
+
+    def cluster_of(self, index):
+        i, j = divmod(index, self.grid.stride)
+        return (i - 1) // self.cluster_size, (j - 1) // self.cluster_size
+
+    def bounds(self, key):
+        ci, cj = key
+        top = 1 + ci * self.cluster_size
+        left = 1 + cj * self.cluster_size
+        return (top, min(top + self.cluster_size, self.grid.width - 1),
+                left, min(left + self.cluster_size, self.grid.height - 1))
+
+    def border_keys(self, key):
+        # (border key, True when the cluster is the first side of it)
+        ci, cj = key
+        keys = []
+        if cj + 1 < self.columns:
+            keys.append((('v', ci, cj), True))
+        if cj > 0:
+            keys.append((('v', ci, cj - 1), False))
+        if ci + 1 < self.rows:
+            keys.append((('h', ci, cj), True))
+        if ci > 0:
+            keys.append((('h', ci - 1, cj), False))
+        return keys
+
+    def scan_border(self, key):
+        # returns whether the transitions on this border changed
+        kind, ci, cj = key
+        cells = self.grid.cells
+        stride = self.grid.stride
+        top, bottom, left, right = self.bounds((ci, cj))
+        if kind == 'v':
+            firsts = [i * stride + right - 1 for i in range(top, bottom)]
+            across = 1
+        else:
+            firsts = [(bottom - 1) * stride + j for j in range(left, right)]
+            across = stride
+        pairs = []
+        run = []
+        for first in firsts + [-1]:
+            if first >= 0 and cells[first] and cells[first + across]:
+                run.append(first)
+                continue
+            if run:
+                picks = (run[len(run) // 2],) if len(run) <= LONG_RUN else (run[0], run[-1])
+                pairs.extend((pick, pick + across) for pick in picks)
+                run = []
+        old = self.borders.get(key)
+        self.borders[key] = pairs
+        if old == pairs:
+            return False
+        for a, b in old or ():
+            self.crossings[a].discard(b)
+            self.crossings[b].discard(a)
+        for a, b in pairs:
+            self.crossings.setdefault(a, set()).add(b)
+            self.crossings.setdefault(b, set()).add(a)
+        return True
+
+    def cluster(self, key):
+        if key not in self.clusters:
+            transitions = set()
+            for border, first_side in self.border_keys(key):
+                for a, b in self.borders[border]:
+                    transitions.add(a if first_side else b)
+            self.clusters[key] = Cluster(self.grid, *self.bounds(key), transitions)
+        return self.clusters[key]
+
+    def edges(self, node):
+        # every (transition, cost) one hop away: the others of its cluster,
+        # then the cells facing it across a border
+        cluster = self.cluster(self.cluster_of(node))
+        if node not in cluster.edges:
+            cells = self.grid.cells
+            distance, _, expanded = cluster.search(cluster.local(node))
+            self.opened += expanded
+            edges = [(other, distance[cluster.local(other)]) for other in cluster.transitions if other != node]
+            cluster.edges[node] = ([(other, cost) for other, cost in edges if cost != inf]
+                                   + [(other, cells[other]) for other in self.crossings.get(node, ())])
+        return cluster.edges[node]
+
+    def leg(self, start, end):
+        cluster = self.cluster(self.cluster_of(start))
+        if (start, end) not in cluster.legs:
+            parent, expanded = cluster.search(cluster.local(start), cluster.local(end))[1:]
+            self.opened += expanded
+            cluster.legs[start, end] = walk(cluster, parent, cluster.local(end))[::-1]
+        return cluster.legs[start, end]
+
+    def apply_changes(self, changes):
+        # changes: iterable of ((i, j), cell value); border cells are ignored
+        grid = self.grid
+        touched = set()
+        for (i, j), value in changes:
+            if grid.is_border(i, j):
+                continue
+            index = grid.index(i, j)
+            if grid.cells[index] != value:
+                grid.cells[index] = value
+                touched.add(self.cluster_of(index))
+                # the clusters across cache the cost of stepping onto it
+                for other in self.crossings.get(index, ()):
+                    self.clusters.pop(self.cluster_of(other), None)
+        for key in touched:
+            self.clusters.pop(key, None)
+            for border, first_side in self.border_keys(key):
+                if self.scan_border(border):
+                    kind, ci, cj = border
+                    first, second = (ci, cj), (ci, cj + 1) if kind == 'v' else (ci + 1, cj)
+                    self.clusters.pop(second if first_side else first, None)
+
+    def search(self, source, target, trace=False, progress=None):
+        grid = self.grid
+        cells = grid.cells
+        stride = grid.stride
+        self.opened = 0
+        source = grid.index(*source)
+        target = grid.index(*target)
+        events = event_log(grid, trace)
+        if source == target:
+            return self.result([source], 0, events, perf_counter_ns())
+        # hook the endpoints into the graph of their clusters' transitions
+        first = self.cluster(self.cluster_of(source))
+        from_source, source_parent, expanded = first.search(first.local(source))
+        self.opened += expanded
+        start_edges = [(node, from_source[first.local(node)]) for node in first.transitions if node != source]
+        if self.cluster_of(target) == self.cluster_of(source):
+            start_edges.append((target, from_source[first.local(target)]))
+        start_edges = [(node, cost) for node, cost in start_edges if cost != inf]
+        start_edges += [(other, cells[other]) for other in self.crossings.get(source, ())]
+        last = self.cluster(self.cluster_of(target))
+        to_target, toward_target, expanded = last.search(last.local(target), reverse=True)
+        self.opened += expanded
+        goal_edges = {node: to_target[last.local(node)] for node in last.transitions
+                      if node != target and to_target[last.local(node)] != inf}
+
+        ti, tj = divmod(target, stride)
+        si, sj = divmod(source, stride)
+        g_score = {source: 0}
+        parent = {source: -1}
+        closed = set()
+        heap = [(abs(si - ti) + abs(sj - tj), 0, source)]
+        expanded = 0
+        peak = 1
+        stale = 0
+        while heap:
+            f, g, node = heappop(heap)
+            if node in closed:
+                stale += 1
+                continue
+            if node == target:
+                break
+            closed.add(node)
+            expanded += 1
+            if trace:
+                events.add(EXPAND, node)
+            if progress is not None and not expanded % PROGRESS_INTERVAL:
+                progress(expanded + self.opened, len(heap))
+            g = -g
+            edges = start_edges if node == source else self.edges(node)
+            if node in goal_edges:
+                edges = edges + [(target, goal_edges[node])]
+            for neighbor, cost in edges:
+                new_g = g + cost
+                if new_g < g_score.get(neighbor, inf):
+                    g_score[neighbor] = new_g
+                    parent[neighbor] = node
+                    i, j = divmod(neighbor, stride)
+                    heappush(heap, (new_g + abs(i - ti) + abs(j - tj), -new_g, neighbor))
+            if len(heap) > peak:
+                peak = len(heap)
+        # the abstract search's own counts; cells opened in clusters only
+        # add to opened_nodes
+        pushes = expanded + stale + len(heap) + (target in parent)
+        started = perf_counter_ns()
+        if target not in parent:
+            return self.result(None, expanded, events, started, peak, pushes, stale)
+        hops = [target]
+        while hops[-1] != source:
+            hops.append(parent[hops[-1]])
+        hops.reverse()
+
+        # Crossings are single steps and other hops stay inside a cluster.
+        # The endpoint searches already hold the first and last legs.
+        path = [source]
+        for start, end in zip(hops, hops[1:]):
+            if end in self.crossings.get(start, ()):
+                path.append(end)
+            elif start == source:
+                path.extend(walk(first, source_parent, first.local(end))[::-1])
+            elif end == target:
+                path.extend(walk(last, toward_target, last.local(start))[1:] + [target])
+            else:
+                path.extend(self.leg(start, end))
+        return self.result(path, expanded, events, started, peak, pushes, stale)
+
+    def result(self, path, expanded, events, started, frontier_peak=1, pushes=1, stale_pops=0):
+        if path is not None and events is not None:
+            events.extend(PATH, path)
+        if path is not None:
+            path = [self.grid.position(index) for index in path]
+        stats = SearchStats(expanded + self.opened, frontier_peak=frontier_peak, pushes=pushes, stale_pops=stale_pops)
+        stats.phases['reconstruct'] = perf_counter_ns() - started
+        return SearchResult(path, stats, events)
+
+
+def walk(cluster, parent, local):
+    # board cells from local along parent, leaving out the cell it ends on
+    cells = []
+    while parent[local] >= 0:
+        cells.append(cluster.world(local))
+        local = parent[local]
+    return cells
+
+
+def hpa_star(grid, source, target, trace=False, cluster_size=CLUSTER_SIZE, progress=None):
+    # one-off query; keep a HierarchicalMap around to reuse its caches
+    return HierarchicalMap(grid, cluster_size).search(source, target, trace, progress)
@@ -0,0 +1,60 @@
+from array import array
+from collections import deque
+
+
+class EditHistory:
+    # Multi-level undo/redo over a board of one byte code per cell. An
+    # operation keeps only the cells it touched: their indices in an
+    # array('i') and their codes before and after in two bytes objects,
+    # about 6 bytes a cell, so hundreds of steps fit on big boards and undoing
+    # or redoing one costs as much as the operation did. Cells are recorded
+    # until end() closes the operation; a cell recorded twice keeps its first
+    # old code and its last new one.
+    def __init__(self, limit=500):
+        self.done = deque(maxlen=limit)
+        self.undone = []
+        self.pending = {}
+
+    def record(self, index, old, new):
+        if index in self.pending:
+            old = self.pending[index][0]
+        self.pending[index] = (old, new)
+
+    def end(self):
+        # closes the open operation; an operation that changed nothing is
+        # dropped, anything else clears the redo steps
+        pending, self.pending = self.pending, {}
+        changed = [(index, old, new) for index, (old, new) in pending.items() if old != new]
+        if not changed:
+            return False
+        indices, old, new = zip(*changed)
+        self.done.append((array('i', indices), bytes(old), bytes(new)))
+        self.undone = []
+        return True
+
+    def undo(self):
+        # [(index, code)] to write back, [] when there is nothing to undo
+        self.end()
+        if not self.done:
+            return []
+        operation = self.done.pop()
+        self.undone.append(operation)
+        indices, old, new = operation
+        return list(zip(indices, old))
+
+    def redo(self):
+        self.end()
+        if not self.undone:
+            return []
+        operation = self.undone.pop()
+        self.done.append(operation)
+        indices, old, new = operation
+        return list(zip(indices, new))
+
+    def clear(self):
+        self.done.clear()
+        self.undone = []
+        self.pending = {}
+
+    def __len__(self):
+        return len(self.done)
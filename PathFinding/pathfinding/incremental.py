@@ -0,0 +1,184 @@
+from array import array
+from heapq import heappop, heappush
+from math import inf
+from time import perf_counter_ns
+
+from pathfinding.progress import PROGRESS_INTERVAL
+from pathfinding.search import SearchResult, SearchStats
+
+
+class DStarLite:
+    # D* Lite (Koenig & Likhachev, optimized version). It searches backward
+    # from the target and keeps g/rhs between calls, so apply_changes and
+    # move_source only repair the part of the board an edit actually affects.
+    # Stepping onto a cell costs its byte, the same as search.ucs. The planner
+    # owns grid and edits it in place.
+    def __init__(self, grid, source, target):
+        self.grid = grid
+        self.source = grid.index(*source)
+        self.target = grid.index(*target)
+        self.last_source = self.source
+        self.km = 0
+        self.g = array('d', [inf]) * grid.size
+        self.rhs = array('d', [inf]) * grid.size
+        self.heap = []
+        self.queued = {}
+        self.opened_nodes = 0
+        # heap traffic; the entry of a processed cell is only popped later,
+        # together with the outdated ones
+        self.pushes = 0
+        self.pops = 0
+        self.rhs[self.target] = self.best_rhs(self.target)
+        self.update_vertex(self.target)
+
+    def h(self, index):
+        stride = self.grid.stride
+        i, j = divmod(index, stride)
+        si, sj = divmod(self.source, stride)
+        return abs(i - si) + abs(j - sj)
+
+    def key(self, index):
+        best = min(self.g[index], self.rhs[index])
+        return best + self.h(index) + self.km, best
+
+    def push(self, index):
+        key = self.key(index)
+        self.queued[index] = key
+        heappush(self.heap, (key, index))
+        self.pushes += 1
+
+    def update_vertex(self, index):
+        if self.g[index] != self.rhs[index]:
+            self.push(index)
+        else:
+            self.queued.pop(index, None)
+
+    def best_rhs(self, index):
+        # the target costs nothing to reach from itself, unless it is a wall
+        cells = self.grid.cells
+        if not cells[index]:
+            return inf
+        if index == self.target:
+            return 0
+        g = self.g
+        best = inf
+        for offset in self.grid.offsets:
+            neighbor = index + offset
+            cost = cells[neighbor]
+            if cost and cost + g[neighbor] < best:
+                best = cost + g[neighbor]
+        return best
+
+    def top(self):
+        heap = self.heap
+        while heap and self.queued.get(heap[0][1]) != heap[0][0]:
+            heappop(heap)
+            self.pops += 1
+        return heap[0] if heap else None
+
+    def compute_shortest_path(self, progress=None):
+        cells = self.grid.cells
+        offsets = self.grid.offsets
+        g = self.g
+        rhs = self.rhs
+        source = self.source
+        opened = 0
+        while True:
+            top = self.top()
+            if top is None:
+                break
+            key, index = top
+            if key >= self.key(source) and rhs[source] <= g[source]:
+                break
+            new_key = self.key(index)
+            if key < new_key:
+                self.push(index)
+                continue
+            opened += 1
+            # checked before the pop, so a cancelled call leaves a consistent
+            # queue and the next plan() carries on from here
+            if progress is not None and not opened % PROGRESS_INTERVAL:
+                progress(opened, len(self.queued))
+            del self.queued[index]
+            cost = cells[index]
+            if g[index] > rhs[index]:
+                g[index] = rhs[index]
+                for offset in offsets:
+                    neighbor = index + offset
+                    if cells[neighbor] and neighbor != self.target and cost + g[index] < rhs[neighbor]:
+                        rhs[neighbor] = cost + g[index]
+                        self.update_vertex(neighbor)
+            else:
+                old_g = g[index]
+                g[index] = inf
+                for offset in offsets:
+                    neighbor = index + offset
+                    if cells[neighbor] and neighbor != self.target and rhs[neighbor] == cost + old_g:
+                        rhs[neighbor] = self.best_rhs(neighbor)
+                        self.update_vertex(neighbor)
+                rhs[index] = self.best_rhs(index)
+                self.update_vertex(index)
+        self.opened_nodes += opened
+        return opened
+
+    def path(self):
+        # the source may stay overconsistent; its rhs is already its cost
+        if self.rhs[self.source] == inf:
+            return None
+        cells = self.grid.cells
+        offsets = self.grid.offsets
+        g = self.g
+        index = self.source
+        path = [index]
+        while index != self.target and len(path) <= self.grid.size:
+            best, best_cost = -1, inf
+            for offset in offsets:
+                neighbor = index + offset
+                cost = cells[neighbor]
+                if cost and cost + g[neighbor] < best_cost:
+                    best, best_cost = neighbor, cost + g[neighbor]
+            if best < 0:
+                return None
+            index = best
+            path.append(index)
+        if index != self.target:
+            # g has a cycle (a repair cut short); no path is better than a
+            # wrong one
+            return None
+        return [self.grid.position(index) for index in path]
+
+    def plan(self, progress=None):
+        # pushes and stale_pops are for this call only
+        pushes, pops = self.pushes, self.pops
+        opened = self.compute_shortest_path(progress)
+        start = perf_counter_ns()
+        path = self.path()
+        stale_pops = max(0, self.pops - pops - opened)
+        stats = SearchStats(opened, pushes=self.pushes - pushes, stale_pops=stale_pops)
+        stats.phases['reconstruct'] = perf_counter_ns() - start
+        return SearchResult(path, stats)
+
+    def move_source(self, source, progress=None):
+        return self.apply_changes((), source, progress)
+
+    def apply_changes(self, changes, source=None, progress=None):
+        # changes: iterable of ((i, j), cell value); border cells are ignored.
+        # source, if given, is the new start cell for this replan.
+        grid = self.grid
+        if source is not None:
+            self.source = grid.index(*source)
+            self.km += self.h(self.last_source)
+            self.last_source = self.source
+        touched = set()
+        for (i, j), value in changes:
+            if grid.is_border(i, j):
+                continue
+            index = grid.index(i, j)
+            if grid.cells[index] != value:
+                grid.cells[index] = value
+                touched.add(index)
+                touched.update(index + offset for offset in grid.offsets)
+        for index in touched:
+            self.rhs[index] = self.best_rhs(index)
+            self.update_vertex(index)
+        return self.plan(progress)
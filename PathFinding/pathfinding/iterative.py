@@ -0,0 +1,115 @@
+from math import inf
+from time import perf_counter_ns
+
+from pathfinding.events import ENQUEUE, EXPAND, PATH, event_log
+from pathfinding.progress import PROGRESS_INTERVAL
+from pathfinding.search import Heuristic, SearchResult, SearchStats, heuristic_function
+
+TABLE_SIZE = 1 << 16
+
+
+def bounded_dfs(grid, source, target, bound, h, weighted, table_size, events, progress=None):
+    # Depth-first search that only follows moves with g + h <= bound, in the
+    # same neighbor order as search.dfs. Memory is the current path plus a
+    # transposition table holding at most table_size cells, which lets a
+    # cell reached again at no better g be skipped. Once the table is full,
+    # new cells are just not recorded.
+    cells = grid.cells
+    offsets = grid.offsets
+    directions = len(offsets)
+    path = [source]
+    next_direction = [0]
+    g_path = [0]
+    on_path = {source}
+    table = {source: 0}
+    next_bound = inf
+    opened = 0
+    peak = 1
+    while path:
+        index = path[-1]
+        if index == target:
+            return path, next_bound, opened, peak
+        direction = next_direction[-1]
+        if direction == 0:
+            opened += 1
+            if events is not None:
+                events.add(EXPAND, index)
+            if progress is not None and not opened % PROGRESS_INTERVAL:
+                progress(opened, len(path))
+        if direction == directions:
+            path.pop()
+            next_direction.pop()
+            g_path.pop()
+            on_path.discard(index)
+            continue
+        next_direction[-1] = direction + 1
+        neighbor = index + offsets[direction]
+        cost = cells[neighbor]
+        if not cost or neighbor in on_path:
+            continue
+        g = g_path[-1] + (cost if weighted else 1)
+        f = g + h(neighbor)
+        if f > bound:
+            if f < next_bound:
+                next_bound = f
+            continue
+        seen = table.get(neighbor)
+        if seen is not None and seen <= g:
+            continue
+        if seen is not None or len(table) < table_size:
+            table[neighbor] = g
+        path.append(neighbor)
+        next_direction.append(0)
+        g_path.append(g)
+        on_path.add(neighbor)
+        if events is not None:
+            events.add(ENQUEUE, neighbor)
+        if len(path) > peak:
+            peak = len(path)
+    return None, next_bound, opened, peak
+
+
+def iterative_deepening(grid, source, target, trace=False, heuristic=Heuristic.Zero,
+                        weighted=False, table_size=TABLE_SIZE, progress=None):
+    # Repeats bounded_dfs with the bound raised to the smallest f that was cut
+    # off last time. Only the final iteration is kept in the trace (an
+    # ExpansionHook still sees every one); re_expansions counts the openings
+    # spent in earlier iterations, which the final one repeats. Every cell
+    # put on the path is opened unless it is the target, so pushes follows
+    # from opened.
+    source = grid.index(*source)
+    target = grid.index(*target)
+    h = heuristic_function(grid, target, heuristic)
+    bound = h(source)
+    opened = 0
+    iterations = 0
+    peak = 0
+    events = event_log(grid, trace)
+    while True:
+        iterations += 1
+        if events is not None:
+            events.clear()
+        path, next_bound, last_opened, last_peak = bounded_dfs(
+            grid, source, target, bound, h, weighted, table_size, events, progress)
+        opened += last_opened
+        peak = max(peak, last_peak)
+        if path is not None or next_bound == inf:
+            break
+        bound = next_bound
+    start = perf_counter_ns()
+    if path is not None:
+        if events is not None:
+            events.extend(PATH, path)
+        path = [grid.position(index) for index in path]
+    stats = SearchStats(opened, iterations, opened - last_opened, peak, pushes=opened + (path is not None))
+    stats.phases['reconstruct'] = perf_counter_ns() - start
+    return SearchResult(path, stats, events)
+
+
+def iddfs(grid, source, target, trace=False, table_size=TABLE_SIZE, progress=None):
+    return iterative_deepening(grid, source, target, trace, Heuristic.Zero, False, table_size, progress)
+
+
+def ida_star(grid, source, target, trace=False, heuristic=Heuristic.Manhattan, table_size=TABLE_SIZE,
+             progress=None):
+    return iterative_deepening(grid, source, target, trace, heuristic, True, table_size, progress)
@@ -0,0 +1,206 @@
+from array import array
+from heapq import heappop, heappush
+from math import inf
+from time import perf_counter_ns
+
+from pathfinding.events import ENQUEUE, EXPAND, PATH, event_log
+from pathfinding.grid import EMPTY
+from pathfinding.progress import PROGRESS_INTERVAL
+from pathfinding.search import SQRT2, SearchResult, SearchStats, parent_array
+
+# Jump Point Search on the 8-connected board with the same no-corner-cutting
+# rule as search.a_star(diagonal=True), so both give paths of equal cost.
+# Jumping skips cells, so it only holds when every free cell costs the same;
+# boards with terrain costs are refused.
+
+
+def sign(value):
+    return (value > 0) - (value < 0)
+
+
+def octile(grid, a, b):
+    ai, aj = divmod(a, grid.stride)
+    bi, bj = divmod(b, grid.stride)
+    di, dj = abs(ai - bi), abs(aj - bj)
+    if di < dj:
+        di, dj = dj, di
+    return di + (SQRT2 - 1) * dj
+
+
+def perpendiculars(grid, direction):
+    if direction == 1 or direction == -1:
+        return grid.stride, -grid.stride
+    return 1, -1
+
+
+def is_forced(cells, index, direction, side_a, side_b):
+    # a side cell that the previous cell could not reach diagonally
+    back = index - direction
+    return ((cells[index + side_a] and not cells[back + side_a])
+            or (cells[index + side_b] and not cells[back + side_b]))
+
+
+class JumpTable:
+    # JPS+ style precomputation: for every free cell and cardinal direction,
+    # a positive value is the distance to the next jump point, otherwise its
+    # magnitude is how many free cells lie ahead before a wall. Build it again
+    # whenever walls change.
+    def __init__(self, grid):
+        self.grid = grid
+        self.distances = {}
+        cells = grid.cells
+        for direction in grid.offsets:
+            side_a, side_b = perpendiculars(grid, direction)
+            distances = array('i', [0]) * grid.size
+            order = range(grid.size - 1, -1, -1) if direction > 0 else range(grid.size)
+            for index in order:
+                if not cells[index]:
+                    continue
+                ahead = index + direction
+                if not cells[ahead]:
+                    continue
+                if is_forced(cells, ahead, direction, side_a, side_b):
+                    distances[index] = 1
+                elif distances[ahead] > 0:
+                    distances[index] = distances[ahead] + 1
+                else:
+                    distances[index] = distances[ahead] - 1
+            self.distances[direction] = distances
+
+
+def jps(grid, source, target, trace=False, table=None, progress=None):
+    if grid.max_cost() > EMPTY:
+        raise ValueError("jps needs a board without terrain costs; use astar or ucs")
+    cells = grid.cells
+    stride = grid.stride
+    up, right, down, left = grid.offsets
+    source = grid.index(*source)
+    target = grid.index(*target)
+    target_i, target_j = divmod(target, stride)
+    sides = {direction: perpendiculars(grid, direction) for direction in grid.offsets}
+
+    def scan_straight(index, direction):
+        side_a, side_b = sides[direction]
+        while True:
+            index += direction
+            if not cells[index]:
+                return -1
+            if index == target or is_forced(cells, index, direction, side_a, side_b):
+                return index
+
+    def table_straight(index, direction):
+        distance = table.distances[direction][index]
+        i, j = divmod(index, stride)
+        if direction == 1 or direction == -1:
+            steps = (target_j - j) * direction if i == target_i else 0
+        else:
+            steps = (target_i - i) * sign(direction) if j == target_j else 0
+        if 0 < steps <= abs(distance):
+            return target
+        if distance > 0:
+            return index + distance * direction
+        return -1
+
+    straight = scan_straight if table is None else table_straight
+
+    def diagonal(index, vertical, horizontal):
+        while True:
+            if not (cells[index + vertical] and cells[index + horizontal]):
+                return -1
+            index += vertical + horizontal
+            if not cells[index]:
+                return -1
+            if (index == target or straight(index, horizontal) >= 0
+                    or straight(index, vertical) >= 0):
+                return index
+
+    def successors(index):
+        if index == source:
+            for direction in (up, right, down, left):
+                yield straight(index, direction)
+            for vertical in (up, down):
+                for horizontal in (right, left):
+                    yield diagonal(index, vertical, horizontal)
+            return
+        i, j = divmod(index, stride)
+        parent_i, parent_j = divmod(parent[index], stride)
+        vertical = sign(i - parent_i) * stride
+        horizontal = sign(j - parent_j)
+        if vertical and horizontal:
+            yield straight(index, vertical)
+            yield straight(index, horizontal)
+            yield diagonal(index, vertical, horizontal)
+        elif horizontal:
+            yield straight(index, horizontal)
+            for vertical in (up, down):
+                yield straight(index, vertical)
+                yield diagonal(index, vertical, horizontal)
+        else:
+            yield straight(index, vertical)
+            for horizontal in (right, left):
+                yield straight(index, horizontal)
+                yield diagonal(index, vertical, horizontal)
+
+    g_score = array('d', [inf]) * grid.size
+    closed = bytearray(grid.size)
+    parent = parent_array(grid.size)
+    events = event_log(grid, trace)
+    opened = 0
+    g_score[source] = 0
+    heap = [(octile(grid, source, target), 0, source)]
+    peak = 1
+    stale = 0
+    found = False
+    while heap:
+        f, g, index = heappop(heap)
+        if closed[index]:
+            stale += 1
+            continue
+        if index == target:
+            found = True
+            break
+        closed[index] = 1
+        opened += 1
+        if trace:
+            events.add(EXPAND, index)
+        if progress is not None and not opened % PROGRESS_INTERVAL:
+            progress(opened, len(heap))
+        g = -g
+        for jump_point in successors(index):
+            if jump_point < 0 or closed[jump_point]:
+                continue
+            new_g = g + octile(grid, index, jump_point)
+            if new_g < g_score[jump_point]:
+                g_score[jump_point] = new_g
+                parent[jump_point] = index
+                heappush(heap, (new_g + octile(grid, jump_point, target), -new_g, jump_point))
+                if trace:
+                    events.add(ENQUEUE, jump_point)
+        if len(heap) > peak:
+            peak = len(heap)
+    start = perf_counter_ns()
+    path = fill_path(grid, parent, source, target) if found else None
+    if trace and path is not None:
+        events.extend(PATH, [grid.index(i, j) for i, j in path])
+    stats = SearchStats(opened, frontier_peak=peak, pushes=opened + found + stale + len(heap), stale_pops=stale)
+    stats.phases['reconstruct'] = perf_counter_ns() - start
+    return SearchResult(path, stats, events)
+
+
+def fill_path(grid, parent, source, target):
+    # jump points are joined by straight or diagonal runs; list every cell
+    stride = grid.stride
+    jump_points = [target]
+    while jump_points[-1] != source:
+        jump_points.append(parent[jump_points[-1]])
+    jump_points.reverse()
+    path = [source]
+    for start, end in zip(jump_points, jump_points[1:]):
+        start_i, start_j = divmod(start, stride)
+        end_i, end_j = divmod(end, stride)
+        step = sign(end_i - start_i) * stride + sign(end_j - start_j)
+        index = start
+        while index != end:
+            index += step
+            path.append(index)
+    return [grid.position(index) for index in path]
@@ -0,0 +1,186 @@
+import mmap
+import struct
+from array import array
+from collections import Counter, deque
+from time import perf_counter_ns
+
+from pathfinding.components import ComponentIndex
+from pathfinding.search import a_star
+
+LANDMARK_COUNT = 8
+# Landmark tables saved next to a board: a header, the landmark cells, then
+# one int32 table per landmark. The board's fingerprint is in the header, so
+# tables are never used with a board that has changed since.
+LANDMARK_MAGIC = b'PFL1'
+LANDMARK_EXTENSION = '.alt'
+LANDMARK_HEADER = struct.Struct('<4sII64s')
+
+
+class Landmarks:
+    # ALT (A*, landmarks, triangle inequality). Every table holds the BFS
+    # distance from one landmark to every cell, -1 where it cannot reach, and
+    # |d(L, target) - d(L, cell)| is a lower bound on the steps from cell to
+    # target that, unlike Manhattan distance, sees the walls in between.
+    # Landmarks are picked farthest-point first, in the largest component.
+    #
+    # Like ComponentIndex, the tables own grid and apply_changes edits it in
+    # place. A wall knocked down can only shorten distances, which a BFS from
+    # the opened cell repairs exactly. A wall put up can only lengthen them,
+    # so the old tables still give an admissible, consistent bound, just a
+    # looser one; after rebuild_after of those the tables are built again.
+    def __init__(self, grid, count=LANDMARK_COUNT, progress=None, landmarks=None, tables=None):
+        self.grid = grid
+        self.count = count
+        self.rebuild_after = max(16, grid.size // 100)
+        self.walls_added = 0
+        if tables is None:
+            self.build(progress)
+        else:
+            self.landmarks = landmarks
+            self.tables = tables
+
+    def build(self, progress=None):
+        grid = self.grid
+        self.landmarks = []
+        self.tables = []
+        self.walls_added = 0
+        components = ComponentIndex(grid.copy())
+        sizes = Counter(components.find(label) for label in components.labels if label >= 0)
+        if not sizes:
+            return
+        largest = sizes.most_common(1)[0][0]
+        start = next(index for index, label in enumerate(components.labels)
+                     if label >= 0 and components.find(label) == largest)
+        # the first landmark is the cell farthest from an arbitrary one, each
+        # next one the cell farthest from all landmarks so far
+        closest = bfs_distances(grid, start, progress)
+        while len(self.landmarks) < self.count:
+            farthest = max(closest)
+            if farthest <= 0 and self.landmarks:
+                break
+            landmark = closest.index(farthest)
+            table = bfs_distances(grid, landmark, progress)
+            self.landmarks.append(landmark)
+            self.tables.append(table)
+            closest = array('i', map(min, closest, table)) if len(self.landmarks) > 1 else table
+
+    def lower_bound(self, target):
+        # h(index) for search.heuristic_function; tables that cannot reach
+        # target say nothing about it
+        rows = [(table, table[target]) for table in self.tables if table[target] >= 0]
+
+        def h(index):
+            best = 0
+            for table, to_target in rows:
+                distance = table[index]
+                if distance >= 0:
+                    distance -= to_target
+                    if distance < 0:
+                        distance = -distance
+                    if distance > best:
+                        best = distance
+            return best
+        return h
+
+    def apply_changes(self, changes):
+        # changes: iterable of ((i, j), cell value); border cells are ignored
+        grid = self.grid
+        for (i, j), value in changes:
+            if grid.is_border(i, j):
+                continue
+            index = grid.index(i, j)
+            was_free = grid.cells[index] != 0
+            grid.cells[index] = value
+            if value and not was_free:
+                self.open_cell(index)
+            elif was_free and not value:
+                self.walls_added += 1
+        if self.walls_added > self.rebuild_after:
+            self.build()
+
+    def open_cell(self, index):
+        cells = self.grid.cells
+        offsets = self.grid.offsets
+        for table in self.tables:
+            reached = [table[index + offset] for offset in offsets
+                       if cells[index + offset] and table[index + offset] >= 0]
+            if not reached:
+                continue
+            distance = min(reached) + 1
+            if 0 <= table[index] <= distance:
+                continue
+            table[index] = distance
+            queue = deque((index,))
+            while queue:
+                current = queue.popleft()
+                distance = table[current] + 1
+                for offset in offsets:
+                    neighbor = current + offset
+                    if cells[neighbor] and not 0 <= table[neighbor] <= distance:
+                        table[neighbor] = distance
+                        queue.append(neighbor)
+
+    def save(self, path):
+        with open(path, 'wb') as file:
+            file.write(LANDMARK_HEADER.pack(LANDMARK_MAGIC, len(self.landmarks), self.grid.size,
+                                            self.grid.fingerprint().encode()))
+            file.write(array('i', self.landmarks))
+            for table in self.tables:
+                file.write(table)
+
+    @classmethod
+    def load(cls, path, grid):
+        # the tables are mapped copy-on-write, so opening costs nothing and
+        # apply_changes never touches the file
+        with open(path, 'rb') as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        if len(data) < LANDMARK_HEADER.size:
+            raise ValueError(f"{path} is not a landmark file")
+        magic, count, size, fingerprint = LANDMARK_HEADER.unpack_from(data)
+        if magic != LANDMARK_MAGIC:
+            raise ValueError(f"{path} is not a landmark file")
+        if size != grid.size or fingerprint.rstrip(b'\0').decode() != grid.fingerprint():
+            raise ValueError(f"{path} was built for another board")
+        if len(data) < LANDMARK_HEADER.size + 4 * count * (size + 1):
+            raise ValueError(f"{path} is truncated")
+        cells = memoryview(data)[LANDMARK_HEADER.size:].cast('i')
+        landmarks = list(cells[:count])
+        tables = [cells[count + k * size:count + (k + 1) * size] for k in range(count)]
+        return cls(grid, count, landmarks=landmarks, tables=tables)
+
+
+def bfs_distances(grid, start, progress=None):
+    # one BFS level at a time; progress gets the cells reached and the level
+    cells = grid.cells
+    offsets = grid.offsets
+    distances = array('i', [-1]) * grid.size
+    distances[start] = 0
+    frontier = [start]
+    distance = 0
+    reached = 1
+    while frontier:
+        distance += 1
+        level = []
+        for index in frontier:
+            for offset in offsets:
+                neighbor = index + offset
+                if cells[neighbor] and distances[neighbor] < 0:
+                    distances[neighbor] = distance
+                    level.append(neighbor)
+        frontier = level
+        reached += len(level)
+        if progress is not None:
+            progress(reached, len(level))
+    return distances
+
+
+def alt_star(grid, source, target, trace=False, landmarks=None, count=LANDMARK_COUNT, progress=None):
+    # A* with landmark bounds; without prebuilt landmarks they are built here
+    # and the time goes into phases['landmarks']
+    started = perf_counter_ns()
+    if landmarks is None:
+        landmarks = Landmarks(grid, count, progress)
+    built = perf_counter_ns() - started
+    result = a_star(grid, source, target, trace, heuristic=landmarks, progress=progress)
+    result.stats.phases['landmarks'] = built
+    return result
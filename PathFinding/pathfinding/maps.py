@@ -0,0 +1,240 @@
+import mmap
+import os
+import struct
+
+from pathfinding.grid import Grid, WALL, EMPTY
+
+# Plain text boards, one line per row, border included exactly like the GUI
+# board: '#' or '@' is a wall, '.' is floor, '2'-'9' are terrain costs and
+# 'S' / 'G' mark the source and the goal (both on floor).
+WALL_CHARACTERS = '#@'
+SOURCE = 'S'
+GOAL = 'G'
+
+
+def parse_text(text):
+    rows = [line.rstrip('\r') for line in text.splitlines() if line.strip()]
+    if not rows:
+        raise ValueError("empty map")
+    width, height = len(rows), max(len(row) for row in rows)
+    grid = Grid(width, height)
+    source = target = None
+    for i, row in enumerate(rows):
+        for j in range(height):
+            character = row[j] if j < len(row) else '#'
+            if character in WALL_CHARACTERS:
+                value = WALL
+            elif character == '.':
+                value = EMPTY
+            elif character == SOURCE:
+                value, source = EMPTY, (i, j)
+            elif character == GOAL:
+                value, target = EMPTY, (i, j)
+            elif character.isdigit() and character not in '01':
+                value = int(character)
+            else:
+                raise ValueError(f"unknown map character {character!r} at row {i}, column {j}")
+            grid.set_cell(i, j, value)
+    return grid, source, target
+
+
+def format_text(grid, source=None, target=None, path=()):
+    marks = {position: '*' for position in path}
+    if source is not None:
+        marks[source] = SOURCE
+    if target is not None:
+        marks[target] = GOAL
+    rows = []
+    for i in range(grid.width):
+        row = []
+        for j in range(grid.height):
+            value = grid.cells[grid.index(i, j)]
+            if (i, j) in marks:
+                row.append(marks[(i, j)])
+            elif value == WALL:
+                row.append('#')
+            elif value == EMPTY:
+                row.append('.')
+            else:
+                row.append(str(min(value, 9)))
+        rows.append(''.join(row))
+    return '\n'.join(rows) + '\n'
+
+
+def load_text(path):
+    with open(path) as file:
+        return parse_text(file.read())
+
+
+def save_text(path, grid, source=None, target=None):
+    with open(path, 'w') as file:
+        file.write(format_text(grid, source, target))
+
+
+# MovingAI benchmark maps (https://movingai.com/benchmarks): a short header
+# ('type', 'height', 'width', then 'map') and one line per row. '.', 'G' and
+# 'S' (swamp) are passable; '@', 'O', 'T' and 'W' are blocked, since water
+# can only be crossed from water. The map has no border of its own, so it is
+# loaded one cell in: map (y, x) is grid (y + 1, x + 1).
+MOVINGAI_PASSABLE = b'.GS'
+MOVINGAI_BLOCKED = b'@OTW'
+# line breaks survive the translation and anything unknown becomes
+# MOVINGAI_UNKNOWN, so the whole map is translated and checked in one pass
+MOVINGAI_UNKNOWN = 255
+MOVINGAI_CELLS = bytes(EMPTY if code in MOVINGAI_PASSABLE else WALL if code in MOVINGAI_BLOCKED
+                       else code if code in b'\r\n' else MOVINGAI_UNKNOWN for code in range(256))
+
+
+def parse_movingai(data):
+    # data: bytes, or an mmap of the file; the rows are translated to cell
+    # bytes all at once and split once
+    header = {}
+    position = 0
+    while True:
+        end = data.find(b'\n', position)
+        if end < 0:
+            raise ValueError("MovingAI map has no 'map' line")
+        line = data[position:end].strip()
+        position = end + 1
+        if line == b'map':
+            break
+        if line:
+            key, value = line.split(None, 1)
+            header[key.decode()] = value.decode()
+    rows, columns = int(header['height']), int(header['width'])
+    grid = Grid(rows + 2, columns + 2)
+    cells = grid.cells
+    stride = grid.stride
+    body = data[position:].translate(MOVINGAI_CELLS)
+    unknown = body.find(bytes((MOVINGAI_UNKNOWN,)))
+    if unknown >= 0:
+        y = body.count(b'\n', 0, unknown)
+        if y < rows:
+            raise ValueError(f"unknown MovingAI map character in row {y}")
+    lines = body.split(b'\n', rows)
+    for y in range(rows):
+        line = lines[y].rstrip(b'\r') if y < len(lines) else b''
+        if len(line) != columns:
+            raise ValueError(f"MovingAI map row {y} has {len(line)} cells, expected {columns}")
+        start = (y + 1) * stride + 1
+        cells[start:start + columns] = line
+    return grid
+
+
+def load_movingai(path):
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError("empty map")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return parse_movingai(data)
+
+
+def save_movingai(path, grid):
+    # terrain costs are written as plain floor; the border ring is dropped
+    characters = bytes(ord('@') if value == WALL else ord('.') for value in range(256))
+    columns = grid.height - 2
+    with open(path, 'wb') as file:
+        file.write(f"type octile\nheight {grid.width - 2}\nwidth {columns}\nmap\n".encode())
+        for i in range(1, grid.width - 1):
+            start = i * grid.stride + 1
+            file.write(bytes(grid.cells[start:start + columns]).translate(characters) + b'\n')
+
+
+class Scenario:
+    # One line of a MovingAI .scen file, with source and target already in
+    # grid coordinates. optimal_length is the octile distance (diagonals
+    # cost sqrt(2), no corner cutting), comparable to jump_point.jps.
+    def __init__(self, bucket, map_name, map_width, map_height, source, target, optimal_length):
+        self.bucket = bucket
+        self.map_name = map_name
+        self.map_width = map_width
+        self.map_height = map_height
+        self.source = source
+        self.target = target
+        self.optimal_length = optimal_length
+
+
+def load_scenarios(path):
+    scenarios = []
+    with open(path) as file:
+        for line in file:
+            fields = line.split()
+            if not fields or fields[0] == 'version':
+                continue
+            bucket, map_name, map_width, map_height, sx, sy, gx, gy, optimal = fields
+            scenarios.append(Scenario(int(bucket), map_name, int(map_width), int(map_height),
+                                      (int(sy) + 1, int(sx) + 1), (int(gy) + 1, int(gx) + 1), float(optimal)))
+    return scenarios
+
+
+def save_scenarios(path, scenarios):
+    with open(path, 'w') as file:
+        file.write("version 1\n")
+        for scenario in scenarios:
+            (si, sj), (ti, tj) = scenario.source, scenario.target
+            file.write(f"{scenario.bucket}\t{scenario.map_name}\t{scenario.map_width}\t{scenario.map_height}\t"
+                       f"{sj - 1}\t{si - 1}\t{tj - 1}\t{ti - 1}\t{scenario.optimal_length:.8f}\n")
+
+
+# Native binary boards: a 32 byte little-endian header followed by the raw
+# cell bytes exactly as Grid.cells holds them. open_binary maps the file and
+# hands the cells to Grid as a memoryview, so opening costs nothing however
+# big the board is, and every process that opens the same file shares the
+# same page cache pages. -1 marks a missing source or target.
+BINARY_MAGIC = b'PFG1'
+BINARY_EXTENSION = '.pfg'
+BINARY_HEADER = struct.Struct('<4sIIiiiiI')
+
+
+def save_binary(path, grid, source=None, target=None):
+    si, sj = source if source is not None else (-1, -1)
+    ti, tj = target if target is not None else (-1, -1)
+    with open(path, 'wb') as file:
+        file.write(BINARY_HEADER.pack(BINARY_MAGIC, grid.width, grid.height, si, sj, ti, tj, 0))
+        file.write(grid.cells)
+
+
+def open_binary(path, writable=False):
+    # writable maps copy-on-write: edits stay in this process, the file is
+    # never changed
+    with open(path, 'rb') as file:
+        access = mmap.ACCESS_COPY if writable else mmap.ACCESS_READ
+        data = mmap.mmap(file.fileno(), 0, access=access)
+    if len(data) < BINARY_HEADER.size:
+        raise ValueError(f"{path} is not a binary board")
+    magic, width, height, si, sj, ti, tj, _ = BINARY_HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC:
+        raise ValueError(f"{path} is not a binary board")
+    size = width * height
+    if not size:
+        raise ValueError(f"{path} holds an empty board")
+    if len(data) < BINARY_HEADER.size + size:
+        raise ValueError(f"{path} is truncated")
+    cells = memoryview(data)[BINARY_HEADER.size:BINARY_HEADER.size + size]
+    # the searches step to neighbors without bounds checks, so a board whose
+    # border ring is not wall would let them index past the edges
+    if any(cells[:height]) or any(cells[size - height:]) or any(cells[::height]) or any(cells[height - 1::height]):
+        raise ValueError(f"{path} has free cells on its border")
+    source = (si, sj) if si >= 0 else None
+    target = (ti, tj) if ti >= 0 else None
+    return Grid(width, height, cells), source, target
+
+
+def load_map(path):
+    # (grid, source, target) for any supported format, chosen by extension
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.map':
+        return load_movingai(path), None, None
+    if extension == BINARY_EXTENSION:
+        return open_binary(path)
+    return load_text(path)
+
+
+def save_map(path, grid, source=None, target=None):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.map':
+        save_movingai(path, grid)
+    elif extension == BINARY_EXTENSION:
+        save_binary(path, grid, source, target)
+    else:
+        save_text(path, grid, source, target)
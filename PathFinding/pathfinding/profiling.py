@@ -0,0 +1,84 @@
+import os
+import sys
+import threading
+from collections import Counter
+from time import perf_counter_ns
+
+
+def timed(function, *args, **options):
+    # runs one search and fills in stats.phases['search']: the time spent in
+    # it minus the phases the engine timed itself (reconstruct, landmarks)
+    start = perf_counter_ns()
+    result = function(*args, **options)
+    stats = result.stats
+    stats.phases['search'] = perf_counter_ns() - start - sum(stats.phases.values())
+    return result
+
+
+class SamplingProfiler:
+    # Statistical profiler for one thread. A daemon thread looks at the
+    # thread's current frame every interval seconds and counts the function
+    # it is in (self) and every function on its stack (total). Nothing is
+    # hooked into the profiled code, so the search runs at almost full speed
+    # and the counts show where its time goes, give or take the sampling.
+    # The sampler needs the GIL to look, so while it runs the interpreter's
+    # switch interval is lowered to the sampling interval.
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.self_samples = Counter()
+        self.total_samples = Counter()
+        self.samples = 0
+        self.stopped = threading.Event()
+        self.sampler = None
+        self.switch_interval = None
+
+    def start(self, thread_id=None):
+        # thread_id defaults to the calling thread
+        target = threading.get_ident() if thread_id is None else thread_id
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self.switch_interval, self.interval))
+        self.stopped.clear()
+        self.sampler = threading.Thread(target=self.sample, args=(target,), daemon=True)
+        self.sampler.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.sampler is not None:
+            self.sampler.join()
+            self.sampler = None
+            sys.setswitchinterval(self.switch_interval)
+
+    def sample(self, thread_id):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if self.stopped.is_set():
+                # the thread is already in stop(), waiting for this one
+                break
+            if frame is None:
+                continue
+            self.samples += 1
+            self.self_samples[function_label(frame)] += 1
+            seen = set()
+            while frame is not None:
+                label = function_label(frame)
+                if label not in seen:
+                    seen.add(label)
+                    self.total_samples[label] += 1
+                frame = frame.f_back
+
+    def report(self, limit=10):
+        # [(function, self share, total share)], busiest first
+        samples = self.samples or 1
+        return [(label, count / samples, self.total_samples[label] / samples)
+                for label, count in self.self_samples.most_common(limit)]
+
+    def format_report(self, limit=10):
+        lines = [f"{self.samples} samples every {self.interval * 1000:g} ms", "  self  total  function"]
+        for label, self_share, total_share in self.report(limit):
+            lines.append(f"{self_share:6.1%} {total_share:6.1%}  {label}")
+        return '\n'.join(lines)
+
+
+def function_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
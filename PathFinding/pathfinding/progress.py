@@ -0,0 +1,34 @@
+import threading
+from time import perf_counter
+
+# engines call progress once per this many opened cells
+PROGRESS_INTERVAL = 1024
+
+
+class SearchCancelled(Exception):
+    pass
+
+
+class Progress:
+    # Passed to an engine as progress=. The engine calls it every
+    # PROGRESS_INTERVAL openings with (opened, frontier size); a cancelled
+    # token raises SearchCancelled from inside the loop, otherwise report is
+    # called at most once every interval seconds. cancel() may be called from
+    # any thread.
+    def __init__(self, report=None, interval=0.05):
+        self.report = report
+        self.interval = interval
+        self.cancelled = threading.Event()
+        self.last_report = 0.0
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def __call__(self, opened, frontier):
+        if self.cancelled.is_set():
+            raise SearchCancelled()
+        if self.report is not None:
+            now = perf_counter()
+            if now - self.last_report >= self.interval:
+                self.last_report = now
+                self.report(opened, frontier)
@@ -0,0 +1,23 @@
+# Shared by the path server, its client and the command line. Kept free of
+# asyncio and multiprocessing so the other commands do not pay for them.
+DEFAULT_ADDRESS = '127.0.0.1:8765'
+BATCH_SIZE = 64
+# most pairs one request may ask for; the server draws them on its loop
+MAX_PAIRS = 1000
+
+
+def parse_address(address):
+    # 'unix:/path/to/socket' or 'host:port'
+    if address.startswith('unix:'):
+        return 'unix', address[len('unix:'):]
+    host, _, port = address.rpartition(':')
+    if not host or not port.isdigit():
+        raise ValueError(f"address {address!r} is neither unix:PATH nor HOST:PORT")
+    return host, int(port)
+
+
+def percentile(values, fraction):
+    # nearest rank; values must be sorted
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
@@ -0,0 +1,426 @@
+import enum
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from math import inf, sqrt
+from time import perf_counter_ns
+
+from pathfinding.events import ENQUEUE, EXPAND, PATH, event_log
+from pathfinding.progress import PROGRESS_INTERVAL
+
+
+SQRT2 = sqrt(2)
+
+
+class Heuristic(enum.Enum):
+    Manhattan = 1
+    Octile = 2
+    Zero = 3
+
+
+class BucketQueue:
+    # Dial's queue for monotone integer priorities that never run more than
+    # max_step ahead of the current minimum: a ring of max_step + 1 buckets
+    # gives O(1) push and pop.
+    def __init__(self, max_step):
+        self.buckets = [[] for _ in range(max_step + 1)]
+        self.size = 0
+        self.current = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, priority, item):
+        self.buckets[priority % len(self.buckets)].append(item)
+        self.size += 1
+
+    def pop(self):
+        buckets = self.buckets
+        count = len(buckets)
+        bucket = buckets[self.current % count]
+        while not bucket:
+            self.current += 1
+            bucket = buckets[self.current % count]
+        self.size -= 1
+        return self.current, bucket.pop()
+
+
+class SearchStats:
+    # pushes counts every cell put on the frontier, the source included;
+    # stale_pops counts frontier entries thrown away when popped because the
+    # cell had already been opened. phases holds nanoseconds per phase:
+    # 'reconstruct' is filled in by the engines, 'search' by profiling.timed
+    # and 'render' by the GUI.
+    def __init__(self, opened_nodes=0, iterations=1, re_expansions=0, frontier_peak=0, pushes=0, stale_pops=0):
+        self.opened_nodes = opened_nodes
+        self.iterations = iterations
+        self.re_expansions = re_expansions
+        self.frontier_peak = frontier_peak
+        self.pushes = pushes
+        self.stale_pops = stale_pops
+        self.path_length = 0
+        self.phases = {}
+
+    def as_dict(self):
+        return {
+            'opened_nodes': self.opened_nodes,
+            'iterations': self.iterations,
+            're_expansions': self.re_expansions,
+            'frontier_peak': self.frontier_peak,
+            'pushes': self.pushes,
+            'stale_pops': self.stale_pops,
+            'path_length': self.path_length,
+            'phases_ns': dict(self.phases),
+        }
+
+
+class SearchResult:
+    def __init__(self, path, stats, events=None):
+        self.path = path
+        self.stats = stats
+        self.events = events
+        stats.path_length = len(path) - 1 if path else 0
+
+    @property
+    def found(self):
+        return self.path is not None
+
+    @property
+    def expanded(self):
+        return self.events.positions(EXPAND) if self.events is not None else []
+
+
+def build_path(grid, parent, source, target):
+    path = [target]
+    index = target
+    while index != source:
+        index = int(parent[index])
+        path.append(index)
+    path.reverse()
+    return [grid.position(index) for index in path]
+
+
+def parent_array(size):
+    return array('i', [-1]) * size
+
+
+def make_result(grid, parent, source, target, found, opened, events, frontier_peak=0, pushes=0, stale_pops=0):
+    start = perf_counter_ns()
+    path = build_path(grid, parent, source, target) if found else None
+    if events is not None and path is not None:
+        events.extend(PATH, [grid.index(i, j) for i, j in path])
+    stats = SearchStats(opened, frontier_peak=frontier_peak, pushes=pushes, stale_pops=stale_pops)
+    stats.phases['reconstruct'] = perf_counter_ns() - start
+    return SearchResult(path, stats, events)
+
+
+def bfs(grid, source, target, trace=False, progress=None):
+    cells = grid.cells
+    offsets = grid.offsets
+    source = grid.index(*source)
+    target = grid.index(*target)
+    visited = bytearray(grid.size)
+    parent = parent_array(grid.size)
+    events = event_log(grid, trace)
+    opened = 0
+    visited[source] = 1
+    queue = deque((source,))
+    popleft = queue.popleft
+    push = queue.append
+    peak = 1
+    while queue:
+        index = popleft()
+        if index == target:
+            return make_result(grid, parent, source, target, True, opened, events, peak, opened + 1 + len(queue))
+        opened += 1
+        if trace:
+            events.add(EXPAND, index)
+        if progress is not None and not opened % PROGRESS_INTERVAL:
+            progress(opened, len(queue))
+        for offset in offsets:
+            neighbor = index + offset
+            if cells[neighbor] and not visited[neighbor]:
+                visited[neighbor] = 1
+                parent[neighbor] = index
+                push(neighbor)
+                if trace:
+                    events.add(ENQUEUE, neighbor)
+        if len(queue) > peak:
+            peak = len(queue)
+    return make_result(grid, parent, source, target, False, opened, events, peak, opened)
+
+
+def bfs_levels(grid, source, target, trace=False, progress=None):
+    # Level-synchronous BFS: the whole frontier is expanded at once with
+    # NumPy, so the Python loop runs once per level instead of once per cell.
+    # Every cell of the target's parent level is counted as opened.
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("bfs_levels needs numpy")
+    free = np.frombuffer(grid.cells, dtype=np.uint8) != 0
+    offsets = np.array(grid.offsets, dtype=np.int64)
+    source = grid.index(*source)
+    target = grid.index(*target)
+    visited = np.zeros(grid.size, dtype=bool)
+    parent = np.full(grid.size, -1, dtype=np.int32)
+    events = event_log(grid, trace)
+    opened = 0
+    visited[source] = True
+    frontier = np.array([source], dtype=np.int64)
+    found = source == target
+    peak = 1
+    pushes = 1
+    while frontier.size and not found:
+        opened += frontier.size
+        peak = max(peak, int(frontier.size))
+        if progress is not None:
+            progress(opened, int(frontier.size))
+        if trace:
+            events.extend(EXPAND, frontier.tolist())
+        candidates = (frontier[:, None] + offsets).ravel()
+        parents = np.repeat(frontier, offsets.size)
+        mask = free[candidates] & ~visited[candidates]
+        candidates = candidates[mask]
+        parents = parents[mask]
+        # one parent wins per cell; keeping only the winners removes duplicates
+        parent[candidates] = parents
+        frontier = candidates[parent[candidates] == parents]
+        visited[frontier] = True
+        pushes += int(frontier.size)
+        if trace:
+            events.extend(ENQUEUE, frontier.tolist())
+        found = bool(visited[target])
+    return make_result(grid, parent, source, target, found, opened, events, peak, pushes)
+
+
+def dfs(grid, source, target, trace=False, compact=False, progress=None):
+    # Opens cells in the same order as a recursive DFS over grid.offsets.
+    # The default mode pushes every unvisited neighbor and skips stale
+    # entries when they are popped, so each cell is opened once and the stack
+    # holds at most one entry per edge. compact=True walks back through the
+    # parent array instead of keeping a stack, which caps memory at a few
+    # bytes per cell however deep the corridors get.
+    if compact:
+        return dfs_backtracking(grid, source, target, trace, progress)
+    cells = grid.cells
+    # pushed in reverse so the first offset is popped first
+    offsets = grid.offsets[::-1]
+    source = grid.index(*source)
+    target = grid.index(*target)
+    visited = bytearray(grid.size)
+    parent = parent_array(grid.size)
+    events = event_log(grid, trace)
+    opened = 0
+    stack = [source]
+    pop = stack.pop
+    push = stack.append
+    peak = 1
+    stale = 0
+    while stack:
+        index = pop()
+        if visited[index]:
+            stale += 1
+            continue
+        if index == target:
+            return make_result(grid, parent, source, target, True, opened, events, peak,
+                               opened + 1 + stale + len(stack), stale)
+        visited[index] = 1
+        opened += 1
+        if trace:
+            events.add(EXPAND, index)
+        if progress is not None and not opened % PROGRESS_INTERVAL:
+            progress(opened, len(stack))
+        for offset in offsets:
+            neighbor = index + offset
+            if cells[neighbor] and not visited[neighbor]:
+                parent[neighbor] = index
+                push(neighbor)
+                if trace:
+                    events.add(ENQUEUE, neighbor)
+        if len(stack) > peak:
+            peak = len(stack)
+    return make_result(grid, parent, source, target, False, opened, events, peak, opened + stale, stale)
+
+
+def dfs_backtracking(grid, source, target, trace=False, progress=None):
+    cells = grid.cells
+    offsets = grid.offsets
+    directions = len(offsets)
+    source = grid.index(*source)
+    target = grid.index(*target)
+    visited = bytearray(grid.size)
+    # next offset to try for every cell on the current branch
+    next_offset = bytearray(grid.size)
+    parent = parent_array(grid.size)
+    events = event_log(grid, trace)
+    opened = 0
+    index = source
+    visited[source] = 1
+    depth = peak = 1
+    while True:
+        if index == target:
+            return make_result(grid, parent, source, target, True, opened, events, peak, opened + 1)
+        direction = next_offset[index]
+        if direction == 0:
+            opened += 1
+            if trace:
+                events.add(EXPAND, index)
+            if progress is not None and not opened % PROGRESS_INTERVAL:
+                progress(opened, depth)
+        if direction < directions:
+            next_offset[index] = direction + 1
+            neighbor = index + offsets[direction]
+            if cells[neighbor] and not visited[neighbor]:
+                visited[neighbor] = 1
+                parent[neighbor] = index
+                index = neighbor
+                depth += 1
+                if depth > peak:
+                    peak = depth
+        elif index == source:
+            return make_result(grid, parent, source, target, False, opened, events, peak, opened)
+        else:
+            index = parent[index]
+            depth -= 1
+
+
+def heuristic_function(grid, target, heuristic):
+    # anything but a Heuristic is a landmarks.Landmarks, which builds h for
+    # the target from its tables
+    if not isinstance(heuristic, Heuristic):
+        return heuristic.lower_bound(target)
+    stride = grid.stride
+    ti, tj = grid.position(target)
+    if heuristic == Heuristic.Manhattan:
+        def h(index):
+            i, j = divmod(index, stride)
+            return abs(i - ti) + abs(j - tj)
+    elif heuristic == Heuristic.Octile:
+        def h(index):
+            i, j = divmod(index, stride)
+            di, dj = abs(i - ti), abs(j - tj)
+            if di < dj:
+                di, dj = dj, di
+            return di + (SQRT2 - 1) * dj
+    else:
+        def h(index):
+            return 0
+    return h
+
+
+def a_star(grid, source, target, trace=False, heuristic=None, diagonal=False, progress=None):
+    # Heap entries are (f, -g, index): equal f prefers the deeper node, then the
+    # lower index, so runs are deterministic. Improved nodes are pushed again
+    # and outdated entries are dropped when popped (lazy decrease-key).
+    # Stepping onto a cell costs its byte, as in ucs (times SQRT2 for a
+    # diagonal step); no step costs less than its length, so the heuristics
+    # stay admissible and consistent on terrain boards.
+    if heuristic is None:
+        heuristic = Heuristic.Octile if diagonal else Heuristic.Manhattan
+    elif diagonal and not isinstance(heuristic, Heuristic):
+        # a diagonal step is shorter than the two BFS steps the tables count
+        raise ValueError("landmark bounds only hold for 4-connected moves")
+    cells = grid.cells
+    offsets = grid.offsets
+    diagonals = grid.diagonal_moves() if diagonal else ()
+    source = grid.index(*source)
+    target = grid.index(*target)
+    h = heuristic_function(grid, target, heuristic)
+    g_score = array('d', [inf]) * grid.size
+    closed = bytearray(grid.size)
+    parent = parent_array(grid.size)
+    events = event_log(grid, trace)
+    opened = 0
+    g_score[source] = 0
+    heap = [(h(source), 0, source)]
+    peak = 1
+    stale = 0
+    while heap:
+        f, g, index = heappop(heap)
+        if closed[index]:
+            stale += 1
+            continue
+        if index == target:
+            return make_result(grid, parent, source, target, True, opened, events, peak,
+                               opened + 1 + stale + len(heap), stale)
+        closed[index] = 1
+        opened += 1
+        if trace:
+            events.add(EXPAND, index)
+        if progress is not None and not opened % PROGRESS_INTERVAL:
+            progress(opened, len(heap))
+        g = -g
+        for offset in offsets:
+            neighbor = index + offset
+            cost = cells[neighbor]
+            if cost and g + cost < g_score[neighbor]:
+                new_g = g + cost
+                g_score[neighbor] = new_g
+                parent[neighbor] = index
+                heappush(heap, (new_g + h(neighbor), -new_g, neighbor))
+                if trace:
+                    events.add(ENQUEUE, neighbor)
+        if diagonals:
+            for offset, side_a, side_b in diagonals:
+                neighbor = index + offset
+                new_g = g + SQRT2 * cells[neighbor]
+                if (cells[neighbor] and cells[index + side_a] and cells[index + side_b]
+                        and new_g < g_score[neighbor]):
+                    g_score[neighbor] = new_g
+                    parent[neighbor] = index
+                    heappush(heap, (new_g + h(neighbor), -new_g, neighbor))
+                    if trace:
+                        events.add(ENQUEUE, neighbor)
+        if len(heap) > peak:
+            peak = len(heap)
+    return make_result(grid, parent, source, target, False, opened, events, peak, opened + stale, stale)
+
+
+def ucs(grid, source, target, trace=False, progress=None):
+    # Uniform-cost search where stepping onto a cell costs its byte value.
+    cells = grid.cells
+    offsets = grid.offsets
+    source = grid.index(*source)
+    target = grid.index(*target)
+    g_score = array('q', [-1]) * grid.size
+    closed = bytearray(grid.size)
+    parent = parent_array(grid.size)
+    events = event_log(grid, trace)
+    opened = 0
+    queue = BucketQueue(grid.max_cost())
+    push = queue.push
+    pop = queue.pop
+    g_score[source] = 0
+    push(0, source)
+    peak = 1
+    stale = 0
+    while queue:
+        g, index = pop()
+        if closed[index]:
+            stale += 1
+            continue
+        if index == target:
+            return make_result(grid, parent, source, target, True, opened, events, peak,
+                               opened + 1 + stale + len(queue), stale)
+        closed[index] = 1
+        opened += 1
+        if trace:
+            events.add(EXPAND, index)
+        if progress is not None and not opened % PROGRESS_INTERVAL:
+            progress(opened, len(queue))
+        for offset in offsets:
+            neighbor = index + offset
+            cost = cells[neighbor]
+            if cost and not closed[neighbor]:
+                new_g = g + cost
+                old_g = g_score[neighbor]
+                if old_g < 0 or new_g < old_g:
+                    g_score[neighbor] = new_g
+                    parent[neighbor] = index
+                    push(new_g, neighbor)
+                    if trace:
+                        events.add(ENQUEUE, neighbor)
+        if len(queue) > peak:
+            peak = len(queue)
+    return make_result(grid, parent, source, target, False, opened, events, peak, opened + stale, stale)
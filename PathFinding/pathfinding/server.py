@@ -0,0 +1,338 @@
+import asyncio
+import json
+import os
+import random
+import signal
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from pathfinding.components import ComponentIndex
+from pathfinding.grid import Grid
+from pathfinding.landmarks import Landmarks
+from pathfinding.maps import load_map
+from pathfinding.protocol import BATCH_SIZE, MAX_PAIRS, parse_address, percentile
+from pathfinding.solvers import SOLVERS, solve
+
+# latencies kept for the stats request
+LATENCY_WINDOW = 10000
+
+# boards attached in this worker process, by shared memory name
+worker_boards = {}
+
+
+def solve_batch(memory_name, width, height, algorithm, queries, live=None):
+    # runs in a worker: the board is mapped from shared memory the first
+    # time it is seen and kept for the batches after it, and so are its
+    # landmark tables once an alt query needs them. live names the boards
+    # the server still has; the others are replaced or closed and let go.
+    if live is not None:
+        for name in [name for name in worker_boards if name not in live]:
+            worker_boards.pop(name)['memory'].close()
+    board = worker_boards.get(memory_name)
+    if board is None:
+        memory = shared_memory.SharedMemory(name=memory_name)
+        board = worker_boards[memory_name] = {'memory': memory, 'grid': Grid(width, height, memory.buf)}
+    grid = board['grid']
+    options = {}
+    if algorithm == 'alt':
+        if 'landmarks' not in board:
+            board['landmarks'] = Landmarks(grid)
+        options['landmarks'] = board['landmarks']
+    results = []
+    for source, target in queries:
+        result = solve(grid, algorithm, source, target, **options)
+        results.append((result.path, result.stats.opened_nodes))
+    return results
+
+
+class Board:
+    # One loaded board: its cells in shared memory for the workers, its
+    # components for answering unreachable pairs at once, and the queries
+    # waiting for the next batch.
+    def __init__(self, name, grid):
+        self.name = name
+        self.grid = grid
+        self.memory = shared_memory.SharedMemory(create=True, size=grid.size)
+        self.memory.buf[:grid.size] = grid.cells
+        self.components = ComponentIndex(grid.copy())
+        # free cells for the pairs request, found here and not on the loop
+        self.free_cells = array('i', (index for index, cell in enumerate(grid.cells) if cell))
+        self.pending = deque()
+        self.scheduled = False
+        self.in_flight = 0
+        self.retired = False
+
+    @classmethod
+    def open(cls, name, path):
+        return cls(name, load_map(path)[0])
+
+    def close(self):
+        self.memory.close()
+        self.memory.unlink()
+
+    def free(self, position):
+        i, j = position
+        return 0 <= i < self.grid.width and 0 <= j < self.grid.height and self.grid.cells[self.grid.index(i, j)] != 0
+
+
+class PathServer:
+    # JSON-lines path queries over a Unix socket or local TCP. Queries wait
+    # in their board's queue and go to the process pool in batches of up to
+    # batch_size queries with the same algorithm. At most one batch per
+    # worker is out at a time, so while the workers are busy the queue fills
+    # up and the next batch takes everything that arrived meanwhile. A query
+    # on an idle server still goes on the next loop turn (or batch_window
+    # seconds later). The loop itself only parses, checks and answers, so it
+    # never waits on a search.
+    #
+    # Requests and their answers ("id" is echoed back):
+    #   {"board": name, "algorithm": "astar", "source": [i, j], "target": [i, j]}
+    #     -> found, path, opened_nodes, latency_ms, queue_depth, batch
+    #   {"op": "load", "board": name, "path": map file}
+    #   {"op": "boards"}, {"op": "stats"}
+    #   {"op": "pairs", "board": name, "count": n, "seed": s}: up to
+    #     MAX_PAIRS connected pairs of free cells, for load tests
+    def __init__(self, workers=None, batch_size=BATCH_SIZE, batch_window=0.0):
+        self.boards = {}
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(self.workers)
+        self.idle = self.workers
+        # replaced boards that still have queries to answer
+        self.retired = []
+        self.queue_depth = 0
+        self.requests = 0
+        self.batches = 0
+        self.batched_queries = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def load(self, name, path):
+        self.add(Board.open(name, path))
+
+    def add(self, board):
+        old = self.boards.get(board.name)
+        self.boards[board.name] = board
+        if old is not None:
+            # queries still waiting on the old board finish on it first
+            if old.pending or old.in_flight:
+                old.retired = True
+                self.retired.append(old)
+            else:
+                old.close()
+
+    def close(self):
+        self.executor.shutdown()
+        for board in list(self.boards.values()) + self.retired:
+            board.close()
+        self.boards = {}
+        self.retired = []
+
+    async def serve(self, address):
+        kind, where = parse_address(address)
+        if kind == 'unix':
+            server = await asyncio.start_unix_server(self.handle_connection, where)
+        else:
+            server = await asyncio.start_server(self.handle_connection, kind, where)
+        try:
+            # SIGTERM stops the server as cleanly as Ctrl+C
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except NotImplementedError:
+            pass
+        try:
+            async with server:
+                await server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if kind == 'unix' and os.path.exists(where):
+                os.remove(where)
+
+    async def handle_connection(self, reader, writer):
+        lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    # every request gets its own task, so pipelined queries
+                    # from one client can share a batch
+                    task = asyncio.create_task(self.answer(line, writer, lock))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def answer(self, line, writer, lock):
+        arrived = time.perf_counter()
+        request = {}
+        try:
+            request = json.loads(line)
+            response = await self.dispatch(request, arrived)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as error:
+            response = {'error': str(error)}
+        if isinstance(request, dict) and 'id' in request:
+            response['id'] = request['id']
+        async with lock:
+            writer.write(json.dumps(response).encode() + b'\n')
+            await writer.drain()
+
+    async def dispatch(self, request, arrived):
+        op = request.get('op', 'query')
+        if op == 'query':
+            return await self.query(request, arrived)
+        if op == 'load':
+            # reading the map and labelling components happen off the loop
+            board = await asyncio.get_running_loop().run_in_executor(
+                None, Board.open, request['board'], request['path'])
+            self.add(board)
+            return {'board': board.name}
+        if op == 'boards':
+            return {'boards': {name: [board.grid.width, board.grid.height] for name, board in self.boards.items()}}
+        if op == 'stats':
+            return self.stats()
+        if op == 'pairs':
+            count = request.get('count', 100)
+            if not isinstance(count, int) or not 0 <= count <= MAX_PAIRS:
+                raise ValueError(f"count must be a number from 0 to {MAX_PAIRS}")
+            return {'pairs': self.pairs(self.board(request['board']), count, request.get('seed'))}
+        raise ValueError(f"unknown op {op!r}")
+
+    def board(self, name):
+        board = self.boards.get(name)
+        if board is None:
+            raise ValueError(f"unknown board {name!r}")
+        return board
+
+    async def query(self, request, arrived):
+        board = self.board(request['board'])
+        algorithm = request.get('algorithm', 'astar')
+        if algorithm not in SOLVERS:
+            raise ValueError(f"unknown algorithm {algorithm!r}, expected one of {', '.join(SOLVERS)}")
+        source = tuple(request['source'])
+        target = tuple(request['target'])
+        for position in (source, target):
+            if not board.free(position):
+                raise ValueError(f"{list(position)} is not a free cell of {board.name}")
+        self.requests += 1
+        depth = self.queue_depth
+        if not board.components.connected(source, target):
+            path, opened, batch = None, 0, 0
+        else:
+            future = asyncio.get_running_loop().create_future()
+            board.pending.append((algorithm, source, target, future))
+            self.queue_depth += 1
+            if not board.scheduled:
+                board.scheduled = True
+                asyncio.get_running_loop().call_later(self.batch_window, self.flush, board)
+            try:
+                path, opened, batch = await future
+            finally:
+                self.queue_depth -= 1
+        latency = time.perf_counter() - arrived
+        self.latencies.append(latency)
+        return {
+            'found': path is not None,
+            'path': path,
+            'opened_nodes': opened,
+            'latency_ms': latency * 1000,
+            'queue_depth': depth,
+            'batch': batch,
+        }
+
+    def flush(self, board):
+        board.scheduled = False
+        while board.pending and self.idle:
+            # the oldest query's algorithm goes first; other queries keep
+            # their place for the next batch
+            algorithm = board.pending[0][0]
+            batch = []
+            rest = deque()
+            for query in board.pending:
+                if query[0] == algorithm and len(batch) < self.batch_size:
+                    batch.append(query[1:])
+                else:
+                    rest.append(query)
+            board.pending = rest
+            self.idle -= 1
+            asyncio.create_task(self.run_batch(board, algorithm, batch))
+
+    async def run_batch(self, board, algorithm, queries):
+        self.batches += 1
+        self.batched_queries += len(queries)
+        board.in_flight += 1
+        loop = asyncio.get_running_loop()
+        live = [waiting.memory.name for waiting in list(self.boards.values()) + self.retired]
+        try:
+            results = await loop.run_in_executor(
+                self.executor, solve_batch, board.memory.name, board.grid.width, board.grid.height,
+                algorithm, [(source, target) for source, target, future in queries], live)
+        except Exception as error:
+            for source, target, future in queries:
+                if not future.done():
+                    future.set_exception(ValueError(f"search failed: {error}"))
+            return
+        finally:
+            board.in_flight -= 1
+            self.idle += 1
+            if board.retired and not board.in_flight and not board.pending:
+                board.close()
+                self.retired.remove(board)
+            for waiting in [board] + self.retired + list(self.boards.values()):
+                if waiting.pending and self.idle:
+                    self.flush(waiting)
+        for (source, target, future), (path, opened) in zip(queries, results):
+            if not future.done():
+                future.set_result((path, opened, len(queries)))
+
+    def pairs(self, board, count, seed=None):
+        rng = random.Random(seed)
+        grid = board.grid
+        free = board.free_cells
+        if not free:
+            raise ValueError(f"{board.name} has no free cells")
+        pairs = []
+        for _ in range(count * 100):
+            if len(pairs) == count:
+                break
+            source = grid.position(rng.choice(free))
+            target = grid.position(rng.choice(free))
+            if board.components.connected(source, target):
+                pairs.append((source, target))
+        return pairs
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'mean_batch': self.batched_queries / self.batches if self.batches else 0.0,
+            'queue_depth': self.queue_depth,
+            'latency_ms': {
+                'p50': percentile(latencies, 0.5) * 1000,
+                'p99': percentile(latencies, 0.99) * 1000,
+                'max': (latencies[-1] if latencies else 0.0) * 1000,
+            },
+        }
+
+
+def serve(address, boards, workers=None, batch_size=BATCH_SIZE, batch_window=0.0):
+    # boards: {name: map path}; blocks until interrupted
+    server = PathServer(workers, batch_size, batch_window)
+    try:
+        for name, path in boards.items():
+            server.load(name, path)
+        asyncio.run(server.serve(address))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
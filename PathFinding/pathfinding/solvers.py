@@ -0,0 +1,22 @@
+from pathfinding import bidirectional, hierarchical, iterative, jump_point, landmarks, search
+from pathfinding.profiling import timed
+
+SOLVERS = {
+    'bfs': search.bfs,
+    'dfs': search.dfs,
+    'astar': search.a_star,
+    'ucs': search.ucs,
+    'id': iterative.iddfs,
+    'idastar': iterative.ida_star,
+    'jps': jump_point.jps,
+    'bibfs': bidirectional.bidirectional_bfs,
+    'biastar': bidirectional.bidirectional_a_star,
+    'hpa': hierarchical.hpa_star,
+    'alt': landmarks.alt_star,
+}
+
+
+def solve(grid, algorithm, source, target, **options):
+    if algorithm not in SOLVERS:
+        raise ValueError(f"unknown algorithm {algorithm!r}, expected one of {', '.join(SOLVERS)}")
+    return timed(SOLVERS[algorithm], grid, source, target, **options)
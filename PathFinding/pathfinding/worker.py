@@ -0,0 +1,43 @@
+from time import perf_counter
+
+from PyQt5 import QtCore
+
+from pathfinding.progress import Progress, SearchCancelled
+
+
+class SearchWorker(QtCore.QThread):
+    # Runs function(progress) off the GUI thread. progressed is emitted from
+    # the worker at most every 50 ms and reaches the window as a queued
+    # signal; cancel() makes the engine raise SearchCancelled at its next
+    # progress check, which ends the thread with cancelled instead of done.
+    # A SamplingProfiler, if given, samples the worker thread for the run.
+    progressed = QtCore.pyqtSignal(int, int)
+    done = QtCore.pyqtSignal(object, float)
+    cancelled = QtCore.pyqtSignal()
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, function, parent=None, profiler=None):
+        super(SearchWorker, self).__init__(parent)
+        self.function = function
+        self.progress = Progress(self.progressed.emit)
+        self.profiler = profiler
+
+    def cancel(self):
+        self.progress.cancel()
+
+    def run(self):
+        if self.profiler is not None:
+            self.profiler.start()
+        start = perf_counter()
+        try:
+            result = self.function(self.progress)
+        except SearchCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as error:
+            self.failed.emit(f"{type(error).__name__}: {error}")
+            return
+        finally:
+            if self.profiler is not None:
+                self.profiler.stop()
+        self.done.emit(result, perf_counter() - start)
@@ -0,0 +1,94 @@
+import random
+from heapq import heappop, heappush
+from math import inf, isclose
+
+from pathfinding.grid import Grid
+from pathfinding.search import SQRT2
+
+# Shared helpers for the solver tests: random boards, a plain Dijkstra to
+# compare against and the cost of a returned path.
+
+
+def random_board(rng, width, height, density=0.25, costs=(1,)):
+    grid = Grid(width, height)
+    for i in range(1, width - 1):
+        for j in range(1, height - 1):
+            grid.set_cell(i, j, 0 if rng.random() < density else rng.choice(costs))
+    return grid
+
+
+def random_cases(seed, count, size=(6, 24), density=0.25, costs=(1,)):
+    # (grid, source, target) with both endpoints free; not always connected
+    rng = random.Random(seed)
+    cases = []
+    while len(cases) < count:
+        grid = random_board(rng, rng.randint(*size), rng.randint(*size), density, costs)
+        free = [grid.position(index) for index in range(grid.size) if grid.cells[index]]
+        if len(free) >= 2:
+            source, target = rng.sample(free, 2)
+            cases.append((grid, source, target))
+    return cases
+
+
+def dijkstra(grid, source, target, diagonal=False):
+    # cost of the cheapest path, None when there is none
+    cells = grid.cells
+    moves = [(offset, 1, None, None) for offset in grid.offsets]
+    if diagonal:
+        moves += [(offset, SQRT2, side_a, side_b) for offset, side_a, side_b in grid.diagonal_moves()]
+    source = grid.index(*source)
+    target = grid.index(*target)
+    distance = [inf] * grid.size
+    distance[source] = 0
+    heap = [(0, source)]
+    while heap:
+        cost, index = heappop(heap)
+        if index == target:
+            return cost
+        if cost > distance[index]:
+            continue
+        for offset, length, side_a, side_b in moves:
+            neighbor = index + offset
+            if not cells[neighbor]:
+                continue
+            if side_a is not None and not (cells[index + side_a] and cells[index + side_b]):
+                continue
+            new_cost = cost + length * cells[neighbor]
+            if new_cost < distance[neighbor]:
+                distance[neighbor] = new_cost
+                heappush(heap, (new_cost, neighbor))
+    return None
+
+
+def path_cost(grid, path, diagonal=False):
+    # checks that path is a walk over free cells and returns its cost
+    cost = 0
+    for (ai, aj), (bi, bj) in zip(path, path[1:]):
+        step = abs(ai - bi) + abs(aj - bj)
+        assert not grid.is_wall(bi, bj)
+        if step == 2 and ai != bi and aj != bj:
+            assert diagonal and not grid.is_wall(ai, bj) and not grid.is_wall(bi, aj)
+            cost += SQRT2 * grid.cells[grid.index(bi, bj)]
+        else:
+            assert step == 1
+            cost += grid.cells[grid.index(bi, bj)]
+    return cost
+
+
+def assert_optimal(grid, source, target, path, diagonal=False):
+    best = dijkstra(grid, source, target, diagonal)
+    if best is None:
+        assert path is None
+        return
+    assert path is not None and path[0] == source and path[-1] == target
+    assert isclose(path_cost(grid, path, diagonal), best)
+
+
+def assert_valid(grid, source, target, path, diagonal=False):
+    # for solvers that do not promise the shortest path: a path exactly when
+    # Dijkstra finds one, and a walk over free cells from source to target
+    if dijkstra(grid, source, target, diagonal) is None:
+        assert path is None
+        return
+    assert path is not None and path[0] == source and path[-1] == target
+    path_cost(grid, path, diagonal)
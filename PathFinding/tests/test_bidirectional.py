@@ -0,0 +1,12 @@
+from pathfinding.bidirectional import bidirectional_a_star, bidirectional_bfs
+from tests.boards import assert_optimal, random_cases
+
+
+def test_bidirectional_bfs_matches_dijkstra():
+    for grid, source, target in random_cases(10, 80):
+        assert_optimal(grid, source, target, bidirectional_bfs(grid, source, target).path)
+
+
+def test_bidirectional_a_star_matches_dijkstra_on_terrain():
+    for grid, source, target in random_cases(11, 80, costs=(1, 1, 3, 7)):
+        assert_optimal(grid, source, target, bidirectional_a_star(grid, source, target).path)
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from pathfinding.cli import main
+
+BOARD = "#####\n#S3G#\n#...#\n#####\n"
+
+
+@pytest.fixture
+def board(tmp_path):
+    path = tmp_path / 'board.txt'
+    path.write_text(BOARD)
+    return str(path)
+
+
+def test_solve(board, capsys):
+    assert main(['solve', '--map', board, '--algo', 'ucs', '--json']) == 0
+    assert '"found": true' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('position', ['--source=9,9', '--source=0,0', '--target=2,-1'])
+def test_solve_rejects_walls_and_cells_off_the_board(board, capsys, position):
+    assert main(['solve', '--map', board, position]) == 2
+    assert 'is a wall or outside the board' in capsys.readouterr().err
+
+
+def test_solve_reports_a_refused_board(board, capsys):
+    assert main(['solve', '--map', board, '--algo', 'jps']) == 2
+    assert 'terrain' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('position', ['--goal=0,2', '--agent=5,5'])
+def test_flow_rejects_walls_and_cells_off_the_board(board, capsys, position):
+    assert main(['flow', '--map', board, position]) == 2
+    assert 'is a wall or outside the board' in capsys.readouterr().err
+
+
+def test_alt_keeps_its_tables_next_to_the_map(board, capsys):
+    assert main(['solve', '--map', board, '--algo', 'alt']) == 0
+    assert os.path.exists(board + '.alt')
+    assert main(['solve', '--map', board, '--algo', 'alt']) == 0
+
+
+def test_alt_runs_when_its_tables_cannot_be_saved(board, capsys):
+    # a directory in the way fails the save like a read-only one would
+    os.mkdir(board + '.alt')
+    assert main(['solve', '--map', board, '--algo', 'alt']) == 0
+    captured = capsys.readouterr()
+    assert 'alt: path length' in captured.out
+    assert 'landmark tables not saved' in captured.err
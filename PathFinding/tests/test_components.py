@@ -0,0 +1,46 @@
+import random
+
+from pathfinding.components import ComponentIndex
+from tests.boards import random_board
+
+
+def assert_same_components(index, grid):
+    # the same partition of the free cells as an index built from scratch
+    fresh = ComponentIndex(grid.copy())
+    assert index.count == fresh.count
+    pairs = {}
+    for cell in range(grid.size):
+        position = grid.position(cell)
+        assert (index.component(position) < 0) == (not grid.cells[cell])
+        if grid.cells[cell]:
+            assert pairs.setdefault(fresh.component(position), index.component(position)) == index.component(position)
+    assert len(set(pairs.values())) == len(pairs)
+
+
+def test_edits_match_a_fresh_index():
+    rng = random.Random(34)
+    for density in (0.2, 0.4, 0.6):
+        grid = random_board(rng, 16, 18, density)
+        index = ComponentIndex(grid.copy())
+        free = [(i, j) for i in range(grid.width) for j in range(grid.height)]
+        for _ in range(60):
+            changes = [(rng.choice(free), rng.choice((0, 0, 1, 3))) for _ in range(rng.randint(1, 4))]
+            for (i, j), value in changes:
+                grid.set_cell(i, j, value)
+            index.apply_changes(changes)
+            assert_same_components(index, grid)
+            source, target = rng.sample(free, 2)
+            fresh = ComponentIndex(grid.copy())
+            assert index.connected(source, target) == fresh.connected(source, target)
+
+
+def test_a_wall_across_a_corridor_splits_it():
+    grid = random_board(random.Random(35), 3, 9, 0.0)
+    index = ComponentIndex(grid.copy())
+    assert index.count == 1 and index.connected((1, 1), (1, 7))
+    index.apply_changes([((1, 4), 0)])
+    assert index.count == 2 and not index.connected((1, 1), (1, 7))
+    index.apply_changes([((1, 1), 0)])
+    assert index.count == 2
+    index.apply_changes([((1, 4), 1)])
+    assert index.count == 1 and index.connected((1, 2), (1, 7))
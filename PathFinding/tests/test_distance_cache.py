@@ -0,0 +1,26 @@
+from pathfinding.distance_cache import DistanceCache
+from tests.boards import assert_optimal, random_cases
+
+
+def test_cached_fields_give_shortest_paths():
+    cache = DistanceCache()
+    for grid, source, target in random_cases(29, 40, costs=(1, 1, 3, 7)):
+        assert_optimal(grid, source, target, cache.search(grid, source, target).path)
+        assert_optimal(grid, target, source, cache.search(grid, target, source).path)
+
+
+def test_lookups_key_on_the_board_and_the_target():
+    grid, source, target = random_cases(30, 1, costs=(1, 3))[0]
+    cache = DistanceCache(capacity=2)
+    cache.search(grid, source, target)
+    cache.search(grid, target, target)
+    assert (cache.hits, cache.misses) == (1, 1)
+    edited = grid.copy()
+    edited.set_cell(*source, 7)
+    cache.search(edited, source, target)
+    assert cache.misses == 2
+    # a fingerprint the caller keeps is used as given
+    cache.search(grid, source, target, fingerprint='kept')
+    cache.search(grid, target, target, fingerprint='kept')
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert len(cache) == 2
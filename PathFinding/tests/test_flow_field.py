@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+from pathfinding.flow_field import FlowField
+from tests.boards import dijkstra, path_cost, random_cases
+
+
+@pytest.mark.parametrize('costs', [(1,), (1, 1, 3, 7)])
+def test_agents_follow_the_cheapest_path_to_their_nearest_goal(costs):
+    rng = random.Random(26)
+    for grid, agent, _ in random_cases(27, 40, costs=costs):
+        free = [grid.position(index) for index in range(grid.size) if grid.cells[index]]
+        goals = rng.sample(free, min(3, len(free)))
+        field = FlowField(grid, goals)
+        best = [dijkstra(grid, agent, goal) for goal in goals]
+        best = [cost for cost in best if cost is not None]
+        path = field.path_from(agent)
+        if not best:
+            assert path is None and field.distance(agent) is None
+            continue
+        assert path[0] == agent and path[-1] in goals
+        assert path[-1] == field.nearest_goal(agent)
+        assert field.distance(agent) == min(best) == path_cost(grid, path)
+        assert field.next_step(agent) == path[min(1, len(path) - 1)]
+
+
+def test_goals_must_be_free():
+    grid, source, target = random_cases(28, 1)[0]
+    wall = next(grid.position(index) for index in range(grid.size) if not grid.cells[index])
+    with pytest.raises(ValueError):
+        FlowField(grid, [source, wall])
+    with pytest.raises(ValueError):
+        FlowField(grid, [])
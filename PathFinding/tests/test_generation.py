@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from pathfinding.components import ComponentIndex  # noqa: E402
+from pathfinding.generation import GENERATORS, generate, place_endpoints, reachable  # noqa: E402
+from tests.boards import random_board  # noqa: E402
+
+
+@pytest.mark.parametrize('kind', sorted(GENERATORS))
+def test_a_seed_gives_the_same_board_and_connected_endpoints(kind):
+    for seed in range(10):
+        grid, source, target = generate(kind, 21, 34, 0.4, seed)
+        again, same_source, same_target = generate(kind, 21, 34, 0.4, seed)
+        assert bytes(again.cells) == bytes(grid.cells)
+        assert (same_source, same_target) == (source, target)
+        assert source != target
+        assert not grid.is_wall(*source) and not grid.is_wall(*target)
+        assert ComponentIndex(grid.copy()).connected(source, target)
+
+
+@pytest.mark.parametrize('kind', sorted(GENERATORS))
+def test_the_border_ring_stays_wall(kind):
+    grid = generate(kind, 12, 15, 0.3, 1)[0]
+    assert not any(grid.cells[grid.index(i, j)] for i in range(12) for j in range(15) if grid.is_border(i, j))
+
+
+def test_reachable_matches_the_component_index():
+    rng = random.Random(36)
+    for density in (0.2, 0.4, 0.6):
+        for _ in range(20):
+            grid = random_board(rng, rng.randint(3, 25), rng.randint(3, 25), density, (1, 3))
+            components = ComponentIndex(grid.copy())
+            free = [index for index in range(grid.size) if grid.cells[index]]
+            if not free:
+                continue
+            source = rng.choice(free)
+            mask = reachable(grid, source)
+            expected = [components.connected(grid.position(source), grid.position(index))
+                        for index in range(grid.size)]
+            assert mask.tolist() == expected
+
+
+def test_endpoints_need_two_free_cells():
+    grid = random_board(random.Random(37), 5, 5, 1.0)
+    with pytest.raises(ValueError):
+        place_endpoints(grid, 1)
@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+QtWidgets = pytest.importorskip('PyQt5.QtWidgets')
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from pathfinding.gui import Colors, MainWindow, Mode, MoveMode  # noqa: E402
+
+ALGORITHMS = ['UCS', 'Field', 'D* Lite', 'HPA*', 'ALT']
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def run_costs(app, window):
+    # path cost of every algorithm on the board as it is now
+    costs = {}
+    done = window.search_done
+
+    def record(grid, algorithm, src, dst, result, seconds):
+        costs[algorithm.name] = sum(grid.cells[grid.index(*position)] for position in result.path[1:])
+        done(grid, algorithm, src, dst, result, seconds)
+    window.search_done = record
+    for name in ALGORITHMS:
+        window.algorithms_combo_box.setCurrentText(name)
+        window.run_algorithm()
+        window.worker.wait()
+        app.processEvents()
+    window.search_done = done
+    return costs
+
+
+def test_player_moves_keep_terrain_and_searches_in_step(app):
+    window = MainWindow(20, 20)
+    window.move_mode = MoveMode.InAnimate
+    window.pen_color = Colors.Water
+    for i in range(1, 19):
+        if i != 5:
+            window.grid_cells_pressed(i, 10)
+    window.pen_color = Colors.Sand
+    window.grid_cells_pressed(5, 10)
+    window.pen_color = Colors.Green
+    window.grid_cells_pressed(5, 8)
+    window.pen_color = Colors.Red
+    window.grid_cells_pressed(5, 13)
+    assert len(set(run_costs(app, window).values())) == 1
+    for move in ['move_right', 'move_right', 'move_right', 'move_left', 'move_left', 'move_down', 'move_right']:
+        window.mode = Mode.User
+        getattr(window, move)()
+        window.mode = Mode.Computer
+        # every move changes two cells, so the kept fingerprint has to go
+        assert window.board_fingerprint is None
+        costs = run_costs(app, window)
+        assert len(set(costs.values())) == 1, costs
+    assert window.green_btn_position == (6, 10)
+    assert window.grid_board_colors[5][10] == Colors.Sand
+    assert window.grid_board_colors[5][11] == Colors.White
+    window.close()
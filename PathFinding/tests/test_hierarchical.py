@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from pathfinding.hierarchical import HierarchicalMap, hpa_star
+from tests.boards import dijkstra, path_cost, random_board, random_cases
+
+
+def check_path(grid, source, target, path):
+    # HPA* paths are close to the shortest, not always the shortest
+    best = dijkstra(grid, source, target)
+    if best is None:
+        assert path is None
+        return
+    assert path is not None and path[0] == source and path[-1] == target
+    assert path_cost(grid, path) >= best
+
+
+@pytest.mark.parametrize('cluster_size', [3, 5, 8])
+def test_hpa_star_finds_every_reachable_target(cluster_size):
+    for grid, source, target in random_cases(16, 60, size=(8, 30), costs=(1, 1, 3, 7)):
+        check_path(grid, source, target, hpa_star(grid, source, target, cluster_size=cluster_size).path)
+
+
+def test_edits_give_the_same_paths_as_a_fresh_map():
+    rng = random.Random(17)
+    grid = random_board(rng, 30, 30, 0.2)
+    hierarchy = HierarchicalMap(grid.copy(), 5)
+    free = [(i, j) for i in range(1, 29) for j in range(1, 29)]
+    for _ in range(30):
+        changes = [(rng.choice(free), rng.choice((0, 1, 1, 3))) for _ in range(6)]
+        for (i, j), value in changes:
+            grid.set_cell(i, j, value)
+        hierarchy.apply_changes(changes)
+        fresh = HierarchicalMap(grid.copy(), 5)
+        open_cells = [cell for cell in free if not grid.is_wall(*cell)]
+        for _ in range(5):
+            source, target = rng.sample(open_cells, 2)
+            path = hierarchy.search(source, target).path
+            check_path(grid, source, target, path)
+            assert path == fresh.search(source, target).path
@@ -0,0 +1,66 @@
+import random
+
+from pathfinding.history import EditHistory
+
+
+def edit(board, history, changes):
+    for index, code in changes:
+        history.record(index, board[index], code)
+        board[index] = code
+    history.end()
+
+
+def apply(board, changes):
+    for index, code in changes:
+        board[index] = code
+
+
+def test_undo_and_redo_round_trip():
+    rng = random.Random(18)
+    board = bytearray(rng.randrange(4) for _ in range(400))
+    history = EditHistory()
+    states = [bytes(board)]
+    for _ in range(30):
+        edit(board, history, [(rng.randrange(400), rng.randrange(4)) for _ in range(rng.randint(1, 20))])
+        if bytes(board) != states[-1]:
+            states.append(bytes(board))
+    assert len(history) == len(states) - 1
+    for state in reversed(states[:-1]):
+        apply(board, history.undo())
+        assert bytes(board) == state
+    assert history.undo() == []
+    for state in states[1:]:
+        apply(board, history.redo())
+        assert bytes(board) == state
+    assert history.redo() == []
+
+
+def test_a_cell_recorded_twice_keeps_its_first_old_code():
+    board = bytearray(4)
+    history = EditHistory()
+    edit(board, history, [(1, 2), (1, 3), (2, 0)])
+    assert len(history) == 1
+    apply(board, history.undo())
+    assert board == bytearray(4)
+
+
+def test_new_edits_drop_the_redo_steps():
+    board = bytearray(4)
+    history = EditHistory()
+    edit(board, history, [(0, 1)])
+    edit(board, history, [(1, 1)])
+    apply(board, history.undo())
+    edit(board, history, [(2, 1)])
+    assert history.redo() == []
+    assert board == bytearray((1, 0, 1, 0))
+
+
+def test_only_the_last_limit_operations_are_kept():
+    board = bytearray(10)
+    history = EditHistory(limit=3)
+    for index in range(10):
+        edit(board, history, [(index, 1)])
+    for _ in range(3):
+        apply(board, history.undo())
+    assert history.undo() == []
+    assert board == bytearray((1,) * 7 + (0,) * 3)
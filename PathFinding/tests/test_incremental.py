@@ -0,0 +1,46 @@
+import random
+
+from pathfinding.grid import Grid
+from pathfinding.incremental import DStarLite
+from tests.boards import assert_optimal, random_board
+
+
+def test_replans_match_dijkstra_after_edits():
+    rng = random.Random(12)
+    for _ in range(40):
+        grid = random_board(rng, 14, 14, 0.2, (1, 1, 3))
+        free = [(i, j) for i in range(1, 13) for j in range(1, 13)]
+        source, target = rng.sample(free, 2)
+        grid.set_cell(*source, 1)
+        grid.set_cell(*target, 1)
+        planner = DStarLite(grid.copy(), source, target)
+        planner.plan()
+        for _ in range(8):
+            changes = [(rng.choice(free), rng.choice((0, 1, 3))) for _ in range(4)]
+            changes = [(cell, value) for cell, value in changes if cell != source]
+            for (i, j), value in changes:
+                grid.set_cell(i, j, value)
+            path = planner.apply_changes(changes).path
+            if grid.is_wall(*target):
+                assert path is None
+            else:
+                assert_optimal(grid, source, target, path)
+
+
+def test_walled_target_is_unreachable():
+    grid = Grid(9, 9)
+    grid.set_cell(6, 6, 0)
+    planner = DStarLite(grid, (2, 2), (6, 6))
+    assert planner.plan().path is None
+    assert planner.apply_changes([((6, 6), 1)]).path[-1] == (6, 6)
+    sides = [((5, 6), 0), ((7, 6), 0), ((6, 5), 0), ((6, 7), 0)]
+    assert planner.apply_changes(sides).path is None
+    assert planner.apply_changes([((5, 6), 1)]).path[-1] == (6, 6)
+
+
+def test_moving_the_source():
+    grid = Grid(12, 12)
+    planner = DStarLite(grid, (1, 1), (10, 10))
+    planner.plan()
+    path = planner.move_source((5, 5)).path
+    assert path[0] == (5, 5) and path[-1] == (10, 10) and len(path) == 11
@@ -0,0 +1,21 @@
+import pytest
+
+from pathfinding.iterative import ida_star, iddfs
+from pathfinding.search import Heuristic
+from tests.boards import assert_optimal, random_cases
+
+
+def test_iddfs_matches_dijkstra():
+    for grid, source, target in random_cases(31, 40, size=(5, 12)):
+        assert_optimal(grid, source, target, iddfs(grid, source, target).path)
+
+
+@pytest.mark.parametrize('heuristic', [Heuristic.Manhattan, Heuristic.Zero])
+def test_ida_star_matches_dijkstra_on_terrain(heuristic):
+    for grid, source, target in random_cases(32, 40, size=(5, 12), costs=(1, 1, 3, 7)):
+        assert_optimal(grid, source, target, ida_star(grid, source, target, heuristic=heuristic).path)
+
+
+def test_a_small_table_still_gives_shortest_paths():
+    for grid, source, target in random_cases(33, 20, size=(5, 12), costs=(1, 3)):
+        assert_optimal(grid, source, target, ida_star(grid, source, target, table_size=4).path)
@@ -0,0 +1,22 @@
+import pytest
+
+from pathfinding.jump_point import JumpTable, jps
+from tests.boards import assert_optimal, random_cases
+
+
+def test_jps_matches_diagonal_dijkstra():
+    for grid, source, target in random_cases(7, 80):
+        assert_optimal(grid, source, target, jps(grid, source, target).path, diagonal=True)
+
+
+def test_jump_table_gives_the_same_paths():
+    for grid, source, target in random_cases(8, 40):
+        table = JumpTable(grid)
+        assert jps(grid, source, target, table=table).path == jps(grid, source, target).path
+
+
+def test_jps_refuses_terrain_costs():
+    grid, source, target = random_cases(9, 1, density=0.0)[0]
+    grid.set_cell(2, 2, 3)
+    with pytest.raises(ValueError):
+        jps(grid, source, target)
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from pathfinding.landmarks import LANDMARK_HEADER, Landmarks, alt_star, bfs_distances
+from pathfinding.search import a_star
+from tests.boards import assert_optimal, random_board, random_cases
+
+
+def test_alt_matches_dijkstra_on_terrain():
+    for grid, source, target in random_cases(19, 60, costs=(1, 1, 3, 7)):
+        assert_optimal(grid, source, target, alt_star(grid, source, target, count=4).path)
+
+
+def test_bounds_stay_admissible_after_edits():
+    rng = random.Random(20)
+    grid = random_board(rng, 24, 24, 0.2)
+    landmarks = Landmarks(grid.copy(), 4)
+    landmarks.rebuild_after = 10 ** 9
+    free = [(i, j) for i in range(1, 23) for j in range(1, 23)]
+    for _ in range(20):
+        changes = [(rng.choice(free), rng.choice((0, 1))) for _ in range(5)]
+        for (i, j), value in changes:
+            grid.set_cell(i, j, value)
+        landmarks.apply_changes(changes)
+        open_cells = [cell for cell in free if not grid.is_wall(*cell)]
+        target = grid.index(*rng.choice(open_cells))
+        exact = bfs_distances(grid, target)
+        h = landmarks.lower_bound(target)
+        for index in range(grid.size):
+            if exact[index] >= 0:
+                assert h(index) <= exact[index]
+
+
+def test_saved_tables_load_back(tmp_path):
+    grid, source, target = random_cases(21, 1, size=(20, 20))[0]
+    landmarks = Landmarks(grid, 4)
+    path = str(tmp_path / 'board.alt')
+    landmarks.save(path)
+    loaded = Landmarks.load(path, grid)
+    assert loaded.landmarks == landmarks.landmarks
+    assert [list(table) for table in loaded.tables] == [list(table) for table in landmarks.tables]
+    assert (a_star(grid, source, target, heuristic=loaded).path
+            == a_star(grid, source, target, heuristic=landmarks).path)
+
+
+def test_load_rejects_another_board(tmp_path):
+    grid = random_cases(22, 1, size=(20, 20))[0][0]
+    path = str(tmp_path / 'board.alt')
+    Landmarks(grid, 4).save(path)
+    other = grid.copy()
+    other.set_cell(*next(grid.position(index) for index in range(grid.size) if grid.cells[index]), 0)
+    with pytest.raises(ValueError, match="another board"):
+        Landmarks.load(path, other)
+    with pytest.raises(ValueError, match="another board"):
+        Landmarks.load(path, random_board(random.Random(23), 21, 20))
+
+
+def test_load_rejects_bad_files(tmp_path):
+    grid = random_cases(24, 1, size=(20, 20))[0][0]
+    path = tmp_path / 'board.alt'
+    Landmarks(grid, 4).save(str(path))
+    data = path.read_bytes()
+    path.write_bytes(data[:-4])
+    with pytest.raises(ValueError, match="truncated"):
+        Landmarks.load(str(path), grid)
+    path.write_bytes(b'XXXX' + data[4:])
+    with pytest.raises(ValueError, match="not a landmark file"):
+        Landmarks.load(str(path), grid)
+    path.write_bytes(data[:LANDMARK_HEADER.size - 1])
+    with pytest.raises(ValueError, match="not a landmark file"):
+        Landmarks.load(str(path), grid)
+
+
+def test_diagonal_moves_are_refused():
+    grid, source, target = random_cases(25, 1)[0]
+    with pytest.raises(ValueError):
+        a_star(grid, source, target, heuristic=Landmarks(grid, 2), diagonal=True)
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from pathfinding.maps import BINARY_HEADER, load_map, open_binary, parse_movingai, save_map
+from tests.boards import random_board
+
+MOVINGAI = b"type octile\nheight 2\nwidth 3\nmap\n.@S\r\nTGW\n"
+
+
+@pytest.mark.parametrize('extension', ['.txt', '.pfg'])
+def test_round_trip(tmp_path, extension):
+    grid = random_board(random.Random(13), 9, 12, 0.3, (1, 3, 7))
+    grid.set_cell(1, 1, 1)
+    grid.set_cell(7, 10, 1)
+    path = str(tmp_path / ('board' + extension))
+    save_map(path, grid, (1, 1), (7, 10))
+    loaded, source, target = load_map(path)
+    assert (loaded.width, loaded.height) == (9, 12)
+    assert bytes(loaded.cells) == bytes(grid.cells)
+    assert (source, target) == ((1, 1), (7, 10))
+
+
+def test_movingai_round_trip(tmp_path):
+    grid = parse_movingai(MOVINGAI)
+    assert (grid.width, grid.height) == (4, 5)
+    assert [grid.is_wall(1, j) for j in range(1, 4)] == [False, True, False]
+    assert [grid.is_wall(2, j) for j in range(1, 4)] == [True, False, True]
+    path = str(tmp_path / 'board.map')
+    save_map(path, grid)
+    assert bytes(load_map(path)[0].cells) == bytes(grid.cells)
+
+
+@pytest.mark.parametrize('data, message', [
+    (b"type octile\nheight 2\nwidth 3\nmap\n.@S\n.x.\n", "unknown MovingAI map character in row 1"),
+    (b"type octile\nheight 2\nwidth 3\nmap\n.@S\n", "row 1 has 0 cells"),
+    (b"type octile\nheight 2\nwidth 3\nmap\n.@\n...\n", "row 0 has 2 cells"),
+    (b"type octile\nheight 2\nwidth 3\n", "no 'map' line"),
+])
+def test_movingai_rejects_bad_maps(data, message):
+    with pytest.raises(ValueError, match=message):
+        parse_movingai(data)
+
+
+def test_binary_rejects_other_files(tmp_path):
+    path = tmp_path / 'board.pfg'
+    path.write_bytes(b'PFG')
+    with pytest.raises(ValueError, match="not a binary board"):
+        open_binary(str(path))
+    path.write_bytes(b'XXXX' + bytes(BINARY_HEADER.size))
+    with pytest.raises(ValueError, match="not a binary board"):
+        open_binary(str(path))
+
+
+def test_binary_rejects_a_header_that_does_not_match_the_cells(tmp_path):
+    path = str(tmp_path / 'board.pfg')
+    save_map(path, random_board(random.Random(14), 10, 10))
+    with open(path, 'r+b') as file:
+        file.write(BINARY_HEADER.pack(b'PFG1', 11, 10, -1, -1, -1, -1, 0))
+    with pytest.raises(ValueError, match="truncated"):
+        open_binary(path)
+
+
+def test_writable_binary_leaves_the_file_alone(tmp_path):
+    path = str(tmp_path / 'board.pfg')
+    grid = random_board(random.Random(15), 10, 10)
+    save_map(path, grid)
+    opened = open_binary(path, writable=True)[0]
+    opened.set_cell(3, 3, 9)
+    assert bytes(load_map(path)[0].cells) == bytes(grid.cells)
+
+
+@pytest.mark.parametrize('cell', [(0, 4), (9, 2), (3, 0), (6, 9)])
+def test_binary_rejects_free_border_cells(tmp_path, cell):
+    path = str(tmp_path / 'board.pfg')
+    grid = random_board(random.Random(16), 10, 10)
+    grid.cells[grid.index(*cell)] = 1
+    save_map(path, grid)
+    with pytest.raises(ValueError, match="border"):
+        open_binary(path)
@@ -0,0 +1,39 @@
+import pytest
+
+from pathfinding.search import Heuristic, a_star, bfs, bfs_levels, dfs, dfs_backtracking, ucs
+from tests.boards import assert_optimal, assert_valid, random_cases
+
+
+def test_bfs_matches_dijkstra():
+    for grid, source, target in random_cases(1, 80):
+        assert_optimal(grid, source, target, bfs(grid, source, target).path)
+
+
+def test_bfs_levels_matches_dijkstra():
+    pytest.importorskip('numpy')
+    for grid, source, target in random_cases(2, 80):
+        assert_optimal(grid, source, target, bfs_levels(grid, source, target).path)
+
+
+@pytest.mark.parametrize('search', [dfs, lambda *args: dfs(*args, compact=True), dfs_backtracking])
+def test_dfs_finds_a_path_whenever_dijkstra_does(search):
+    # depth-first paths are valid but not the shortest
+    for grid, source, target in random_cases(3, 80, costs=(1, 3)):
+        assert_valid(grid, source, target, search(grid, source, target).path)
+
+
+@pytest.mark.parametrize('heuristic', [None, Heuristic.Manhattan, Heuristic.Zero])
+def test_a_star_matches_dijkstra_on_terrain(heuristic):
+    for grid, source, target in random_cases(4, 60, costs=(1, 1, 3, 7)):
+        assert_optimal(grid, source, target, a_star(grid, source, target, heuristic=heuristic).path)
+
+
+def test_a_star_diagonal_matches_dijkstra_on_terrain():
+    for grid, source, target in random_cases(5, 60, costs=(1, 1, 3, 7)):
+        path = a_star(grid, source, target, heuristic=Heuristic.Octile, diagonal=True).path
+        assert_optimal(grid, source, target, path, diagonal=True)
+
+
+def test_ucs_matches_dijkstra_on_terrain():
+    for grid, source, target in random_cases(6, 80, costs=(1, 1, 3, 7, 255)):
+        assert_optimal(grid, source, target, ucs(grid, source, target).path)
@@ -0,0 +1,43 @@
+import asyncio
+import random
+
+import pytest
+
+from pathfinding.client import load_test
+from pathfinding.protocol import MAX_PAIRS
+from pathfinding.server import Board, PathServer
+from tests.boards import random_board
+
+
+@pytest.fixture
+def server():
+    server = PathServer(workers=1)
+    server.add(Board('arena', random_board(random.Random(38), 20, 20, 0.3)))
+    yield server
+    server.close()
+
+
+def request(server, message):
+    return asyncio.run(server.dispatch(message, 0.0))
+
+
+def test_pairs_are_connected_free_cells(server):
+    pairs = request(server, {'op': 'pairs', 'board': 'arena', 'count': 50, 'seed': 1})['pairs']
+    assert len(pairs) == 50
+    board = server.boards['arena']
+    for source, target in pairs:
+        assert board.free(source) and board.free(target) and board.components.connected(source, target)
+    assert pairs == request(server, {'op': 'pairs', 'board': 'arena', 'count': 50, 'seed': 1})['pairs']
+
+
+@pytest.mark.parametrize('count', [MAX_PAIRS + 1, -1, 'all', 2.5])
+def test_pairs_refuses_counts_out_of_range(server, count):
+    with pytest.raises(ValueError, match="count"):
+        request(server, {'op': 'pairs', 'board': 'arena', 'count': count})
+
+
+@pytest.mark.parametrize('option', ['requests', 'concurrency', 'connections'])
+def test_load_test_refuses_values_below_one(option):
+    # refused before connecting, so no server is needed
+    with pytest.raises(ValueError, match=option):
+        asyncio.run(load_test('127.0.0.1:9', 'arena', **{option: 0}))